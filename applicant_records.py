@@ -0,0 +1,143 @@
+import sys
+import threading
+from collections.abc import Mapping
+
+from fetch_applicants import BASIC_FIELDS, build_single_applicant_record
+
+
+class QuestionTable:
+    """
+    Interned question-text -> question ID table for one job.
+
+    Every record of the job stores its answers as a tuple indexed by these
+    IDs, so the (often 150+ character) question strings exist once per job
+    instead of once per record.
+    """
+
+    __slots__ = ("questions", "ids", "lock")
+
+    def __init__(self):
+        self.questions = []
+        self.ids = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.questions)
+
+    def id_for(self, question):
+        """Return the ID of a question, adding it on first sight"""
+        question_id = self.ids.get(question)
+        if question_id is None:
+            with self.lock:
+                question_id = self.ids.get(question)
+                if question_id is None:
+                    question = sys.intern(question)
+                    question_id = len(self.questions)
+                    self.questions.append(question)
+                    self.ids[question] = question_id
+        return question_id
+
+
+class QuestionRegistry:
+    """One QuestionTable per job, created on demand"""
+
+    def __init__(self):
+        self.tables = {}
+        self.lock = threading.Lock()
+
+    def for_job(self, job_key):
+        table = self.tables.get(job_key)
+        if table is None:
+            with self.lock:
+                table = self.tables.setdefault(job_key, QuestionTable())
+        return table
+
+
+def _intern_answer(value):
+    # Short answers ("yes", "no", "N/A", "2") repeat across thousands of records
+    if isinstance(value, str) and len(value) <= 64:
+        return sys.intern(value)
+    return value
+
+
+class CompactApplicantRecord(Mapping):
+    """
+    Memory-compact applicant record.
+
+    The basic candidate fields live in __slots__ and the question answers in
+    a tuple indexed by the job's QuestionTable. It is a read-only Mapping
+    with the same keys and values as build_single_applicant_record's dict
+    (questions in the order the job's table first saw them), so rule
+    functions, the rules engine and the exporter accept it unchanged; use
+    to_dict() when a mutable dict is needed.
+    """
+
+    __slots__ = BASIC_FIELDS + ("_questions", "_answers")
+
+    def __init__(self, questions, answers, **basic):
+        for field in BASIC_FIELDS:
+            setattr(self, field, _intern_answer(basic.get(field, "N/A")))
+        self._questions = questions
+        self._answers = answers
+
+    def __getitem__(self, key):
+        if key in _BASIC_FIELD_SET:
+            return getattr(self, key)
+        question_id = self._questions.ids.get(key)
+        if question_id is None or question_id >= len(self._answers):
+            raise KeyError(key)
+        answer = self._answers[question_id]
+        if answer is _UNANSWERED:
+            raise KeyError(key)
+        return answer
+
+    def __iter__(self):
+        yield from BASIC_FIELDS
+        for question_id, answer in enumerate(self._answers):
+            if answer is not _UNANSWERED:
+                yield self._questions.questions[question_id]
+
+    def __len__(self):
+        return len(BASIC_FIELDS) + sum(1 for a in self._answers if a is not _UNANSWERED)
+
+    def __repr__(self):
+        return f"CompactApplicantRecord({self.to_dict()!r})"
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+_BASIC_FIELD_SET = frozenset(BASIC_FIELDS)
+
+# Marks questions of the job that this particular record did not include
+_UNANSWERED = object()
+
+
+def compact_record(record, registry, job_key=None):
+    """
+    Convert an existing record dict (or an exported CSV row) to compact form.
+    """
+    questions = registry.for_job(job_key if job_key is not None else record.get("job_name", "N/A"))
+    answers = {}
+    for key, value in record.items():
+        if key in _BASIC_FIELD_SET:
+            continue
+        answers[questions.id_for(key)] = value
+
+    vector = [_UNANSWERED] * (max(answers) + 1 if answers else 0)
+    for question_id, answer in answers.items():
+        vector[question_id] = _intern_answer(answer)
+
+    basic = {field: record.get(field, "N/A") for field in BASIC_FIELDS}
+    return CompactApplicantRecord(questions, tuple(vector), **basic)
+
+
+def build_compact_applicant_record(application_json, registry):
+    """
+    Compact counterpart of build_single_applicant_record.
+
+    :param application_json: all_documents payload of one candidate
+    :param registry: QuestionRegistry shared by every record being held
+    :return: CompactApplicantRecord
+    """
+    return compact_record(build_single_applicant_record(application_json), registry)
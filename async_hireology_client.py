@@ -0,0 +1,432 @@
+import asyncio
+
+import httpx
+
+from hireology_client import (
+    HIREOLOGY_BASE_URL,
+    CANDIDATE_LIST_PARAMS,
+    get_next_page,
+    build_incomplete_application_email,
+    build_rejection_email,
+    build_email_form,
+)
+from email_templates import INCOMPLETE_APPLICATION_SUBJECT, REJECTION_SUBJECT
+from fetch_applicants import evaluate_application, new_screening_result
+from metrics import metrics
+from rate_limit import default_limiter, async_request_with_retry
+from screening_state import watermark_action, advance_watermark
+from status_updates import is_noop_status
+
+
+class AsyncHireologyClient:
+    """
+    asyncio version of HireologyClient built on httpx.AsyncClient.
+
+    Method names and return values mirror HireologyClient so the async
+    pipeline can reuse the same record-building and rules code. Many
+    in-flight requests share one event loop and one connection pool.
+    """
+
+    def __init__(
+        self,
+        jwt_token,
+        base_url=HIREOLOGY_BASE_URL,
+        pool_size=100,
+        timeout=30,
+        limiter=default_limiter,
+        max_retries=5,
+        document_cache=None
+    ):
+        self.jwt_token = jwt_token
+        self.base_url = base_url.rstrip("/")
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.document_cache = document_cache
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {jwt_token}",
+                "Accept": "application/json"
+            },
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size
+            )
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying httpx client and its pooled connections"""
+        await self.client.aclose()
+
+    async def request(self, method, path, **kwargs):
+        """Send a rate-limited, retried request relative to the base URL"""
+        return await async_request_with_retry(
+            self.client, method, path,
+            limiter=self.limiter, max_retries=self.max_retries,
+            retry_exceptions=(httpx.TransportError,), **kwargs
+        )
+
+    # ---------------- CANDIDATES ----------------
+
+    async def get_candidates(self, job_id, page_size=10, page=1):
+        """
+        Fetch a single page of candidates for a specific job.
+        """
+        params = dict(CANDIDATE_LIST_PARAMS, page_size=page_size, page=page)
+
+        response = await self.request("GET", f"/v2/jobs/{job_id}/candidates", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def iter_candidates(self, job_id, page_size=50, prefetch=True):
+        """
+        Async generator over every candidate of a job.
+        The next page is requested while the current one is being consumed.
+        """
+        page = 1
+        pending = asyncio.ensure_future(self.get_candidates(job_id, page_size=page_size, page=page))
+        try:
+            while pending is not None:
+                response_json = await pending
+                next_page = get_next_page(response_json, page, page_size)
+                pending = None
+                if next_page is not None:
+                    coro = self.get_candidates(job_id, page_size=page_size, page=next_page)
+                    pending = asyncio.ensure_future(coro) if prefetch else coro
+                page = next_page
+                for candidate in response_json.get("data", []):
+                    yield candidate
+        finally:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+            elif pending is not None:
+                pending.close()
+
+    async def get_candidate_documents(self, job_id, candidate_id, transfer=False):
+        """
+        Fetch all documents for a candidate.
+        Returns the parsed JSON, or None if the request failed.
+        """
+        path = f"/v2/jobs/{job_id}/candidates/{candidate_id}/documents/all_documents"
+        params = {
+            "transfer": str(transfer).lower()  # API expects true/false as string
+        }
+
+        # The cache is SQLite plus files: its calls run in worker threads
+        cached = None
+        headers = {}
+        if self.document_cache is not None:
+            cached = await asyncio.to_thread(self.document_cache.get, job_id, candidate_id, transfer)
+            if cached is not None and cached.fresh:
+                return cached.payload
+            if cached is not None:
+                headers = cached.conditional_headers()
+
+        try:
+            response = await self.request("GET", path, params=params, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                await asyncio.to_thread(self.document_cache.touch, job_id, candidate_id, transfer)
+                return cached.payload
+
+            response.raise_for_status()
+            payload = response.json()
+
+            if self.document_cache is not None:
+                await asyncio.to_thread(
+                    self.document_cache.put, job_id, candidate_id, response.content, transfer,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified")
+                )
+            return payload
+
+        except httpx.HTTPStatusError as http_err:
+            # Status and latency are in the http metrics; no response bodies in logs
+            metrics.inc("document_fetch_failures_total", reason=http_err.response.status_code)
+            print(f"HTTP Error: {http_err}")
+        except Exception as err:
+            metrics.inc("document_fetch_failures_total", reason=type(err).__name__)
+            print(f"Error: {err}")
+
+        return None
+
+    # ---------------- EMAILS ----------------
+
+    async def send_email(self, candidate_job_id, email_to, subject, body, job_id):
+        """
+        Send a custom single email through Hireology.
+        Returns the HTTP response.
+        """
+        data = build_email_form(candidate_job_id, email_to, subject, body, job_id)
+
+        return await self.request(
+            "POST", "/v2/emails/send_single_email",
+            headers={"Accept": "*/*"}, data=data
+        )
+
+    async def send_incomplete_application_email(
+        self,
+        candidate_job_id,
+        candidate_email,
+        job_id,
+        job_name,
+        incomplete_questions
+    ):
+        """
+        Send incomplete application email to candidate.
+        Returns True if successful, False otherwise.
+        """
+        email_body = build_incomplete_application_email(job_name, incomplete_questions)
+
+        try:
+            response = await self.send_email(
+                candidate_job_id,
+                candidate_email,
+                INCOMPLETE_APPLICATION_SUBJECT,
+                email_body,
+                job_id
+            )
+            return response.status_code == 200
+
+        except Exception as e:
+            print(f"❌ Email sending failed with exception: {e}")
+            return False
+
+    async def send_rejection_email(self, candidate_job_id, candidate_email, job_name, rejection_reason):
+        """
+        Send rejection email to candidate.
+        Returns True if successful, False otherwise.
+        """
+        email_body = build_rejection_email(job_name, rejection_reason)
+
+        try:
+            response = await self.send_email(
+                candidate_job_id,
+                candidate_email,
+                REJECTION_SUBJECT,
+                email_body,
+                candidate_job_id
+            )
+            return response.status_code == 200
+
+        except Exception as e:
+            print(f"❌ Rejection email sending failed with exception: {e}")
+            return False
+
+    # ---------------- STATUS ----------------
+
+    async def update_candidate_status(self, job_id, candidate_id, status):
+        """
+        Update candidate status in Hireology.
+        """
+        response = await self.request(
+            "PUT", f"/v2/jobs/{job_id}/candidates/{candidate_id}",
+            headers={"Accept": "*/*"}, json={"status": status}
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+async def screen_candidate_async(
+    client, job_id, candidate_id, applied_at=None, ledger=None, exporter=None
+):
+    """
+    Async mirror of fetch_applicants.screen_candidate. Ledger and exporter
+    calls (SQLite, file I/O) run in worker threads, off the event loop.
+    """
+    result = new_screening_result(candidate_id, applied_at)
+
+    if ledger is not None and await asyncio.to_thread(
+        ledger.has_succeeded, job_id, candidate_id, "screened"
+    ):
+        result["outcome"] = "skipped"
+        return result
+
+    held_elsewhere = []
+
+    async def perform(action, coro_func, detail=None, idempotent=False):
+        with metrics.span(action):
+            if ledger is None:
+                value = await coro_func()
+                metrics.inc("side_effects_total", action=action, result="ok" if value else "failed")
+                return value
+            performed, value = await ledger.run_once_async(
+                job_id, candidate_id, action, coro_func,
+                detail=detail, candidate_job_id=result["candidate_job_id"], idempotent=idempotent
+            )
+        if not performed:
+            result["skipped_actions"].append(action)
+            if value is None:
+                held_elsewhere.append(action)
+        metrics.inc(
+            "side_effects_total", action=action,
+            result="skipped" if not performed else ("ok" if value else "failed")
+        )
+        return value
+
+    async def update_status(final_status):
+        response = await client.update_candidate_status(job_id, candidate_id, final_status)
+        return response is not None
+
+    try:
+        with metrics.span("fetch_documents"):
+            documents = await client.get_candidate_documents(job_id, candidate_id, transfer=False)
+        if not documents:
+            result["outcome"] = "error"
+            result["error"] = "Failed to fetch documents"
+            return result
+
+        with metrics.span("evaluate"):
+            evaluation = evaluate_application(documents, job_id)
+        applicant_record = evaluation["record"]
+        candidate_job_id = evaluation["candidate_job_id"]
+        result["candidate_job_id"] = candidate_job_id
+        result["applied_at"] = result["applied_at"] or applicant_record["applied_at"]
+        if exporter is not None:
+            await asyncio.to_thread(exporter.write, applicant_record)
+
+        if evaluation["incomplete_questions"]:
+            result["outcome"] = "incomplete"
+            result["incomplete_questions"] = evaluation["incomplete_questions"]
+            result["email_sent"] = await perform(
+                "incomplete_email",
+                lambda: client.send_incomplete_application_email(
+                    candidate_job_id=candidate_job_id,
+                    candidate_email=applicant_record["email"],
+                    job_id=job_id,
+                    job_name=applicant_record["job_name"],
+                    incomplete_questions=evaluation["incomplete_questions"]
+                )
+            )
+        else:
+            final_status = evaluation["final_status"]
+            result["outcome"] = final_status
+
+            if final_status == "Inactive":
+                result["rejection_reason"] = evaluation["rejection_reason"]
+                result["email_sent"] = await perform(
+                    "rejection_email",
+                    lambda: client.send_rejection_email(
+                        candidate_job_id=candidate_job_id,
+                        candidate_email=applicant_record["email"],
+                        job_name=applicant_record["job_name"],
+                        rejection_reason=evaluation["rejection_reason"]
+                    )
+                )
+
+            if is_noop_status(applicant_record["status"], final_status):
+                result["status_updated"] = True
+                result["skipped_actions"].append("status_update")
+            else:
+                result["status_updated"] = bool(await perform(
+                    "status_update",
+                    lambda: update_status(final_status),
+                    detail=final_status,
+                    idempotent=True
+                ))
+
+    except Exception as e:
+        result["outcome"] = result["outcome"] or "error"
+        result["error"] = str(e)
+
+    # Only a final decision marks the candidate as screened (see screen_candidate)
+    if (
+        ledger is not None
+        and result["outcome"] in ("Candidate", "Inactive")
+        and not result["error"]
+        and not held_elsewhere
+        and result["email_sent"] is not False
+    ):
+        await asyncio.to_thread(
+            ledger.record, job_id, candidate_id, "screened", True,
+            detail=result["outcome"], candidate_job_id=result["candidate_job_id"]
+        )
+
+    metrics.inc("candidates_total", outcome=result["outcome"] if not result["error"] else "error")
+    return result
+
+
+async def screen_job_async(client, job_id, semaphore, page_size=50, state=None, exporter=None):
+    """
+    Screen every applicant of a job on the event loop.
+
+    The semaphore bounds how many candidates are in flight; share one
+    semaphore across jobs to bound the total. A ScreeningState makes the
+    run incremental and guards side effects, as in fetch_applicants.screen_job.
+    """
+    async def bounded(candidate):
+        async with semaphore:
+            return await screen_candidate_async(
+                client, job_id, candidate["id"], candidate.get("applied_at"), state, exporter
+            )
+
+    watermark = await asyncio.to_thread(state.get_watermark, job_id) if state is not None else None
+
+    # List every candidate before screening changes any status (see screen_job)
+    candidates = []
+    async for candidate in client.iter_candidates(job_id, page_size=page_size):
+        action = watermark_action(candidate, watermark)
+        if action == "stop":
+            break
+        if action == "screen":
+            candidates.append(candidate)
+
+    results = await asyncio.gather(*(bounded(candidate) for candidate in candidates))
+
+    if state is not None:
+        await asyncio.to_thread(state.set_watermark, job_id, advance_watermark(watermark, results))
+
+    return results
+
+
+async def screen_jobs_async(
+    jwt_token, job_ids, concurrency=100, page_size=50, client=None, state=None, exporter=None
+):
+    """
+    Screen several jobs at once with at most `concurrency` candidates in flight.
+
+    :param jwt_token: JWT access token (string)
+    :param job_ids: Iterable of job IDs
+    :param concurrency: Maximum number of candidates processed concurrently
+    :param page_size: Page size used when listing candidates
+    :param client: Optional AsyncHireologyClient; one sized to concurrency is created otherwise
+    :param state: Optional ScreeningState enabling incremental mode
+    :param exporter: Optional RecordExporter receiving every built record
+    :return: dict of job_id -> list of per-candidate result dicts
+    """
+    owns_client = client is None
+    if owns_client:
+        client = AsyncHireologyClient(jwt_token, pool_size=concurrency)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    job_ids = list(job_ids)
+
+    try:
+        all_results = await asyncio.gather(*(
+            screen_job_async(
+                client, job_id, semaphore, page_size=page_size, state=state, exporter=exporter
+            )
+            for job_id in job_ids
+        ))
+    finally:
+        if owns_client:
+            await client.close()
+
+    return dict(zip(job_ids, all_results))
+
+
+def run_screening(jwt_token, job_ids, concurrency=100, page_size=50, state=None):
+    """
+    Synchronous entry point for screen_jobs_async.
+    """
+    return asyncio.run(
+        screen_jobs_async(
+            jwt_token, job_ids, concurrency=concurrency, page_size=page_size, state=state
+        )
+    )
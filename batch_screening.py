@@ -0,0 +1,200 @@
+import os
+import re
+from collections.abc import Mapping
+
+import pandas as pd
+
+from fetch_applicants import BASIC_FIELDS
+from question_index import get_question_index
+from record_export import read_parquet_export
+from screening_rules import (
+    CAREGIVER_KEYWORD_PATTERN,
+    compile_keyword_pattern,
+    get_rule_engine,
+)
+
+
+MISSING_VALUES = ("N/A", "")
+
+
+def load_applicant_frame(sources):
+    """
+    Load applicant records into one DataFrame.
+
+    :param sources: list of records (build_single_applicant_record dicts or
+                    CompactApplicantRecords), or paths to CSV / Parquet exports
+    :return: DataFrame with one row per applicant and one column per field.
+             Questions a row's job never asked are NaN; unanswered ones are "N/A".
+    """
+    if not sources:
+        return pd.DataFrame(columns=list(BASIC_FIELDS))
+
+    if isinstance(sources[0], Mapping):
+        return pd.DataFrame.from_records(
+            [r if isinstance(r, dict) else dict(r) for r in sources]
+        )
+
+    frames = []
+    for path in sources:
+        if str(path).endswith(".parquet"):
+            if os.path.isdir(path):
+                # RecordExporter output: part files with widening schemas
+                frames.append(read_parquet_export(path).to_pandas())
+            else:
+                frames.append(pd.read_parquet(path))
+        else:
+            frames.append(_read_csv_export(path))
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+
+def _read_csv_export(path):
+    """
+    CSV export as strings. Built records never hold "", so an empty question
+    cell is a question the row's job never asked (RecordExporter pads those
+    with ""): it becomes NaN, as in record and Parquet sources.
+    """
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    questions = _question_columns(df)
+    df[questions] = df[questions].replace("", float("nan"))
+    return df
+
+
+def _question_columns(df):
+    basic = set(BASIC_FIELDS)
+    return [c for c in df.columns if c not in basic]
+
+
+def _text_column(df, questions):
+    """Answer text for one or more questions, "" where the column is absent"""
+    result = None
+    for question in questions:
+        if question in df.columns:
+            column = df[question].fillna("").astype(str)
+        else:
+            column = pd.Series("", index=df.index)
+        result = column if result is None else result + " " + column
+    return result
+
+
+def parse_years_column(column):
+    """Vectorized parse_years: first integer in each answer, 0 if none"""
+    return (
+        column.astype(str)
+        .str.extract(r"(\d+)", expand=False)
+        .fillna(0)
+        .astype(int)
+    )
+
+
+def _without_groups(pattern):
+    # pandas str.contains warns about (and ignores) capture groups
+    return re.compile(pattern.pattern.replace("(?P<keyword>", "(?:"), pattern.flags)
+
+
+def _vectorized_check(rule, parsed):
+    check, value = rule["check"], rule.get("value")
+    if check == "min":
+        return parsed >= value
+    if check == "equals":
+        return parsed == str(value).strip().lower()
+    if check == "keywords":
+        pattern = CAREGIVER_KEYWORD_PATTERN if value is None else compile_keyword_pattern(value)
+        pattern = _without_groups(pattern)
+        return parsed.str.strip().ne("") & parsed.str.contains(pattern, na=False)
+    raise ValueError(f"Unknown check: {check}")
+
+
+def _vectorized_parse(rule, text):
+    parser = rule["parser"]
+    if parser == "years":
+        return parse_years_column(text)
+    if parser == "yes_no":
+        return text.str.strip().str.lower()
+    return text
+
+
+def completeness_columns(df, job_id=None):
+    """
+    Vectorized get_incomplete_questions: number of unanswered questions per
+    row, plus each answered question's validator (e.g. supervisor references).
+    """
+    index = get_question_index()
+    missing_count = pd.Series(0, index=df.index)
+    for column in _question_columns(df):
+        missing_count += df[column].isin(MISSING_VALUES).astype(int)
+
+    for column in _question_columns(df):
+        validator = index.validator_for(column, job_id)
+        if validator is None:
+            continue
+        answered = df[column].notna() & ~df[column].isin(MISSING_VALUES)
+        # Validators are not expressible as column ops; each one runs once
+        # per distinct answer of its column
+        answers = df.loc[answered, column]
+        validity = {text: not validator(text) for text in answers.unique()}
+        invalid = ~answers.map(validity).astype(bool)
+        missing_count += invalid.reindex(df.index, fill_value=False).astype(int)
+
+    return missing_count
+
+
+def screen_frame(df, job_id=None, engine=None):
+    """
+    Evaluate the screening rules on every row of df with column operations.
+
+    Adds these columns to a copy of df:
+      incomplete_count    unanswered / invalid questions (get_incomplete_questions)
+      incomplete          incomplete_count > 0
+      pass_<rule name>    one boolean column per rule
+      years_experience    parsed experience, when a "years" rule exists
+      caregiver_keywords  whether the keyword rule matched, when it exists
+      status              "Candidate" / "Inactive" (decide_candidate_status)
+      rejection_reason    same text as get_rejection_reason, "" for Candidates
+      outcome             "incomplete" or the status, as in the pipeline
+
+    :param df: DataFrame from load_applicant_frame
+    :param job_id: Job whose rule overrides apply (None for the defaults)
+    :param engine: RuleEngine; defaults to the process-wide engine
+    """
+    engine = engine or get_rule_engine()
+    rules = engine.for_job(job_id).rules
+    out = df.copy()
+
+    out["incomplete_count"] = completeness_columns(df, job_id)
+    out["incomplete"] = out["incomplete_count"] > 0
+
+    parsed_cache = {}
+    all_passed = pd.Series(True, index=df.index)
+    reasons = pd.Series("", index=df.index)
+
+    for rule in rules:
+        key = (tuple(rule["questions"]), rule["parser"])
+        if key not in parsed_cache:
+            parsed_cache[key] = _vectorized_parse(rule, _text_column(df, rule["questions"]))
+        parsed = parsed_cache[key]
+
+        passed = _vectorized_check(rule, parsed).fillna(False).astype(bool)
+        out[f"pass_{rule['name']}"] = passed
+        if rule["parser"] == "years":
+            out["years_experience"] = parsed
+        if rule["check"] == "keywords":
+            out["caregiver_keywords"] = passed
+
+        all_passed &= passed
+        separator = reasons.ne("").map({True: "; ", False: ""})
+        reasons = reasons.where(passed, reasons + separator + rule["reason"])
+
+    out["status"] = all_passed.map({True: "Candidate", False: "Inactive"})
+    out["rejection_reason"] = reasons
+    out["outcome"] = out["status"].where(~out["incomplete"], "incomplete")
+    return out
+
+
+def backtest(sources, job_id=None, engine=None):
+    """
+    Re-score historical applicant exports and summarize the outcomes.
+
+    Returns (scored DataFrame, outcome counts Series).
+    """
+    scored = screen_frame(load_applicant_frame(sources), job_id=job_id, engine=engine)
+    return scored, scored["outcome"].value_counts()
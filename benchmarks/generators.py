@@ -0,0 +1,107 @@
+"""
+Synthetic, seeded inputs for the benchmarks: Hireology all_documents
+payloads and Voice AI call transcripts of configurable size.
+"""
+import random
+
+from screening_rules import (
+    CAREGIVER_DESCRIPTION_QUESTION,
+    CRIMINAL_RECORD_QUESTION,
+    DRIVERS_LICENSE_QUESTION,
+    DRUG_SCREEN_QUESTION,
+    EXPERIENCE_QUESTION,
+    SUPERVISOR_QUESTION,
+)
+
+
+SCREENED_ANSWERS = {
+    EXPERIENCE_QUESTION: ["0", "1", "2", "3 years", "5", "10+"],
+    DRIVERS_LICENSE_QUESTION: ["yes", "no"],
+    DRUG_SCREEN_QUESTION: ["yes", "no"],
+    CRIMINAL_RECORD_QUESTION: ["no", "yes"],
+    SUPERVISOR_QUESTION: [
+        "John Doe 843-555-0101, Jane Roe 843-555-0102",
+        "Mr. Smith +16135189745 Mr. Ali +16135189745",
+        "N/A",
+    ],
+}
+
+WORDS = (
+    "i have worked as a caregiver in home care and assisted living helping clients "
+    "with bathing dressing feeding medication reminders mobility and companionship "
+    "for several years at a local agency and also at a hospital on weekends"
+).split()
+
+BOT_QUESTIONS = [
+    "Can you tell me a little about your background and experience as a care professional?",
+    "Do you have any certifications or specialized training such as CNA, MA, CPR, or others?",
+    "Do you have experience with tasks such as bathing, dressing, and toileting clients?",
+    "Do you currently have another job? What is your general availability?",
+    "How many years of caregiving experience do you have?",
+    "Do you have a valid driver's license and reliable transportation?",
+]
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def make_application_documents(questions=20, answer_words=12, seed=0):
+    """
+    all_documents payload of one candidate with the screened questions plus
+    enough filler questions to reach the requested count.
+    """
+    rng = random.Random(seed)
+    answers = {question: rng.choice(pool) for question, pool in SCREENED_ANSWERS.items()}
+    answers[CAREGIVER_DESCRIPTION_QUESTION] = _text(rng, answer_words)
+    for i in range(max(0, questions - len(answers))):
+        answers[f"Additional screening question number {i}: please describe your answer in detail."] = (
+            "" if rng.random() < 0.05 else _text(rng, answer_words)
+        )
+
+    return [{
+        "id": 500000000 + seed,
+        "job_name": "Caregiver (benchmark)",
+        "candidate": {
+            "id": 47000000 + seed,
+            "first_name": "Bench",
+            "last_name": f"Mark{seed}",
+            "email": f"bench{seed}@example.com",
+            "phone_number": "+18435550100",
+            "street_address": "1 Main St",
+            "city": "Beaufort",
+            "state": "SC",
+            "zip_code": "29906",
+            "status": "Applicant",
+            "applied_at": "2025-12-20T13:44:52.675Z",
+        },
+        "application": {
+            "application_form_data": {
+                "custom_answers": {q: {"answer": a} for q, a in answers.items()}
+            }
+        },
+    }]
+
+
+def make_transcript(turns=10, fragment_rate=0.3, seed=0):
+    """
+    Voice AI transcript with the given number of question/answer turns.
+    A fraction of the turns is split into interleaved fragments, as the
+    real speech-to-text output does when speakers talk over each other.
+    """
+    rng = random.Random(seed)
+    lines = ["bot:Hi! This is the Hiring assistant.", "Ready to begin?", "human:Yes."]
+    for i in range(turns):
+        question = BOT_QUESTIONS[i % len(BOT_QUESTIONS)]
+        lines.append(f"bot:Got it.Next question: {question}")
+        answer = _text(rng, rng.randint(3, 20))
+        if rng.random() < fragment_rate:
+            cut = len(answer) // 2
+            lines.append(f"human:{answer[:cut]}")
+            lines.append("bot:Alright, so you ")
+            lines.append(f"human:{answer[cut:]}")
+        else:
+            lines.append(f"human:{answer}")
+    lines.append("bot:That wraps up the questions! Thank you.")
+    lines.append("human:Okay.")
+    return "\n".join(lines) + "\n"
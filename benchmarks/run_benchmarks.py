@@ -0,0 +1,246 @@
+"""
+Benchmarks for the screening and transcript hot paths.
+
+    python benchmarks/run_benchmarks.py                 # run all, save results
+    python benchmarks/run_benchmarks.py --quick -k transcript
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/baseline.json
+
+Each micro-benchmark is timed with timeit (best of --repeat runs); the
+pipeline benchmark screens a job end to end against mock_api_server.py.
+Results are written to benchmarks/results/<timestamp>-<commit>.json and
+compared with the previous results file (or --compare), flagging anything
+slower than --threshold.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, HERE)
+
+from generators import BOT_QUESTIONS, make_application_documents, make_transcript  # noqa: E402
+
+import fetch_applicants  # noqa: E402
+from fetch_calls import VoiceAIExtractor  # noqa: E402
+
+
+RESULTS_DIR = os.path.join(HERE, "results")
+
+BENCHMARKS = []
+
+
+def benchmark(name, sizes):
+    """Register func(size) -> callable as one benchmark per size"""
+    def register(func):
+        for size in sizes:
+            BENCHMARKS.append((f"{name}[{size}]", func, size))
+        return func
+    return register
+
+
+# ---------------- MICRO BENCHMARKS ----------------
+
+@benchmark("build_single_applicant_record", sizes=(20, 200))
+def bench_build_record(questions):
+    documents = make_application_documents(questions=questions)
+    return lambda: fetch_applicants.build_single_applicant_record(documents)
+
+
+@benchmark("get_incomplete_questions", sizes=(20, 200))
+def bench_incomplete_questions(questions):
+    record = fetch_applicants.build_single_applicant_record(
+        make_application_documents(questions=questions)
+    )
+    return lambda: fetch_applicants.get_incomplete_questions(record)
+
+
+@benchmark("evaluate_caregiver_experience", sizes=(10, 500))
+def bench_caregiver_experience(answer_words):
+    record = fetch_applicants.build_single_applicant_record(
+        make_application_documents(answer_words=answer_words)
+    )
+    return lambda: fetch_applicants.evaluate_caregiver_experience(record)
+
+
+@benchmark("decide_candidate_status", sizes=(20, 200))
+def bench_decide_status(questions):
+    record = fetch_applicants.build_single_applicant_record(
+        make_application_documents(questions=questions)
+    )
+    return lambda: fetch_applicants.decide_candidate_status(record)
+
+
+@benchmark("parse_transcript", sizes=(10, 100, 1000))
+def bench_parse_transcript(turns):
+    extractor = VoiceAIExtractor("benchmark", "benchmark")
+    transcript = make_transcript(turns=turns)
+    return lambda: extractor.parse_transcript(transcript)
+
+
+@benchmark("answer_matrix", sizes=(100, 1000))
+def bench_answer_matrix(calls):
+    from interview_questions import InterviewQuestionIndex, answer_matrix
+    index = InterviewQuestionIndex()
+    call_logs = [
+        {"id": f"call-{i}", "transcript": make_transcript(turns=len(BOT_QUESTIONS), seed=i)}
+        for i in range(calls)
+    ]
+    return lambda: answer_matrix(call_logs, index=index)
+
+
+@benchmark("extract_call_records", sizes=(100, 1000))
+def bench_extract_call_records(calls):
+    from call_records import CallRecordExtractor
+    call_logs = [
+        {"id": f"call-{i}", "transcript": make_transcript(turns=len(BOT_QUESTIONS), seed=i)}
+        for i in range(calls)
+    ]
+    return lambda: list(CallRecordExtractor().extract_many(call_logs))
+
+
+def time_micro(func, size, repeat, min_time):
+    target = func(size)
+    timer = timeit.Timer(target)
+    number, _ = timer.autorange()
+    # autorange aims at 0.2s; scale to the requested minimum per run
+    number = max(1, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"seconds_per_call": best, "calls_per_second": 1 / best if best else None, "number": number}
+
+
+# ---------------- PIPELINE BENCHMARK ----------------
+
+def time_pipeline(candidates, latency, max_workers):
+    """Screen one mock job end to end; returns candidates per second"""
+    import contextlib
+    import io
+    import tempfile
+
+    from email_outbox import EmailOutbox
+    from hireology_client import HireologyClient
+    from mock_api_server import start_mock_server
+
+    server = start_mock_server(candidates_per_job=candidates, latency=latency)
+    try:
+        with tempfile.TemporaryDirectory() as tmp, \
+                HireologyClient("benchmark", base_url=server.url, pool_size=4 * max_workers,
+                                limiter=None) as client:
+            outbox = EmailOutbox(os.path.join(tmp, "outbox.sqlite3"))
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):  # per-candidate progress lines
+                results = fetch_applicants.screen_job(
+                    "benchmark", "bench-job", max_workers=max_workers, client=client, outbox=outbox
+                )
+            elapsed = time.perf_counter() - start
+            outbox.close()
+    finally:
+        server.shutdown()
+    return {
+        "seconds": elapsed,
+        "candidates": len(results),
+        "candidates_per_second": len(results) / elapsed if elapsed else None,
+    }
+
+
+# ---------------- RESULTS ----------------
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def latest_results(exclude=None):
+    paths = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")))
+    paths = [p for p in paths if p != exclude and not p.endswith("baseline.json")]
+    return paths[-1] if paths else None
+
+
+def compare(current, previous, threshold):
+    """Print the change of every benchmark against a previous results file"""
+    print(f"\n📈 Compared with {previous['commit']} ({previous['timestamp']}):")
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        old = previous["benchmarks"].get(name)
+        if old is None:
+            continue
+        key = "seconds_per_call" if "seconds_per_call" in result else "seconds"
+        if not old.get(key):
+            continue
+        change = result[key] / old[key] - 1
+        flag = "❌" if change > threshold else ("✅" if change < -threshold else "  ")
+        print(f"   {flag} {name:<45} {change:+7.1%}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="fewer repeats, smaller pipeline run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-pipeline", action="store_true", help="skip the mock-API pipeline run")
+    parser.add_argument("--compare", help="results file to compare with (default: previous run)")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown flagged as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="also write results/baseline.json")
+    args = parser.parse_args()
+
+    repeat = 3 if args.quick else args.repeat
+    min_time = 0.05 if args.quick else 0.2
+
+    results = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "benchmarks": {},
+    }
+
+    for name, func, size in BENCHMARKS:
+        if args.filter and args.filter not in name:
+            continue
+        result = time_micro(func, size, repeat, min_time)
+        results["benchmarks"][name] = result
+        print(f"⏱️  {name:<45} {result['seconds_per_call'] * 1e6:12.1f} µs")
+
+    if not args.no_pipeline and (not args.filter or args.filter in "pipeline"):
+        candidates = 100 if args.quick else 500
+        name = f"pipeline[{candidates} candidates, 10ms latency]"
+        result = time_pipeline(candidates, latency=0.01, max_workers=16)
+        results["benchmarks"][name] = result
+        print(f"⏱️  {name:<45} {result['candidates_per_second']:12.1f} candidates/s")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d_%H%M%S}-{results['commit']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✅ Results saved to: {path}")
+    if args.save_baseline:
+        with open(os.path.join(RESULTS_DIR, "baseline.json"), "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    previous_path = args.compare or latest_results(exclude=path)
+    if previous_path:
+        with open(previous_path, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) slower than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
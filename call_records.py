@@ -0,0 +1,370 @@
+import functools
+import glob
+import json
+import re
+
+from fetch_applicants import BASIC_FIELDS
+from interview_questions import get_interview_index
+from screening_rules import (
+    CAREGIVER_DESCRIPTION_QUESTION,
+    DRIVERS_LICENSE_QUESTION,
+    EXPERIENCE_QUESTION,
+)
+from transcripts import segment_transcript
+
+
+# Record fields describing the call itself
+CALL_FIELDS = ("call_id", "contact_id", "call_date", "call_duration")
+
+# Distinct (parser, answer) pairs a CallRecordExtractor keeps parsed
+PARSE_CACHE_SIZE = 4096
+
+
+# ---------------- SPOKEN NUMBERS ----------------
+
+NUMBER_WORDS = {
+    "zero": 0, "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "thirteen": 13, "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
+    "eighteen": 18, "nineteen": 19, "couple": 2, "a couple": 2, "a couple of": 2,
+}
+TENS_WORDS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+
+_UNITS = "|".join(w for w in NUMBER_WORDS if w.isalpha() and NUMBER_WORDS[w] < 10 and w not in ("a", "an"))
+_NUMBER = (
+    r"(?P<number>\d+(?:\.\d+)?"
+    rf"|(?:{'|'.join(TENS_WORDS)})(?:[\s-](?:{_UNITS}))?"
+    rf"|{'|'.join(sorted(NUMBER_WORDS, key=len, reverse=True))})"
+)
+
+# "two years", "one and a half years", "6 months", "10+ years"
+_DURATION = re.compile(
+    rf"(?<![\w']){_NUMBER}\+?\s+(?:and\s+a\s+half\s+)?(?P<unit>years?|yrs?|months?|weeks?|days?)\b",
+    re.IGNORECASE,
+)
+_BARE_NUMBER = re.compile(rf"(?<![\w']){_NUMBER}(?![\w'])", re.IGNORECASE)
+
+_UNIT_DAYS = {"y": 365, "m": 30, "w": 7, "d": 1}
+
+
+def spoken_number(text):
+    """"two" -> 2, "twenty-five" -> 25, "3" -> 3, "a couple" -> 2; None if not a number"""
+    text = text.strip().lower()
+    if text[:1].isdigit():
+        return float(text) if "." in text else int(text)
+    if text in NUMBER_WORDS:
+        return NUMBER_WORDS[text]
+    tens, _, units = text.replace("-", " ").partition(" ")
+    if tens in TENS_WORDS:
+        return TENS_WORDS[tens] + NUMBER_WORDS.get(units, 0)
+    return None
+
+
+def _durations(text):
+    """Every "<number> <unit>" in text as (number, unit initial)"""
+    for match in _DURATION.finditer(text):
+        yield spoken_number(match.group("number")), match.group("unit")[0].lower()
+
+
+# ---------------- PARSERS ----------------
+
+def parse_years_experience(value):
+    """
+    Whole years of experience in an answer to the experience question:
+    "experience of one year" -> 1, "Two." -> 2, "18 months" -> 1.
+    None when the answer holds no number.
+    """
+    for number, unit in _durations(value):
+        if unit == "y":
+            return int(number)
+        if unit == "m":
+            return int(number // 12)
+    match = _BARE_NUMBER.search(value)
+    if match and match.group("number").lower() not in ("a", "an"):
+        return int(spoken_number(match.group("number")))
+    return None
+
+
+def parse_years_mentioned(value):
+    """Like parse_years_experience, but only for an explicit "N years" / "N months" """
+    for number, unit in _durations(value):
+        if unit == "y":
+            return int(number)
+        if unit == "m":
+            return int(number // 12)
+    return None
+
+
+# First decisive word of an answer; "Yes. I don't have a car" is a yes.
+# "I do" / "I have" / "I am" / "I can" only say yes when no negation follows
+# ("I do not have a car", "I am not comfortable with that").
+_YES_NO = re.compile(
+    r"(?<![\w'])(?:(?P<yes>yes|yeah|yep|yup|sure|correct|absolutely|definitely|of course"
+    r"|(?:i do|i have|i am|i can)(?!\s+(?:not|no|never)(?![\w'])))"
+    r"|(?P<no>no|nope|nah|not|never|don't|do not|haven't|have not|can't|cannot|i'm not))(?![\w'])",
+    re.IGNORECASE,
+)
+
+
+def parse_yes_no_answer(value):
+    """"yes" / "no" for a spoken yes/no answer, None when it is neither"""
+    match = _YES_NO.search(value.replace("’", "'"))
+    if match is None:
+        return None
+    return "yes" if match.group("yes") else "no"
+
+
+# Canonical certification -> spoken forms
+CERTIFICATIONS = {
+    "CNA": ("cna", "certified nursing assistant", "nursing assistant", "certified nurse aide"),
+    "RN": ("rn", "registered nurse"),
+    "LPN": ("lpn", "licensed practical nurse"),
+    "LVN": ("lvn", "licensed vocational nurse"),
+    "RNA": ("rna", "restorative nursing assistant"),
+    "HHA": ("hha", "home health aide"),
+    "PCA": ("pca", "personal care aide", "personal care assistant"),
+    "CMA": ("cma", "certified medication aide", "medication aide"),
+    "MA": ("ma", "medical assistant"),
+    "CPR": ("cpr",),
+    "BLS": ("bls", "basic life support"),
+    "First Aid": ("first aid",),
+}
+_CERTIFICATION_NAMES = {form: name for name, forms in CERTIFICATIONS.items() for form in forms}
+_CERTIFICATION_PATTERN = re.compile(
+    r"(?<![\w'])(?P<certification>"
+    + "|".join(re.escape(f) for f in sorted(_CERTIFICATION_NAMES, key=len, reverse=True))
+    + r")s?(?![\w'])",
+    re.IGNORECASE,
+)
+
+
+def extract_certifications(value):
+    """Set of canonical certifications mentioned in an answer ("CNA also. RN." -> {"CNA", "RN"})"""
+    return {
+        _CERTIFICATION_NAMES[m.group("certification").lower()]
+        for m in _CERTIFICATION_PATTERN.finditer(value)
+    }
+
+
+def parse_certifications(value):
+    """Certifications as the record stores them: "CNA, RN", None when there are none"""
+    found = extract_certifications(value)
+    return ", ".join(sorted(found)) if found else None
+
+
+_AVAILABLE_NOW = re.compile(
+    r"(?<![\w'])(?:immediately|right away|right now|asap|as soon as possible|today|anytime|any time)(?![\w'])",
+    re.IGNORECASE,
+)
+_AVAILABLE_NEXT = re.compile(r"(?<![\w'])(?:(?P<tomorrow>tomorrow)|next (?P<unit>week|month))(?![\w'])", re.IGNORECASE)
+
+
+def parse_available_in_days(value):
+    """
+    Days until the candidate can start: "after one month" -> 30,
+    "in two weeks" -> 14, "immediately" -> 0. None when no start is given.
+    """
+    for number, unit in _durations(value):
+        return int(number * _UNIT_DAYS[unit])
+    match = _AVAILABLE_NEXT.search(value)
+    if match:
+        return 1 if match.group("tomorrow") else _UNIT_DAYS[match.group("unit")[0].lower()]
+    if _AVAILABLE_NOW.search(value):
+        return 0
+    return None
+
+
+def parse_answer_text(value):
+    return value.strip() or None
+
+
+PARSERS = {
+    "years": parse_years_experience,
+    "years_mentioned": parse_years_mentioned,
+    "yes_no": parse_yes_no_answer,
+    "certifications": parse_certifications,
+    "available_in_days": parse_available_in_days,
+    "text": parse_answer_text,
+}
+
+
+# ---------------- FIELD MAP ----------------
+
+# Interview question ID -> [(record field, parser, fallback)]. A fallback
+# only fills a field no primary extractor (or extractedData) has set, e.g.
+# years of experience mentioned while describing the background. "text"
+# fields collect the answers of every question that feeds them.
+FIELD_EXTRACTORS = {
+    "years_experience": [(EXPERIENCE_QUESTION, "years", False)],
+    "background": [
+        (CAREGIVER_DESCRIPTION_QUESTION, "text", False),
+        (EXPERIENCE_QUESTION, "years_mentioned", True),
+        ("certifications", "certifications", True),
+    ],
+    "caregiving_tasks": [(CAREGIVER_DESCRIPTION_QUESTION, "text", False)],
+    "personal_care": [
+        ("personal_care", "yes_no", False),
+        (CAREGIVER_DESCRIPTION_QUESTION, "text", False),
+        (EXPERIENCE_QUESTION, "years_mentioned", True),
+    ],
+    "certifications": [
+        ("certifications", "certifications", False),
+        (CAREGIVER_DESCRIPTION_QUESTION, "text", False),
+    ],
+    "availability": [
+        ("has_other_job", "yes_no", False),
+        ("available_in_days", "available_in_days", False),
+    ],
+    "schedule_flexibility": [("schedule_flexibility", "yes_no", False)],
+    "transportation": [("transportation", "yes_no", False)],
+    "drivers_license": [(DRIVERS_LICENSE_QUESTION, "yes_no", False)],
+    "why_agency": [("why_agency", "text", False)],
+    "motivation": [("motivation", "text", False)],
+    "hoyer_lift": [("hoyer_lift", "yes_no", False)],
+    "gait_belt": [("gait_belt", "yes_no", False)],
+    "hospice": [("hospice", "yes_no", False)],
+}
+
+_CAMEL_CASE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
+def _extracted_data_question(key):
+    """"yearsOfExperience" / "years_of_experience" -> "years of experience" """
+    return _CAMEL_CASE.sub(" ", str(key)).replace("_", " ")
+
+
+def _extracted_data_text(value):
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def _apply_parser(parser, value):
+    return parser(value)
+
+
+class CallRecordExtractor:
+    """
+    Turns Voice AI call logs into screening records.
+
+    A call's transcript is segmented (transcripts.segment_transcript), each
+    question is mapped to its interview question ID and the answer is
+    parsed into the typed fields of FIELD_EXTRACTORS: years of experience,
+    certifications, yes/no answers, days until the candidate can start.
+    Typed values in the call's extractedData (keys matched to question IDs
+    the same way) take precedence over the transcript.
+
+    The record has the shape of build_single_applicant_record: the basic
+    fields ("N/A" except phone_number) plus the form questions the rules
+    read (EXPERIENCE_QUESTION, DRIVERS_LICENSE_QUESTION,
+    CAREGIVER_DESCRIPTION_QUESTION), so the rule engine screens it as is.
+    Questions the interview did not answer are left out.
+
+    The field map is resolved into parser functions once, and the last
+    parse_cache_size distinct answers are kept parsed, so the short answers
+    that repeat across an archive ("Yes.", "Two years.") are parsed once.
+    """
+
+    def __init__(self, index=None, field_extractors=None, parse_cache_size=PARSE_CACHE_SIZE):
+        self.index = index if index is not None else get_interview_index()
+        self._extractors = {
+            question_id: [(field, PARSERS[parser], parser == "text", fallback)
+                          for field, parser, fallback in extractors]
+            for question_id, extractors in (field_extractors or FIELD_EXTRACTORS).items()
+        }
+        # Answers are free text: keep only the most recent ones parsed
+        self._parse = functools.lru_cache(maxsize=parse_cache_size)(_apply_parser)
+
+    def answers(self, call):
+        """(question ID, answer text, from extractedData) for every answered interview question"""
+        for key, value in (call.get("extractedData") or {}).items():
+            if value in (None, "", [], {}):
+                continue
+            question_id, _ = self.index.match(_extracted_data_question(key))
+            if question_id is not None:
+                yield question_id, _extracted_data_text(value), True
+        for qa in segment_transcript(call.get("transcript") or ""):
+            question_id, _ = self.index.match(qa["question"])
+            if question_id is not None:
+                yield question_id, qa["answer"], False
+
+    def extract(self, call):
+        """Screening record for one call log"""
+        record = {field: "N/A" for field in BASIC_FIELDS}
+        record["phone_number"] = call.get("fromNumber") or "N/A"
+        record["call_id"] = call.get("id", "N/A")
+        record["contact_id"] = call.get("contactId") or "N/A"
+        record["call_date"] = call.get("createdAt", "N/A")
+        record["call_duration"] = call.get("duration", "N/A")
+
+        final = set()       # typed fields set from extractedData
+        fallbacks = []
+        for question_id, answer, from_data in self.answers(call):
+            for field, parser, is_text, fallback in self._extractors.get(question_id, ()):
+                if fallback:
+                    fallbacks.append((field, parser, answer))
+                    continue
+                if field in final:
+                    continue
+                value = self._parse(parser, answer)
+                if value is None:
+                    continue
+                if is_text and field in record:
+                    # Repeated / related questions add to the text
+                    record[field] = f"{record[field]} {value}"
+                else:
+                    # A repeated question's last answer wins
+                    record[field] = value
+                    if from_data and not is_text:
+                        final.add(field)
+
+        for field, parser, answer in fallbacks:
+            if field not in record:
+                value = self._parse(parser, answer)
+                if value is not None:
+                    record[field] = value
+        return record
+
+    def extract_many(self, calls):
+        """Yield one record per call log"""
+        for call in calls:
+            yield self.extract(call)
+
+
+def extract_call_record(call):
+    """Screening record for one call log (see CallRecordExtractor)"""
+    return CallRecordExtractor().extract(call)
+
+
+def iter_archived_calls(pattern="call_data/call_logs_*.json"):
+    """
+    Yield the call logs of every saved call-log file, each call once
+    (newest file first, as later harvests may hold updated call logs).
+    """
+    seen = set()
+    for path in sorted(glob.glob(pattern), reverse=True):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for call in data.get("callLogs", []):
+            if call.get("id") not in seen:
+                seen.add(call.get("id"))
+                yield call
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from record_export import export_records
+
+    parser = argparse.ArgumentParser(description="Extract screening records from saved call logs")
+    parser.add_argument("--calls", default="call_data/call_logs_*.json", help="call-log files (glob)")
+    parser.add_argument("--output", default="call_records.csv", help="CSV or .parquet output")
+    args = parser.parse_args()
+
+    count = export_records(CallRecordExtractor().extract_many(iter_archived_calls(args.calls)), args.output)
+    print(f"✅ {count} call records saved to: {args.output}")
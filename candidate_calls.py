@@ -0,0 +1,225 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from call_records import CALL_FIELDS, CallRecordExtractor
+from fetch_applicants import BASIC_FIELDS, build_single_applicant_record
+from phone_numbers import normalize_phone_e164
+from screening_rules import get_rule_engine
+
+
+MISSING_VALUES = ("N/A", None, "")
+
+
+def _missing(value):
+    # NaN: questions a job never asked, in records loaded through pandas
+    return value in MISSING_VALUES or value != value
+
+
+class CandidatePhoneIndex:
+    """
+    E.164 phone number -> candidates, for joining call logs to applicants.
+
+    Entries are candidate listings (iter_candidates) or applicant records
+    (build_single_applicant_record); one number may belong to several
+    candidates, e.g. the same person applying to more than one job.
+    """
+
+    def __init__(self):
+        self.by_phone = {}
+        self.without_phone = 0
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.by_phone.values())
+
+    def add(self, candidate, job_id=None):
+        """Index one candidate; returns its E.164 number (None when it has none)"""
+        phone = normalize_phone_e164(candidate.get("phone_number"))
+        if phone is None:
+            self.without_phone += 1
+            return None
+        candidate_id = candidate.get("candidate_id", candidate.get("id"))
+        self.by_phone.setdefault(phone, []).append({
+            "job_id": job_id,
+            "candidate_id": candidate_id,
+            "candidate": candidate,
+        })
+        return phone
+
+    def lookup(self, phone):
+        """Candidates with this number (any format); [] when there are none"""
+        return self.by_phone.get(normalize_phone_e164(phone), [])
+
+    @classmethod
+    def from_records(cls, records, job_id=None):
+        index = cls()
+        for record in records:
+            index.add(record, job_id)
+        return index
+
+
+def index_job_candidates(client, job_ids, page_size=50, max_workers=8):
+    """
+    Phone index over the candidates of one or more jobs, listed through
+    a HireologyClient.
+
+    Listings that carry no phone number are completed from the candidate's
+    documents, fetched by max_workers threads (through the client's document
+    cache, if it has one); the index then holds the applicant record.
+    """
+    index = CandidatePhoneIndex()
+    in_flight = {}
+
+    def collect(done):
+        for future in done:
+            documents = future.result()
+            if documents:
+                index.add(build_single_applicant_record(documents), in_flight[future])
+            else:
+                index.without_phone += 1
+            del in_flight[future]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for job_id in job_ids:
+            for candidate in client.iter_candidates(job_id, page_size=page_size):
+                if candidate.get("phone_number"):
+                    index.add(candidate, job_id)
+                    continue
+                if len(in_flight) >= 2 * max_workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = executor.submit(client.get_candidate_documents, job_id, candidate["id"])
+                in_flight[future] = job_id
+        collect(wait(in_flight)[0])
+    return index
+
+
+def join_calls(calls, index, extractor=None):
+    """
+    Attach every call's parsed interview to the candidates with its number.
+
+    :param calls: iterable of call-log dicts (see fetch_calls)
+    :param index: CandidatePhoneIndex
+    :param extractor: CallRecordExtractor turning calls into records
+    :return: (matched, unmatched) where matched maps (job_id, candidate_id)
+             to that candidate's call records, and unmatched lists
+             {"call_id", "phone", "reason"} with reason "no_phone"
+             (fromNumber is not a valid number) or "no_candidate".
+    """
+    if extractor is None:
+        extractor = CallRecordExtractor()
+
+    matched = {}
+    unmatched = []
+    for call in calls:
+        phone = normalize_phone_e164(call.get("fromNumber"))
+        entries = index.by_phone.get(phone) if phone is not None else None
+        if not entries:
+            unmatched.append({
+                "call_id": call.get("id"),
+                "phone": call.get("fromNumber"),
+                "reason": "no_phone" if phone is None else "no_candidate",
+            })
+            continue
+
+        call_record = extractor.extract(call)
+        for entry in entries:
+            matched.setdefault((entry["job_id"], entry["candidate_id"]), []).append(call_record)
+    return matched, unmatched
+
+
+def _answered_fields(call_record):
+    return sum(
+        1 for field, value in call_record.items()
+        if field not in BASIC_FIELDS and field not in CALL_FIELDS and not _missing(value)
+    )
+
+
+def best_interview(call_records):
+    """
+    The call record to screen with: the one answering the most interview
+    questions, the latest of those on a tie (dropped calls answer little).
+    """
+    if not call_records:
+        return None
+    return max(call_records, key=lambda r: (_answered_fields(r), str(r.get("call_date", ""))))
+
+
+def merge_interview(applicant_record, call_records):
+    """
+    Applicant record plus the interview of its best call: interview fields
+    are added, and fill form questions the application left unanswered.
+    The application's own answers are kept. Also sets "interview_calls".
+    """
+    merged = dict(applicant_record)
+    merged["interview_calls"] = len(call_records or ())
+    interview = best_interview(call_records)
+    if interview is None:
+        return merged
+
+    for field, value in interview.items():
+        if field in BASIC_FIELDS or _missing(value):
+            continue
+        if _missing(merged.get(field)):
+            merged[field] = value
+    return merged
+
+
+def combine_applicants_with_calls(records, calls, job_id=None, extractor=None):
+    """
+    One combined record and decision per applicant.
+
+    Indexes the applicant records by phone, joins the calls (each looked up
+    once), merges each applicant's interview into its record and evaluates
+    the screening rules on the result.
+
+    :param records: applicant records of one job (build_single_applicant_record)
+    :param calls: iterable of call-log dicts
+    :return: (combined, unmatched) where combined is a list of
+             {"record", "final_status", "rejection_reason"} in record order
+             and unmatched is join_calls' list of unmatched calls
+    """
+    records = list(records)
+    index = CandidatePhoneIndex.from_records(records, job_id)
+    matched, unmatched = join_calls(calls, index, extractor)
+    engine = get_rule_engine()
+
+    combined = []
+    for record in records:
+        key = (job_id, record.get("candidate_id", record.get("id")))
+        merged = merge_interview(record, matched.get(key))
+        decision = engine.evaluate(merged, job_id)
+        combined.append({
+            "record": merged,
+            "final_status": decision.status,
+            "rejection_reason": decision.rejection_reason if decision.status == "Inactive" else None,
+        })
+    return combined, unmatched
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from batch_screening import load_applicant_frame
+    from call_records import iter_archived_calls
+    from record_export import export_records
+
+    parser = argparse.ArgumentParser(description="Join saved call logs to applicant records by phone number")
+    parser.add_argument("applicants", nargs="+", help="applicant CSV / Parquet exports")
+    parser.add_argument("--calls", default="call_data/call_logs_*.json", help="call-log files (glob)")
+    parser.add_argument("--job", help="job ID whose rule overrides apply")
+    parser.add_argument("--output", default="combined_records.csv", help="CSV or .parquet output")
+    args = parser.parse_args()
+
+    records = load_applicant_frame(args.applicants).to_dict("records")
+    combined, unmatched = combine_applicants_with_calls(records, iter_archived_calls(args.calls), args.job)
+
+    with_interview = sum(1 for c in combined if c["record"]["interview_calls"])
+    print(f"📞 {with_interview}/{len(combined)} applicants matched to calls, {len(unmatched)} calls unmatched")
+    for call in unmatched:
+        print(f"   ⚠️ {call['call_id']} ({call['phone']}): {call['reason']}")
+
+    count = export_records(
+        (dict(c["record"], final_status=c["final_status"], rejection_reason=c["rejection_reason"])
+         for c in combined),
+        args.output
+    )
+    print(f"✅ {count} combined records saved to: {args.output}")
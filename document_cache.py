@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "documents")
+
+
+class CachedDocument:
+    """A cache hit: the decoded payload plus what is needed to revalidate it"""
+
+    __slots__ = ("payload", "etag", "last_modified", "fresh")
+
+    def __init__(self, payload, etag, last_modified, fresh):
+        self.payload = payload
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+    def conditional_headers(self):
+        """Headers for a conditional GET revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DocumentCache:
+    """
+    On-disk cache for candidate all_documents payloads.
+
+    Payloads are stored once per content hash under blobs/ (identical
+    payloads share a file) and a small SQLite index maps
+    (job_id, candidate_id, transfer) to the blob, its validators and access
+    times. Entries younger than ttl seconds are served without touching the
+    network; older ones are revalidated with ETag / Last-Modified. When the
+    blobs exceed max_bytes the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=24 * 3600, max_bytes=500 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(
+            os.path.join(cache_dir, "index.sqlite3"), check_same_thread=False
+        )
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                cache_key TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS documents_lru ON documents (accessed_at)")
+        self.db.commit()
+
+    @staticmethod
+    def make_key(job_id, candidate_id, transfer=False):
+        return f"{job_id}:{candidate_id}:{str(transfer).lower()}"
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def get(self, job_id, candidate_id, transfer=False):
+        """
+        Return a CachedDocument for the key, or None on a miss.
+        The entry's fresh flag tells the caller whether it may skip the network.
+        """
+        key = self.make_key(job_id, candidate_id, transfer)
+        with self.lock:
+            row = self.db.execute(
+                "SELECT digest, etag, last_modified, fetched_at FROM documents WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            digest, etag, last_modified, fetched_at = row
+            now = time.time()
+            self.db.execute(
+                "UPDATE documents SET accessed_at = ? WHERE cache_key = ?", (now, key)
+            )
+            self.db.commit()
+
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                payload = json.loads(f.read())
+        except (OSError, ValueError):
+            self.delete(job_id, candidate_id, transfer)
+            return None
+
+        return CachedDocument(payload, etag, last_modified, now - fetched_at < self.ttl)
+
+    def put(self, job_id, candidate_id, content, transfer=False, etag=None, last_modified=None):
+        """
+        Store the raw response body for the key and evict LRU entries if needed.
+        """
+        key = self.make_key(job_id, candidate_id, transfer)
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                """
+                INSERT OR REPLACE INTO documents
+                    (cache_key, digest, size, etag, last_modified, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, digest, len(content), etag, last_modified, now, now)
+            )
+            self.db.commit()
+            self._evict()
+
+    def touch(self, job_id, candidate_id, transfer=False):
+        """Mark an entry as revalidated (304 Not Modified) so its TTL restarts"""
+        key = self.make_key(job_id, candidate_id, transfer)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "UPDATE documents SET fetched_at = ?, accessed_at = ? WHERE cache_key = ?",
+                (now, now, key)
+            )
+            self.db.commit()
+
+    def delete(self, job_id, candidate_id, transfer=False):
+        key = self.make_key(job_id, candidate_id, transfer)
+        with self.lock:
+            row = self.db.execute(
+                "SELECT digest FROM documents WHERE cache_key = ?", (key,)
+            ).fetchone()
+            self.db.execute("DELETE FROM documents WHERE cache_key = ?", (key,))
+            self.db.commit()
+            if row:
+                self._remove_blob_if_unused(row[0])
+
+    def _remove_blob_if_unused(self, digest):
+        in_use = self.db.execute(
+            "SELECT 1 FROM documents WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if not in_use:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        # Blob sizes are counted once per distinct digest
+        (total,) = self.db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM documents)"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        rows = self.db.execute(
+            "SELECT cache_key, digest, size FROM documents ORDER BY accessed_at"
+        ).fetchall()
+        for key, digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.db.execute("DELETE FROM documents WHERE cache_key = ?", (key,))
+            shared = self.db.execute(
+                "SELECT 1 FROM documents WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if not shared:
+                total -= size
+                self._remove_blob_if_unused(digest)
+        self.db.commit()
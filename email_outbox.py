@@ -0,0 +1,408 @@
+import sqlite3
+import threading
+import time
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from email_templates import render_email
+from metrics import metrics
+from rate_limit import backoff_delay
+
+
+DEFAULT_OUTBOX_PATH = "email_outbox.sqlite3"
+
+# A message is given up on (status "failed") after this many send attempts
+MAX_ATTEMPTS = 5
+
+# Messages that will not be delivered without someone looking at them
+DEAD_LETTER_STATUSES = ("failed", "unknown")
+
+
+def outbox_dedupe_key(job_id, owner, kind):
+    """Default dedupe key of a message: one email of a kind per job and candidate"""
+    return f"{job_id}:{owner}:{kind}"
+
+
+def _never_sent(error):
+    """Whether a failed send provably never reached the server (no connection was made)"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+class EmailOutbox:
+    """
+    Durable local queue of outgoing emails, stored in SQLite.
+
+    Screening enqueues rendered messages here and returns immediately; an
+    OutboxDispatcher delivers them in the background. Every message has a
+    dedupe key (job, candidate, kind), so enqueueing the same email twice,
+    e.g. after a crash and rerun, keeps a single message.
+
+    Message status: "queued" -> "sending" -> "sent". An attempt that never
+    reached the server (no connection, or a 429) goes back to "queued",
+    retried later with backoff until MAX_ATTEMPTS, then "failed"; other 4xx
+    responses fail at once. Sending emails is not idempotent, so an attempt
+    that may have been processed (timeout, dropped connection, 5xx) becomes
+    "unknown" and is not resent. A message left "sending" by a crash is not
+    resent automatically either; requeue_stale() does that explicitly.
+    dead_letters() lists the "failed" and "unknown" messages.
+    """
+
+    def __init__(self, path=DEFAULT_OUTBOX_PATH, max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dedupe_key TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                candidate_id TEXT,
+                candidate_job_id TEXT NOT NULL,
+                email_to TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                http_status INTEGER,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at)"
+        )
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def enqueue(self, kind, job_id, candidate_job_id, email_to, candidate_id=None, dedupe_key=None, **context):
+        """
+        Render an email (see email_templates.render_email) and queue it.
+
+        :param kind: "incomplete_application" or "rejection"
+        :param job_id: job_id form field sent with the email
+        :param context: template values (job_name, incomplete_questions / rejection_reason)
+        :return: ID of the queued message (of the existing one for a duplicate)
+        """
+        subject, body = render_email(kind, **context)
+        if dedupe_key is None:
+            owner = candidate_job_id if candidate_id is None else candidate_id
+            dedupe_key = outbox_dedupe_key(job_id, owner, kind)
+        now = time.time()
+
+        with self.lock:
+            self.db.execute(
+                """
+                INSERT OR IGNORE INTO outbox
+                    (dedupe_key, kind, job_id, candidate_id, candidate_job_id, email_to,
+                     subject, body, status, next_attempt_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'queued', ?, ?, ?)
+                """,
+                (
+                    dedupe_key, kind, str(job_id),
+                    None if candidate_id is None else str(candidate_id),
+                    str(candidate_job_id), email_to, subject, body, now, now, now
+                )
+            )
+            row = self.db.execute(
+                "SELECT id FROM outbox WHERE dedupe_key = ?", (dedupe_key,)
+            ).fetchone()
+        return row[0]
+
+    def claim_batch(self, limit=10):
+        """
+        Atomically move up to limit due messages to "sending" and return them
+        as dicts (id, job_id, candidate_job_id, email_to, subject, body, attempts).
+        """
+        now = time.time()
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self.db.execute(
+                    """
+                    SELECT id, job_id, candidate_job_id, email_to, subject, body, attempts
+                    FROM outbox
+                    WHERE status = 'queued' AND next_attempt_at <= ?
+                    ORDER BY next_attempt_at, id
+                    LIMIT ?
+                    """,
+                    (now, limit)
+                ).fetchall()
+                self.db.executemany(
+                    "UPDATE outbox SET status = 'sending', updated_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows]
+                )
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+        columns = ("id", "job_id", "candidate_job_id", "email_to", "subject", "body", "attempts")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def mark_sent(self, message_id, http_status=None):
+        with self.lock:
+            self.db.execute(
+                """
+                UPDATE outbox
+                SET status = 'sent', attempts = attempts + 1, http_status = ?,
+                    last_error = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (http_status, time.time(), message_id)
+            )
+
+    def mark_failed(self, message_id, error, http_status=None, retry=True):
+        """
+        Record a failed attempt. The message is queued again after a backoff
+        unless retry is False or it has used up its attempts.
+        """
+        now = time.time()
+        with self.lock:
+            (attempts,) = self.db.execute(
+                "SELECT attempts FROM outbox WHERE id = ?", (message_id,)
+            ).fetchone()
+            attempts += 1
+            if retry and attempts < self.max_attempts:
+                status, next_attempt_at = "queued", now + backoff_delay(attempts, base=5.0, cap=600.0)
+            else:
+                status, next_attempt_at = "failed", now
+            self.db.execute(
+                """
+                UPDATE outbox
+                SET status = ?, attempts = ?, next_attempt_at = ?, http_status = ?,
+                    last_error = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (status, attempts, next_attempt_at, http_status, str(error)[:500], now, message_id)
+            )
+
+    def mark_unknown(self, message_id, error, http_status=None):
+        """Record an attempt the server may have processed; it is not retried"""
+        with self.lock:
+            self.db.execute(
+                """
+                UPDATE outbox
+                SET status = 'unknown', attempts = attempts + 1, http_status = ?,
+                    last_error = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (http_status, str(error)[:500], time.time(), message_id)
+            )
+
+    def requeue_stale(self, older_than=15 * 60):
+        """
+        Queue again messages stuck in "sending" for longer than older_than
+        seconds (a dispatcher died mid-send). They may be delivered twice.
+        Returns the number of messages requeued.
+        """
+        now = time.time()
+        with self.lock:
+            cursor = self.db.execute(
+                """
+                UPDATE outbox SET status = 'queued', next_attempt_at = ?, updated_at = ?
+                WHERE status = 'sending' AND updated_at < ?
+                """,
+                (now, now, now - older_than)
+            )
+        return cursor.rowcount
+
+    def pending_count(self):
+        """Messages not yet delivered or given up on"""
+        with self.lock:
+            (count,) = self.db.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status IN ('queued', 'sending')"
+            ).fetchone()
+        return count
+
+    def next_due_in(self):
+        """Seconds until the next queued message is due, None if none is queued"""
+        with self.lock:
+            (due,) = self.db.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status = 'queued'"
+            ).fetchone()
+        return None if due is None else max(0.0, due - time.time())
+
+    def counts(self):
+        """Number of messages per status"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    def status_of(self, dedupe_key):
+        """Status of the message with this dedupe key, None if there is none"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT status FROM outbox WHERE dedupe_key = ?", (dedupe_key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def dead_letters(self):
+        """Messages given up on ("failed") or possibly sent ("unknown"), oldest first"""
+        with self.lock:
+            cursor = self.db.execute(
+                """
+                SELECT id, dedupe_key, kind, job_id, candidate_id, email_to,
+                       status, attempts, http_status, last_error
+                FROM outbox WHERE status IN (?, ?) ORDER BY id
+                """,
+                DEAD_LETTER_STATUSES
+            )
+            rows = cursor.fetchall()
+            columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def get(self, message_id):
+        """Delivery record of one message as a dict, None if unknown"""
+        with self.lock:
+            cursor = self.db.execute(
+                """
+                SELECT id, dedupe_key, kind, job_id, candidate_id, candidate_job_id, email_to,
+                       status, attempts, http_status, last_error, created_at, updated_at
+                FROM outbox WHERE id = ?
+                """,
+                (message_id,)
+            )
+            row = cursor.fetchone()
+            columns = [c[0] for c in cursor.description]
+        return None if row is None else dict(zip(columns, row))
+
+
+class OutboxDispatcher:
+    """
+    Worker pool delivering an EmailOutbox through a HireologyClient.
+
+    Workers share the client's pooled session and rate limiter, so emails
+    reuse connections and respect the API's limits. Delivery results
+    (HTTP status, attempts, last error) are recorded in the outbox.
+
+        dispatcher = OutboxDispatcher(client, outbox).start()
+        ...                       # screening enqueues emails meanwhile
+        dispatcher.stop()         # waits until every queued email is handled
+
+    drain() delivers everything due synchronously instead.
+    """
+
+    def __init__(self, client, outbox, workers=4, batch_size=10, poll_interval=1.0):
+        self.client = client
+        self.outbox = outbox
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.sent = 0
+        self.failed = 0
+        self.unknown = 0
+        self._counts_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._finish = threading.Event()
+        self._threads = []
+
+    def deliver(self, message):
+        """Send one claimed message and record the result. Returns True on success."""
+        try:
+            with metrics.span("email_delivery"):
+                response = self.client.send_email(
+                    message["candidate_job_id"],
+                    message["email_to"],
+                    message["subject"],
+                    message["body"],
+                    message["job_id"]
+                )
+        except Exception as e:
+            if _never_sent(e):
+                self.outbox.mark_failed(message["id"], e)
+                result = "failed"
+            else:
+                # Timed out or dropped after sending: the email may be out
+                self.outbox.mark_unknown(message["id"], e)
+                result = "unknown"
+        else:
+            status = response.status_code
+            if status == 200:
+                self.outbox.mark_sent(message["id"], status)
+                result = "sent"
+            elif status >= 500:
+                self.outbox.mark_unknown(message["id"], f"HTTP {status}", status)
+                result = "unknown"
+            else:
+                # Only a 429 was certainly not processed; other 4xx will not
+                # succeed on a retry
+                self.outbox.mark_failed(message["id"], f"HTTP {status}", status, retry=status == 429)
+                result = "failed"
+
+        metrics.inc("emails_delivered_total", result=result)
+        with self._counts_lock:
+            if result == "sent":
+                self.sent += 1
+            elif result == "unknown":
+                self.unknown += 1
+            else:
+                self.failed += 1
+        return result == "sent"
+
+    def drain(self):
+        """Deliver every message that is due now, in the calling thread"""
+        while True:
+            batch = self.outbox.claim_batch(self.batch_size)
+            if not batch:
+                return
+            for message in batch:
+                self.deliver(message)
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self.outbox.claim_batch(self.batch_size)
+            if batch:
+                for message in batch:
+                    self.deliver(message)
+                continue
+            # Nothing due: finish if asked to and nothing is pending, else wait
+            if self._finish.is_set():
+                due_in = self.outbox.next_due_in()
+                if due_in is None:
+                    return
+                self._stop.wait(min(due_in, self.poll_interval))
+            else:
+                self._stop.wait(self.poll_interval)
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"email-outbox-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, wait_for_queue=True):
+        """
+        Stop the workers. With wait_for_queue they first deliver every queued
+        message, including retries that are still backing off.
+        """
+        if wait_for_queue:
+            self._finish.set()
+        else:
+            self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
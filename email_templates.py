@@ -0,0 +1,83 @@
+import html
+from string import Template
+
+
+# ---------------- TEMPLATES ----------------
+# Compiled once at import. Every substituted value is HTML-escaped, so
+# candidate-supplied text (job names, answers quoted in incomplete-question
+# messages) cannot inject markup into the email.
+
+INCOMPLETE_APPLICATION_SUBJECT = "Incomplete Application – Action Required"
+REJECTION_SUBJECT = "Application Status – Rejection"
+
+INCOMPLETE_APPLICATION_TEMPLATE = Template("""
+    <p>Dear Applicant,</p>
+
+    <p>Your application for <strong>$job_name</strong> is incomplete.</p>
+
+    <p>Please complete the following required information:</p>
+
+    <ul>
+        $questions_html
+    </ul>
+
+    <p>Once completed, your application will proceed for further review.</p>
+
+    <p>Thank you,<br>Hiring Team</p>
+    """)
+
+QUESTION_ITEM_TEMPLATE = Template("<li>$question</li>")
+
+REJECTION_TEMPLATE = Template("""
+    <p>Dear Applicant,</p>
+
+    <p>Thank you for applying for <strong>$job_name</strong>.</p>
+
+    <p>We regret to inform you that your application has not been successful.</p>
+
+    <p><strong>Reason for rejection:</strong></p>
+    <p>$rejection_reason</p>
+
+    <p>We encourage you to apply for future opportunities that match your skills.</p>
+
+    <p>Thank you,<br>Hiring Team</p>
+    """)
+
+
+def _escape(value):
+    return html.escape("" if value is None else str(value))
+
+
+def render_incomplete_application_email(job_name, incomplete_questions):
+    """Return (subject, HTML body) of the incomplete application email"""
+    questions_html = "".join(
+        QUESTION_ITEM_TEMPLATE.substitute(question=_escape(q)) for q in incomplete_questions
+    )
+    body = INCOMPLETE_APPLICATION_TEMPLATE.substitute(
+        job_name=_escape(job_name), questions_html=questions_html
+    )
+    return INCOMPLETE_APPLICATION_SUBJECT, body
+
+
+def render_rejection_email(job_name, rejection_reason):
+    """Return (subject, HTML body) of the rejection email"""
+    body = REJECTION_TEMPLATE.substitute(
+        job_name=_escape(job_name), rejection_reason=_escape(rejection_reason)
+    )
+    return REJECTION_SUBJECT, body
+
+
+# kind -> renderer(**context) returning (subject, body); used by the email outbox
+RENDERERS = {
+    "incomplete_application": render_incomplete_application_email,
+    "rejection": render_rejection_email,
+}
+
+
+def render_email(kind, **context):
+    """Render an email of the given kind; returns (subject, HTML body)"""
+    try:
+        renderer = RENDERERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown email kind: {kind}") from None
+    return renderer(**context)
@@ -1,31 +1,63 @@
-
-import requests
 import csv
-import json
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from hireology_client import HireologyClient, iter_pages
+from screening_state import ScreeningState, iter_new_candidates, advance_watermark
+from record_export import RecordExporter
+from email_outbox import DEAD_LETTER_STATUSES, EmailOutbox, OutboxDispatcher, outbox_dedupe_key
+from status_updates import StatusUpdater, is_noop_status
+from metrics import metrics, export_metrics
+from supervisor_references import parse_supervisor_references
+from question_index import get_question_index
+from screening_rules import (
+    CAREGIVER_DESCRIPTION_QUESTION,
+    CAREGIVER_KEYWORD_PATTERN,
+    get_rule_engine,
+)
+
 
+_clients = {}
+_clients_lock = threading.Lock()
 
-def get_candidates(jwt_token, job_id, page_size=10):
+
+def get_client(jwt_token):
     """
-    Fetch candidates for a specific job from Hireology.
+    Return the shared HireologyClient for a token, creating it on first use.
+    The module-level functions below all go through this pooled client.
     """
-    url = f"https://api.hireology.com/v2/jobs/{job_id}/candidates"
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    params = {
-        "filter[status]": "Applicant",
-        "sort_dir": "desc",
-        "sort_step_id": "",
-        "sort": "date",
-        "page_size": page_size
-    }
+    with _clients_lock:
+        client = _clients.get(jwt_token)
+        if client is None:
+            client = _clients[jwt_token] = HireologyClient(jwt_token)
+        return client
+
+
+def get_candidates(jwt_token, job_id, page_size=10, page=1):
+    """
+    Fetch a single page of candidates for a specific job from Hireology.
+    """
+    return get_client(jwt_token).get_candidates(job_id, page_size=page_size, page=page)
+
 
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    return response.json()
+def iter_candidates(jwt_token, job_id, page_size=50, prefetch=True, fetch_page=None):
+    """
+    Yield every candidate for a job, walking all pages of the candidates endpoint.
+
+    While the caller works on the current page, the next one is already being
+    downloaded in a background thread (set prefetch=False to disable).
+
+    :param jwt_token: JWT access token (string)
+    :param job_id: Job ID (string or int)
+    :param page_size: Number of candidates requested per page
+    :param prefetch: Fetch page N+1 while page N is being consumed
+    :param fetch_page: Optional callable(page, page_size) -> response JSON,
+                       defaults to get_candidates with the given token/job
+    :return: generator of candidate dicts
+    """
+    if fetch_page is None:
+        return get_client(jwt_token).iter_candidates(job_id, page_size=page_size, prefetch=prefetch)
+    return iter_pages(fetch_page, page_size, prefetch=prefetch)
 
 
 def get_candidate_documents(jwt_token, job_id, candidate_id, transfer=False):
@@ -38,29 +70,7 @@ def get_candidate_documents(jwt_token, job_id, candidate_id, transfer=False):
     :param transfer: Boolean flag for transfer parameter
     :return: JSON response
     """
-    url = f"https://api.hireology.com/v2/jobs/{job_id}/candidates/{candidate_id}/documents/all_documents"
-
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Accept": "application/json"
-    }
-
-    params = {
-        "transfer": str(transfer).lower()  # API expects true/false as string
-    }
-
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
-
-    except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP Error: {http_err}")
-        print("Response:", response.text)
-    except Exception as err:
-        print(f"Error: {err}")
-
-    return None
+    return get_client(jwt_token).get_candidate_documents(job_id, candidate_id, transfer=transfer)
 
 
 def extract_applicant_ids(response_json):
@@ -196,45 +206,35 @@ def validate_supervisor_references(answer_text):
     """
     Validates that at least 2 supervisor names and 2 phone numbers are provided.
     Returns (is_valid, message)
-    """
 
-    if not answer_text or answer_text == "N/A":
-        return False, (
-            "Please provide at least 2 former supervisors with their names and phone numbers."
-        )
-
-    # Count phone numbers (simple but effective)
-    phone_numbers = re.findall(r"\+?\d[\d\-\s]{8,}\d", answer_text)
-
-    # Count names (words starting with capital letters)
-    names = re.findall(r"\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)?\b", answer_text)
+    See supervisor_references.parse_supervisor_references for the structured
+    (name, phone, E.164) result behind this check.
+    """
+    check = parse_supervisor_references(answer_text)
+    return check.is_valid, check.message
 
-    if len(phone_numbers) < 2 or len(names) < 2:
-        return False, (
-            "Please provide at least 2 former supervisors with their names and phone numbers. "
-            "Supervisors cannot be co-workers, family members, or friends."
-        )
 
-    return True, None
+# Record fields that come from the candidate profile, not from questions
+BASIC_FIELDS = (
+    "candidate_id", "first_name", "last_name", "email", "phone_number",
+    "address", "city", "state", "zip_code", "job_name", "status", "applied_at"
+)
+_BASIC_FIELD_SET = frozenset(BASIC_FIELDS)
 
 
-def get_incomplete_questions(applicant_record):
+def get_incomplete_questions(applicant_record, job_id=None):
     """
     Returns a list of incomplete questions including business-rule validation.
+
+    Validators are looked up per field in the question index, which matches
+    reworded questions as well (see question_index.QuestionIndex).
     """
 
-    ignore_fields = {
-        "candidate_id", "first_name", "last_name", "email", "phone_number",
-        "address", "city", "state", "zip_code", "job_name", "status", "applied_at"
-    }
+    ignore_fields = _BASIC_FIELD_SET
+    index = get_question_index()
 
     incomplete = []
 
-    SUPERVISOR_QUESTION = (
-        "Please provide the contact name and phone number of 2-3 former supervisors. "
-        "*Cannot be co-workers, family, or friends*"
-    )
-
     for field, value in applicant_record.items():
         if field in ignore_fields:
             continue
@@ -244,10 +244,11 @@ def get_incomplete_questions(applicant_record):
             incomplete.append(field)
             continue
 
-        # Special supervisor validation
-        if SUPERVISOR_QUESTION in field:
-            is_valid, message = validate_supervisor_references(value)
-            if not is_valid:
+        # Business-rule validation (e.g. supervisor references)
+        validator = index.validator_for(field, job_id)
+        if validator is not None:
+            message = validator(value)
+            if message:
                 incomplete.append(message)
 
     return incomplete
@@ -265,65 +266,21 @@ def send_incomplete_application_email(
     Send incomplete application email to candidate.
     Returns True if successful, False otherwise.
     """
-    url = "https://api.hireology.com/v2/emails/send_single_email"
-
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Accept": "*/*"
-        # DO NOT set Content-Type manually
-    }
-
-    questions_html = "".join(
-        f"<li>{q}</li>" for q in incomplete_questions
+    return get_client(jwt_token).send_incomplete_application_email(
+        candidate_job_id=candidate_job_id,
+        candidate_email=candidate_email,
+        job_id=job_id,
+        job_name=job_name,
+        incomplete_questions=incomplete_questions
     )
 
-    email_body = f"""
-    <p>Dear Applicant,</p>
-
-    <p>Your application for <strong>{job_name}</strong> is incomplete.</p>
-
-    <p>Please complete the following required information:</p>
-
-    <ul>
-        {questions_html}
-    </ul>
-
-    <p>Once completed, your application will proceed for further review.</p>
-
-    <p>Thank you,<br>Hiring Team</p>
+def find_caregiver_keywords(text):
     """
+    Scan text once and return the set of caregiver keywords it contains.
+    """
+    return {m.group("keyword").lower() for m in CAREGIVER_KEYWORD_PATTERN.finditer(text)}
 
-    data = {
-        "candidate_job_ids[]": str(candidate_job_id),
-        "user[email_to]": candidate_email,
-        "user[email_subject]": "Incomplete Application – Action Required",
-        "user[email_body]": email_body,
-        "job_id": str(job_id),
-        "email_type": "custom"
-    }
-
-    try:
-        response = requests.post(
-            url,
-            headers=headers,
-            data=data,
-            timeout=30
-        )
-
-        print(f"Email POST status: {response.status_code}")
-        print(f"Response: {response.text}")
-
-        # Check if email was sent successfully
-        if response.status_code == 200:
-            return True
-        else:
-            return False
 
-    except Exception as e:
-        print(f"❌ Email sending failed with exception: {e}")
-        return False
-
-import re
 def evaluate_caregiver_experience(applicant_record):
     """
     Evaluates caregiver/nursing experience using:
@@ -333,97 +290,25 @@ def evaluate_caregiver_experience(applicant_record):
     """
 
     # -------- TEXT SOURCES --------
-    description = applicant_record.get(
-        "Can you briefly describe your previous caregiving roles, including your main responsibilities and the care settings you worked in?",
-        ""
-    )
-
+    description = applicant_record.get(CAREGIVER_DESCRIPTION_QUESTION, "")
     job_titles = applicant_record.get("job_title_held", "")
 
-    combined_text = f"{description} {job_titles}".lower()
+    combined_text = f"{description} {job_titles}"
 
     if not combined_text.strip():
         return "Inactive"
 
-    # -------- EXPANDED KEYWORDS --------
-    caregiver_keywords = [
-        # Caregiving
-        "caregiver", "caregiving", "carer", "home care", "personal care",
-        "companion care", "elder care", "elderly care", "senior care",
-        "geriatric", "hospice", "palliative", "respite",
-
-        # Nursing
-        "nurse", "nursing", "registered nurse", "rn",
-        "licensed practical nurse", "lpn",
-        "licensed vocational nurse", "lvn",
-        "nursing assistant", "nurse aide",
-
-        # Certifications / Clinical
-        "cna", "pct", "medtech", "medical technician",
-        "patient care technician", "medical assistant",
-        "healthcare aide", "clinical aide",
-
-        # Facilities
-        "assisted living", "long-term care", "nursing home",
-        "skilled nursing", "snf", "rehab", "rehabilitation",
-        "hospital", "clinic", "memory care", "dementia care",
-
-        # Responsibilities
-        "patient care", "direct care", "activities of daily living", "adl",
-        "bathing", "feeding", "toileting", "grooming",
-        "mobility assistance", "vitals", "medication"
-    ]
-
     # -------- MATCH CHECK --------
-    for keyword in caregiver_keywords:
-        if keyword in combined_text:
-            return "Candidate"
+    if CAREGIVER_KEYWORD_PATTERN.search(combined_text):
+        return "Candidate"
 
     return "Inactive"
 
-def get_rejection_reason(applicant_record):
+def get_rejection_reason(applicant_record, job_id=None):
     """
     Generates a reason why the applicant was rejected based on business rules.
     """
-    reasons = []
-
-    # Experience check
-    experience_text = applicant_record.get(
-        "How many years of professional caregiving experience do you have?", ""
-    )
-    match = re.search(r"\d+", str(experience_text))
-    years = int(match.group()) if match else 0
-    if years < 1:
-        reasons.append("Less than 1 year of professional caregiving experience")
-
-    # Driver's license check
-    drivers_license = applicant_record.get(
-        "Do you have a valid driver's license, and car insurance?", ""
-    )
-    if drivers_license.strip().lower() != "yes":
-        reasons.append("Does not have a valid driver's license and car insurance")
-
-    # Drug screen check
-    drug_screen = applicant_record.get("Are you able to pass a drug screen?", "")
-    if drug_screen.strip().lower() != "yes":
-        reasons.append("Unable to pass a drug screen")
-
-    # Criminal record check
-    criminal_record = applicant_record.get(
-        "Have you been arrested, convicted of a felony, or misdemeanor?", ""
-    )
-    if criminal_record.strip().lower() != "no":
-        reasons.append("Has a criminal record")
-
-    # NEW: Caregiver experience description check
-    selection_status = evaluate_caregiver_experience(applicant_record)
-    if selection_status == "Inactive":
-        reasons.append("No relevant caregiver experience or certification found")
-
-    if not reasons:
-        return "Did not meet our standard application requirements."
-
-    return "; ".join(reasons)
+    return get_rule_engine().evaluate(applicant_record, job_id).rejection_reason
 
 
 def send_rejection_email(jwt_token, candidate_job_id, candidate_email, job_name, rejection_reason):
@@ -431,115 +316,433 @@ def send_rejection_email(jwt_token, candidate_job_id, candidate_email, job_name,
     Send rejection email to candidate.
     Returns True if successful, False otherwise.
     """
-    url = "https://api.hireology.com/v2/emails/send_single_email"
-
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Accept": "*/*"
-    }
+    return get_client(jwt_token).send_rejection_email(
+        candidate_job_id=candidate_job_id,
+        candidate_email=candidate_email,
+        job_name=job_name,
+        rejection_reason=rejection_reason
+    )
 
-    email_body = f"""
-    <p>Dear Applicant,</p>
 
-    <p>Thank you for applying for <strong>{job_name}</strong>.</p>
+def decide_candidate_status(applicant_record, job_id=None):
+    """
+    Decide whether candidate should be Advanced (Candidate) or Inactive.
+    """
+    return get_rule_engine().evaluate(applicant_record, job_id).status
 
-    <p>We regret to inform you that your application has not been successful.</p>
 
-    <p><strong>Reason for rejection:</strong></p>
-    <p>{rejection_reason}</p>
+def update_candidate_status(jwt_token, job_id, candidate_id, status):
+    """
+    Update candidate status in Hireology.
+    """
+    return get_client(jwt_token).update_candidate_status(job_id, candidate_id, status)
 
-    <p>We encourage you to apply for future opportunities that match your skills.</p>
 
-    <p>Thank you,<br>Hiring Team</p>
+def evaluate_application(documents, job_id=None):
     """
+    Apply the screening rules to a candidate's all_documents payload.
 
-    data = {
-        "candidate_job_ids[]": str(candidate_job_id),
-        "user[email_to]": candidate_email,
-        "user[email_subject]": "Application Status – Rejection",
-        "user[email_body]": email_body,
-        "job_id": str(candidate_job_id),
-        "email_type": "custom"
-    }
+    Pure function shared by the sync and async pipelines; it decides what to
+    do but performs no network calls.
 
-    try:
-        response = requests.post(url, headers=headers, data=data, timeout=30)
+    Returns a dict with the built record, candidate_job_id, incomplete
+    questions, final status (None when incomplete) and rejection reason.
+    """
+    applicant_record = build_single_applicant_record(documents)
+    evaluation = {
+        "record": applicant_record,
+        "candidate_job_id": documents[0].get("id"),
+        "incomplete_questions": get_incomplete_questions(applicant_record, job_id),
+        "final_status": None,
+        "rejection_reason": None,
+    }
 
-        print(f"📧 Rejection Email POST status: {response.status_code}")
-        print(f"📧 Response: {response.text}")
+    if evaluation["incomplete_questions"]:
+        return evaluation
+
+    # One pass of the rule set gives both the decision and every reason
+    decision = get_rule_engine().evaluate(applicant_record, job_id)
+    evaluation["final_status"] = decision.status
+    if decision.status == "Inactive":
+        evaluation["rejection_reason"] = decision.rejection_reason
+
+    return evaluation
+
+
+def new_screening_result(candidate_id, applied_at=None):
+    """Return an empty per-candidate result dict for the screening pipelines"""
+    return {
+        "candidate_id": candidate_id,
+        "applied_at": applied_at,
+        "candidate_job_id": None,
+        "outcome": None,
+        "incomplete_questions": [],
+        "rejection_reason": None,
+        "email_sent": None,
+        "email_queued": False,
+        "pending_delivery": False,
+        "status_updated": False,
+        "skipped_actions": [],
+        "error": None,
+    }
 
-        return response.status_code == 200
 
-    except Exception as e:
-        print(f"❌ Rejection email sending failed with exception: {e}")
-        return False
+def count_outcomes(results):
+    """Number of results (screening or status-update) per outcome"""
+    counts = {}
+    for result in results:
+        counts[result["outcome"]] = counts.get(result["outcome"], 0) + 1
+    return counts
 
 
-def decide_candidate_status(applicant_record):
+def screen_candidate(
+    client,
+    job_id,
+    candidate_id,
+    applied_at=None,
+    ledger=None,
+    exporter=None,
+    outbox=None,
+    status_updater=None
+):
     """
-    Decide whether candidate should be Advanced (Candidate) or Inactive.
+    Run the full screening flow for one candidate:
+    documents -> record -> completeness check / decision -> email -> status update.
+
+    With a ledger (ScreeningState) each email and status update is performed
+    at most once across runs, and candidates already screened by a previous
+    run are skipped before any network call. With an exporter
+    (RecordExporter) every built record is also streamed to the export.
+    With an outbox (EmailOutbox) emails are queued for background delivery
+    instead of being sent inline; result["email_queued"] is set and
+    result["email_sent"] stays None. A rejected candidate then only counts
+    as screened once the email is delivered: result["pending_delivery"] is
+    set and confirm_email_delivery records it. With a status_updater (StatusUpdater)
+    the status change is handed to it and result["status_updated"] is filled
+    in once the updater has applied it. Status changes that match the
+    candidate's current status are skipped either way.
+
+    Returns a result dict describing what happened; errors are captured in the
+    result instead of being raised so one bad candidate cannot stop a batch.
     """
+    result = new_screening_result(candidate_id, applied_at)
+
+    if ledger is not None and ledger.has_succeeded(job_id, candidate_id, "screened"):
+        result["outcome"] = "skipped"
+        metrics.inc("candidates_total", outcome="skipped")
+        return result
+
+    held_elsewhere = []
+    deferred = []
+
+    def perform(action, func, detail=None, idempotent=False):
+        with metrics.span(action):
+            if ledger is None:
+                value = func()
+                metrics.inc("side_effects_total", action=action, result="ok" if value else "failed")
+                return value
+            performed, value = ledger.run_once(
+                job_id, candidate_id, action, func,
+                detail=detail, candidate_job_id=result["candidate_job_id"], idempotent=idempotent
+            )
+        if not performed:
+            result["skipped_actions"].append(action)
+            if value is None:
+                held_elsewhere.append(action)
+        metrics.inc(
+            "side_effects_total", action=action,
+            result="skipped" if not performed else ("ok" if value else "failed")
+        )
+        return value
 
-    # Extract answers safely
-    experience_text = applicant_record.get(
-        "How many years of professional caregiving experience do you have?", ""
-    )
-
-    drivers_license = applicant_record.get(
-        "Do you have a valid driver's license, and car insurance?", ""
-    )
-
-    drug_screen = applicant_record.get(
-        "Are you able to pass a drug screen?", ""
-    )
-
-    criminal_record = applicant_record.get(
-        "Have you been arrested, convicted of a felony, or misdemeanor?", ""
-    )
+    try:
+        with metrics.span("fetch_documents"):
+            documents = client.get_candidate_documents(job_id, candidate_id, transfer=False)
+        if not documents:
+            result["outcome"] = "error"
+            result["error"] = "Failed to fetch documents"
+            return result
+
+        with metrics.span("evaluate"):
+            evaluation = evaluate_application(documents, job_id)
+        applicant_record = evaluation["record"]
+        candidate_job_id = evaluation["candidate_job_id"]
+        result["candidate_job_id"] = candidate_job_id
+        result["applied_at"] = result["applied_at"] or applicant_record["applied_at"]
+        if exporter is not None:
+            with metrics.span("export"):
+                exporter.write(applicant_record)
+
+        if evaluation["incomplete_questions"]:
+            # Incomplete applications only get a reminder, no status change
+            result["outcome"] = "incomplete"
+            result["incomplete_questions"] = evaluation["incomplete_questions"]
+            if outbox is not None:
+                result["email_queued"] = bool(perform(
+                    "incomplete_email",
+                    lambda: outbox.enqueue(
+                        "incomplete_application",
+                        job_id=job_id,
+                        candidate_job_id=candidate_job_id,
+                        email_to=applicant_record["email"],
+                        candidate_id=candidate_id,
+                        job_name=applicant_record["job_name"],
+                        incomplete_questions=evaluation["incomplete_questions"]
+                    )
+                ))
+            else:
+                result["email_sent"] = perform(
+                    "incomplete_email",
+                    lambda: client.send_incomplete_application_email(
+                        candidate_job_id=candidate_job_id,
+                        candidate_email=applicant_record["email"],
+                        job_id=job_id,
+                        job_name=applicant_record["job_name"],
+                        incomplete_questions=evaluation["incomplete_questions"]
+                    )
+                )
+        else:
+            final_status = evaluation["final_status"]
+            result["outcome"] = final_status
+
+            if final_status == "Inactive":
+                result["rejection_reason"] = evaluation["rejection_reason"]
+                if outbox is not None:
+                    # Same job_id quirk as send_rejection_email
+                    result["email_queued"] = bool(perform(
+                        "rejection_email",
+                        lambda: outbox.enqueue(
+                            "rejection",
+                            job_id=candidate_job_id,
+                            candidate_job_id=candidate_job_id,
+                            email_to=applicant_record["email"],
+                            candidate_id=candidate_id,
+                            dedupe_key=outbox_dedupe_key(job_id, candidate_id, "rejection"),
+                            job_name=applicant_record["job_name"],
+                            rejection_reason=evaluation["rejection_reason"]
+                        )
+                    ))
+                else:
+                    result["email_sent"] = perform(
+                        "rejection_email",
+                        lambda: client.send_rejection_email(
+                            candidate_job_id=candidate_job_id,
+                            candidate_email=applicant_record["email"],
+                            job_name=applicant_record["job_name"],
+                            rejection_reason=evaluation["rejection_reason"]
+                        )
+                    )
+
+            if status_updater is not None:
+                deferred.append(final_status)
+            elif is_noop_status(applicant_record["status"], final_status):
+                result["status_updated"] = True
+                result["skipped_actions"].append("status_update")
+            else:
+                result["status_updated"] = bool(perform(
+                    "status_update",
+                    lambda: client.update_candidate_status(
+                        job_id, applicant_record["candidate_id"], final_status
+                    ) is not None,
+                    detail=final_status,
+                    idempotent=True
+                ))
 
-    # 1️⃣ Extract number of years from text like "4 years"
-    years = 0
-    match = re.search(r"\d+", str(experience_text))
-    if match:
-        years = int(match.group())
-
-    # 2️⃣ Apply rules
-    if (
-        years >= 1
-        and drivers_license.strip().lower() == "yes"
-        and drug_screen.strip().lower() == "yes"
-        and criminal_record.strip().lower() == "no"
-    ):
-        return "Candidate"   # Advance
+    except Exception as e:
+        result["outcome"] = result["outcome"] or "error"
+        result["error"] = str(e)
+
+    def mark_screened():
+        # Incomplete candidates are evaluated again on later runs, once they
+        # have finished their application; the incomplete_email action guard
+        # keeps them from getting the reminder twice.
+        if (
+            ledger is not None
+            and result["outcome"] in ("Candidate", "Inactive")
+            and not result["error"]
+            and not held_elsewhere
+            and result["email_sent"] is not False
+        ):
+            if result["email_queued"] and result["outcome"] == "Inactive":
+                result["pending_delivery"] = True
+                return
+            ledger.record(
+                job_id, candidate_id, "screened", True,
+                detail=result["outcome"], candidate_job_id=result["candidate_job_id"]
+            )
+
+    def status_applied(outcome):
+        result["status_updated"] = outcome["outcome"] in ("updated", "unchanged", "already_done")
+        if outcome["outcome"] != "updated":
+            result["skipped_actions"].append("status_update")
+        if outcome["outcome"] == "held":
+            held_elsewhere.append("status_update")
+        if outcome["outcome"] == "failed":
+            result["error"] = outcome["error"] or "Status update failed"
+        mark_screened()
+
+    if deferred and not result["error"]:
+        # The candidate only counts as screened once its status is written
+        status_updater.add(
+            job_id, candidate_id, deferred[0],
+            current_status=applicant_record["status"],
+            candidate_job_id=result["candidate_job_id"],
+            callback=status_applied
+        )
     else:
-        return "Inactive"
+        mark_screened()
 
+    metrics.inc("candidates_total", outcome=result["outcome"] if not result["error"] else "error")
+    return result
 
-def update_candidate_status(jwt_token, job_id, candidate_id, status):
+
+def confirm_email_delivery(outbox, job_id, results, ledger=None):
     """
-    Update candidate status in Hireology.
+    Outcome of the rejection emails a screen_job run queued, once the
+    dispatcher has stopped. Delivered emails set result["email_sent"] and
+    mark the candidate screened in the ledger; emails the outbox gave up on
+    ("failed") or that may not have gone out ("unknown") set
+    result["email_sent"] = False and result["error"], so the candidate is
+    reported and the watermark stays below it.
+    """
+    for result in results:
+        if not result["pending_delivery"]:
+            continue
+        candidate_id = result["candidate_id"]
+        status = outbox.status_of(outbox_dedupe_key(job_id, candidate_id, "rejection"))
+        if status == "sent":
+            result["email_sent"] = True
+            result["pending_delivery"] = False
+            if ledger is not None:
+                ledger.record(
+                    job_id, candidate_id, "screened", True,
+                    detail=result["outcome"], candidate_job_id=result["candidate_job_id"]
+                )
+        elif status in DEAD_LETTER_STATUSES:
+            result["email_sent"] = False
+            result["pending_delivery"] = False
+            result["error"] = f"Rejection email {status}, see EmailOutbox.dead_letters()"
+
+
+def screen_job(
+    jwt_token,
+    job_id,
+    max_workers=8,
+    page_size=50,
+    client=None,
+    document_cache=None,
+    state=None,
+    exporter=None,
+    outbox=None,
+    email_workers=2,
+    status_batch_size=50
+):
     """
+    Screen every applicant of a job concurrently.
 
-    url = f"https://api.hireology.com/v2/jobs/{job_id}/candidates/{candidate_id}"
+    The whole listing is read first (screening moves candidates out of the
+    "Applicant" filter it pages through), then handed to a bounded thread
+    pool, so document fetches, emails and status updates of different candidates
+    overlap. At most 2 * max_workers candidates are queued at any time.
+    Status changes are collected by a StatusUpdater and written in batches,
+    skipping candidates whose status already matches; a candidate's result
+    is complete once the updater has been closed at the end of the run.
 
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Content-Type": "application/json",
-        "Accept": "*/*"
-    }
+    With a ScreeningState the run is incremental: only candidates newer than
+    the job's stored applied_at watermark are screened, paging stops as soon
+    as the watermark is reached, and the watermark is advanced afterwards.
+    The same state serves as the side-effect ledger (see screen_candidate).
 
-    payload = {
-        "status": status
-    }
+    :param jwt_token: JWT access token (string)
+    :param job_id: Job ID (string or int)
+    :param max_workers: Number of candidates processed concurrently
+    :param page_size: Page size used when listing candidates
+    :param client: Optional HireologyClient; one sized to max_workers is created otherwise
+    :param document_cache: Optional DocumentCache used by the created client
+    :param state: Optional ScreeningState enabling incremental mode and the ledger
+    :param exporter: Optional RecordExporter receiving every built record
+    :param outbox: Optional EmailOutbox; emails are then queued and delivered by
+                   email_workers background threads while screening continues
+    :param email_workers: Number of outbox delivery threads
+    :param status_batch_size: Status changes coalesced before their PUTs are
+                              pipelined (see status_updates.StatusUpdater)
+    :return: list of per-candidate result dicts (see screen_candidate)
+    """
+    owns_client = client is None
+    if owns_client:
+        client = HireologyClient(
+            jwt_token, pool_size=2 * max_workers + (email_workers if outbox is not None else 0),
+            document_cache=document_cache
+        )
+
+    status_updater = StatusUpdater(
+        client, max_workers=max_workers, batch_size=status_batch_size, ledger=state
+    )
+    dispatcher = None
+    if outbox is not None:
+        dispatcher = OutboxDispatcher(client, outbox, workers=email_workers).start()
+
+    def stop_dispatcher():
+        nonlocal dispatcher
+        stopping, dispatcher = dispatcher, None
+        stopping.stop()
+        print(
+            f"📧 Emails sent: {stopping.sent}, failed attempts: {stopping.failed}, "
+            f"outcome unknown: {stopping.unknown}"
+        )
+
+    results = []
+    in_flight = set()
 
-    response = requests.put(url, headers=headers, json=payload, timeout=30)
+    def collect(done):
+        results.extend(future.result() for future in done)
 
-    print(f"🔄 Updating status to '{status}'")
-    print(f"Status Code: {response.status_code}")
-    print(f"📄 Response: {response.text}")
+    watermark = state.get_watermark(job_id) if state is not None else None
+    candidates = client.iter_candidates(job_id, page_size=page_size)
+    if state is not None:
+        candidates = iter_new_candidates(candidates, watermark)
+    # The listing is filtered on status "Applicant": read it to the end before
+    # any status changes, or later candidates shift onto pages already read
+    candidates = list(candidates)
 
-    response.raise_for_status()
-    return response.json()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for candidate in candidates:
+                if len(in_flight) >= 2 * max_workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                in_flight.add(executor.submit(
+                    screen_candidate, client, job_id, candidate["id"],
+                    candidate.get("applied_at"), state, exporter, outbox, status_updater
+                ))
+
+            done, in_flight = wait(in_flight)
+            collect(done)
+
+        # Deferred status changes (and email deliveries) complete the results:
+        # report them only once the updater and the dispatcher are done
+        status_outcomes = status_updater.close()
+        if dispatcher is not None:
+            stop_dispatcher()
+            confirm_email_delivery(outbox, job_id, results, state)
+
+        for result in results:
+            if result["error"]:
+                print(f"❌ {result['candidate_id']}: {result['error']}")
+            else:
+                print(f"✅ {result['candidate_id']}: {result['outcome']}")
+        print(f"🔄 Status updates: {count_outcomes(status_outcomes)}")
+
+        if state is not None:
+            state.set_watermark(job_id, advance_watermark(watermark, results))
+    finally:
+        status_updater.close()
+        if dispatcher is not None:
+            stop_dispatcher()
+        if owns_client:
+            client.close()
+
+    return results
 
 
 # Example usage:
@@ -549,111 +752,28 @@ if __name__ == "__main__":
             
     job_id = "2606114"
     
-    # Step 1: Get all candidates
-    print("🔍 Fetching candidates...")
-    candidates = get_candidates(jwt_token=jwt, job_id=job_id)
-    print("candidates:", candidates)
-    applicant_ids = extract_applicant_ids(candidates)
-    print(f"✅ Found {len(applicant_ids)} applicants: {applicant_ids}")
-    
-    # Step 2: Get the first applicant's documents
-    CANDIDATE_ID = applicant_ids[0]
-    print(f"\n📄 Fetching documents for candidate {CANDIDATE_ID}...")
-    
-    documents = get_candidate_documents(
-        jwt_token=jwt,
-        job_id=job_id,
-        candidate_id=CANDIDATE_ID,
-        transfer=False
-    )
-
-    if documents is None:
-        print("❌ Failed to fetch documents")
-        exit(1)
-
-    print("✅ Documents fetched successfully")
-    print(documents)
-    candidate_job_id = documents[0].get("id")
-    
-    # Step 3: Use documents directly (already parsed JSON)
-    application_data = documents
-    
-    # Step 4: Build the record
-    print("\n📊 Building applicant record...")
-    applicant_record = build_single_applicant_record(application_data)
-    
-    # Step 5: Write to CSV
-    write_single_record_to_csv(applicant_record, "basil_khan_application.csv")
-    
-    # Step 6: Print all fields to verify
-    print("\n📋 All fields extracted:")
-    for key, value in applicant_record.items():
-        print(f"  {key}: {value}")
-    
-    # Step 7: Check for incomplete questions
-    print("\n🔍 Checking for incomplete questions...")
-    incomplete_questions = get_incomplete_questions(applicant_record)
-
-    if incomplete_questions:
-        print(f"⚠️  Incomplete application detected - {len(incomplete_questions)} missing answers")
-        print("\n📝 Missing questions:")
-        for q in incomplete_questions:
-            print(f"   - {q}")
-
-        print("\n📧 Sending reminder email to applicant...")
-
-        email_sent = send_incomplete_application_email(
-            jwt_token=jwt,
-            candidate_job_id=candidate_job_id,
-            candidate_email=applicant_record["email"],
-            job_id=job_id,
-            job_name=applicant_record["job_name"],
-            incomplete_questions=incomplete_questions
+    # Screen every applicant of the job concurrently
+    print("🔍 Screening candidates...")
+    state = ScreeningState()
+    outbox = EmailOutbox()
+    with RecordExporter("application_answers.csv") as exporter:
+        results = screen_job(
+            jwt_token=jwt, job_id=job_id, max_workers=8, state=state, exporter=exporter,
+            outbox=outbox
         )
 
-        if email_sent:
-            print("✅ Email sent successfully")
-        else:
-            print("❌ Email sending failed")
-        
-        # Don't process further if application is incomplete
-        print("\n⏹️  Stopping processing - application is incomplete")
-        exit(0)
-
-    else:
-        print("✅ Application is complete. Proceeding with evaluation...")
-    
-    # Step 8: Decide candidate status (only if application is complete)
-    final_status = decide_candidate_status(applicant_record)
-    print(f"\n🎯 Final Decision: {final_status}")
-
-    # Step 9: Send rejection email if Inactive
-    if final_status == "Inactive":
-        rejection_reason = get_rejection_reason(applicant_record)
-        print(f"\n📧 Sending rejection email... Reason: {rejection_reason}")
-
-        email_sent = send_rejection_email(
-            jwt_token=jwt,
-            candidate_job_id=candidate_job_id,
-            candidate_email=applicant_record["email"],
-            job_name=applicant_record["job_name"],
-            rejection_reason=rejection_reason
-        )
-
-        if email_sent:
-            print("✅ Rejection email sent successfully")
-        else:
-            print("❌ Failed to send rejection email")
-
-    # Step 10: Update status in Hireology
-    print(f"\n🔄 Updating candidate status to '{final_status}'...")
-    update_response = update_candidate_status(
-        jwt_token=jwt,
-        job_id=job_id,
-        candidate_id=applicant_record["candidate_id"],
-        status=final_status
-    )
-
-    print("✅ Candidate status updated successfully")
-    
-    print("\n🎉 Processing complete!")
\ No newline at end of file
+    print(f"\n📊 Screened {len(results)} applicants")
+    for outcome, count in count_outcomes(results).items():
+        print(f"   - {outcome}: {count}")
+    print(f"📧 Outbox: {outbox.counts()}")
+
+    # Set METRICS_PROMETHEUS_PATH / METRICS_JSONL_PATH to collect per-stage timings
+    if metrics.enabled:
+        print("\n⏱️  Timings:")
+        for line in metrics.summary_lines():
+            print(f"   - {line}")
+        path = export_metrics()
+        if path:
+            print(f"✅ Metrics written to: {path}")
+
+    print("\n🎉 Processing complete!")
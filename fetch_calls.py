@@ -176,23 +176,75 @@
 # ///////////////
 import requests
 import json
-from datetime import datetime
+from datetime import datetime, date, timedelta
 import os
-import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from hireology_client import iter_pages
+from rate_limit import default_limiter, request_with_retry
+from transcripts import segment_transcript
+
+# Override with LEADCONNECTOR_BASE_URL, e.g. to use mock_api_server.py
+LEADCONNECTOR_BASE_URL = os.environ.get(
+    "LEADCONNECTOR_BASE_URL", "https://services.leadconnectorhq.com"
+)
+
+
+def split_date_range(start_date, end_date, window_days=7):
+    """
+    Split an inclusive YYYY-MM-DD range into consecutive, non-overlapping
+    windows of at most window_days days: [(start, end), ...]
+    """
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    if end < start:
+        raise ValueError(f"end_date {end_date} is before start_date {start_date}")
+
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end + timedelta(days=1)
+    return windows
+
 
 class VoiceAIExtractor:
-    def __init__(self, api_key, location_id):
+    def __init__(self, api_key, location_id, limiter=default_limiter, max_retries=5, base_url=LEADCONNECTOR_BASE_URL):
         self.api_key = api_key
         self.location_id = location_id
-        self.base_url = "https://services.leadconnectorhq.com"
+        self.base_url = base_url.rstrip("/")
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "Version": "2021-07-28"
         }
+        self.session = requests.Session()
+        self.limiter = limiter
+        self.max_retries = max_retries
     
-    def get_call_logs(self, agent_id=None):
-        """Retrieve call logs from Voice AI"""
+    def get_call_logs(self, agent_id=None, start_date=None, end_date=None, page=1, page_size=None):
+        """
+        Retrieve one page of call logs from Voice AI
+
+        Args:
+            agent_id: Optional - Filter by specific agent ID
+            start_date: Optional - Start date (YYYY-MM-DD)
+            end_date: Optional - End date (YYYY-MM-DD)
+            page: Page number for pagination (default: 1)
+            page_size: Optional - Call logs per page
+        """
+        try:
+            return self.fetch_call_log_page(agent_id, start_date, end_date, page, page_size)
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching call logs: {e}")
+            if hasattr(e.response, 'text'):
+                print(f"Response: {e.response.text}")
+            return None
+
+    def fetch_call_log_page(self, agent_id=None, start_date=None, end_date=None, page=1, page_size=None):
+        """get_call_logs that raises on HTTP errors instead of returning None"""
         url = f"{self.base_url}/voice-ai/dashboard/call-logs"
         
         params = {
@@ -201,57 +253,125 @@ class VoiceAIExtractor:
         
         if agent_id:
             params["agentId"] = agent_id
-        
+        if start_date:
+            params["startDate"] = start_date
+        if end_date:
+            params["endDate"] = end_date
+        if page > 1:
+            params["page"] = page
+        if page_size:
+            params["pageSize"] = page_size
+        
+        response = request_with_retry(
+            self.session, "GET", url,
+            limiter=self.limiter, max_retries=self.max_retries,
+            headers=self.headers, params=params, timeout=30
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def iter_call_logs(self, agent_id=None, start_date=None, end_date=None, page_size=50, prefetch=True):
+        """
+        Yield every call log of a date range, walking all pages.
+
+        The next page is fetched in the background while the current one is
+        consumed (prefetch). Paging stops at the response's total, or at the
+        first short page when the API does not send one.
+        """
+        def fetch_page(page, size):
+            return self.fetch_call_log_page(agent_id, start_date, end_date, page, size)
+
+        return iter_pages(fetch_page, page_size, prefetch=prefetch, items_key="callLogs")
+
+    def harvest_call_logs(
+        self,
+        start_date,
+        end_date,
+        agent_id=None,
+        window_days=7,
+        max_workers=4,
+        page_size=50
+    ):
+        """
+        Stream all call logs between start_date and end_date (YYYY-MM-DD,
+        inclusive), splitting the range into window_days sub-windows whose
+        pages are fetched concurrently by max_workers threads.
+
+        Call logs are yielded as pages arrive, so windows interleave and the
+        overall order is not chronological; duplicates across windows are
+        dropped. Stopping the iteration early stops the workers.
+        """
+        windows = split_date_range(start_date, end_date, window_days)
+        pages = queue.Queue(maxsize=2 * max_workers)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def harvest_window(window):
+            if stop.is_set():
+                return  # already cancelled: do not fetch even the first page
+            try:
+                for call in self.iter_call_logs(agent_id, window[0], window[1], page_size, prefetch=False):
+                    if stop.is_set():
+                        return
+                    put(call)
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        for window in windows:
+            executor.submit(harvest_window, window)
+
+        seen = set()
+        remaining = len(windows)
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching call logs: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            return None
+            while remaining:
+                item = pages.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                elif item.get("id") not in seen:
+                    seen.add(item.get("id"))
+                    yield item
+        finally:
+            stop.set()
+            # Windows that have not started are dropped instead of run
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def save_call_logs(self, call_logs, filename=None):
+        """
+        Stream call logs into call_data/call_logs_<timestamp>.json (the same
+        shape as the API response). Returns (filename, number of call logs).
+        """
+        os.makedirs('call_data', exist_ok=True)
+        filename = filename or f"call_data/call_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+        total = 0
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('{"callLogs": [\n')
+            for call in call_logs:
+                if total:
+                    f.write(',\n')
+                json.dump(call, f, ensure_ascii=False)
+                total += 1
+            f.write(f'\n], "total": {total}}}\n')
+
+        print(f"✅ {total} call logs saved to: {filename}")
+        return filename, total
     
     def parse_transcript(self, transcript):
         """Parse transcript to extract bot questions and human answers"""
-        lines = transcript.split('\n')
-        
-        qa_pairs = []
-        current_question = []
-        current_answer = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('bot:'):
-                # If we have a previous Q&A pair, save it
-                if current_question and current_answer:
-                    qa_pairs.append({
-                        'question': ' '.join(current_question),
-                        'answer': ' '.join(current_answer)
-                    })
-                    current_answer = []
-                
-                # Start new question
-                question_text = line[4:].strip()  # Remove 'bot:' prefix
-                current_question.append(question_text)
-                
-            elif line.startswith('human:'):
-                # Add to current answer
-                answer_text = line[6:].strip()  # Remove 'human:' prefix
-                if answer_text:  # Only add non-empty answers
-                    current_answer.append(answer_text)
-        
-        # Add the last Q&A pair if exists
-        if current_question and current_answer:
-            qa_pairs.append({
-                'question': ' '.join(current_question),
-                'answer': ' '.join(current_answer)
-            })
-        
-        return qa_pairs
+        return segment_transcript(transcript)
     
     def extract_recent_call_qa(self, agent_id=None):
         """Extract Q&A from the most recent call"""
@@ -332,8 +452,30 @@ if __name__ == "__main__":
     LOCATION_ID = "M5jnxd1r8yq3o5gxSYOP" 
     AGENT_ID = "693448f6231659c2a32a3bca" 
     
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extract Voice AI call logs")
+    parser.add_argument("--start", help="harvest all call logs from this date (YYYY-MM-DD)")
+    parser.add_argument("--end", help="harvest up to this date, inclusive (default: today)")
+    parser.add_argument("--agent", default=AGENT_ID, help="agent ID to filter by")
+    parser.add_argument("--window-days", type=int, default=7, help="days per concurrently fetched window")
+    parser.add_argument("--workers", type=int, default=4, help="windows fetched at once")
+    parser.add_argument("--output", help="output file (default: call_data/call_logs_<timestamp>.json)")
+    args = parser.parse_args()
+
     # Initialize extractor
     extractor = VoiceAIExtractor(API_KEY, LOCATION_ID)
     
-    # Extract Q&A from most recent call
-    qa_pairs = extractor.extract_recent_call_qa(agent_id=AGENT_ID)
\ No newline at end of file
+    if args.start:
+        # Harvest every call log in the date range
+        call_logs = extractor.harvest_call_logs(
+            args.start,
+            args.end or date.today().isoformat(),
+            agent_id=args.agent,
+            window_days=args.window_days,
+            max_workers=args.workers
+        )
+        extractor.save_call_logs(call_logs, args.output)
+    else:
+        # Extract Q&A from most recent call
+        qa_pairs = extractor.extract_recent_call_qa(agent_id=args.agent)
\ No newline at end of file
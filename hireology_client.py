@@ -0,0 +1,318 @@
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+
+from email_templates import (
+    INCOMPLETE_APPLICATION_SUBJECT,
+    REJECTION_SUBJECT,
+    render_incomplete_application_email,
+    render_rejection_email,
+)
+from metrics import metrics
+from rate_limit import default_limiter, request_with_retry
+
+
+# Override with HIREOLOGY_BASE_URL to point every client at another server,
+# e.g. the local stand-in from mock_api_server.py
+HIREOLOGY_BASE_URL = os.environ.get("HIREOLOGY_BASE_URL", "https://api.hireology.com")
+
+CANDIDATE_LIST_PARAMS = {
+    "filter[status]": "Applicant",
+    "sort_dir": "desc",
+    "sort_step_id": "",
+    "sort": "date",
+}
+
+
+def get_next_page(response_json, page, page_size, items_key="data"):
+    """
+    Work out the next page number from a paginated response.
+
+    Uses the pagination metadata when the API sends it ("meta", "links" or a
+    top-level "total"), otherwise falls back to "a short page is the last page".
+    Returns None when there are no more pages.
+    """
+    meta = response_json.get("meta") or {}
+    links = response_json.get("links") or {}
+
+    if "next" in links:
+        return page + 1 if links["next"] else None
+
+    total_pages = meta.get("total_pages") or meta.get("last_page")
+    if total_pages is not None:
+        return page + 1 if page < int(total_pages) else None
+
+    total = meta.get("total") or meta.get("total_count") or response_json.get("total")
+    if total is not None:
+        return page + 1 if page * page_size < int(total) else None
+
+    if len(response_json.get(items_key) or []) < page_size:
+        return None
+    return page + 1
+
+
+def iter_pages(fetch_page, page_size, prefetch=True, items_key="data"):
+    """
+    Yield the items of every page returned by fetch_page(page, page_size).
+
+    With prefetch enabled the next page is downloaded in a background thread
+    while the caller consumes the current one.
+    """
+    if not prefetch:
+        page = 1
+        while page is not None:
+            response_json = fetch_page(page, page_size)
+            yield from response_json.get(items_key) or []
+            page = get_next_page(response_json, page, page_size, items_key)
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = 1
+        pending = executor.submit(fetch_page, page, page_size)
+        while pending is not None:
+            response_json = pending.result()
+            next_page = get_next_page(response_json, page, page_size, items_key)
+            pending = (
+                executor.submit(fetch_page, next_page, page_size)
+                if next_page is not None else None
+            )
+            page = next_page
+            yield from response_json.get(items_key) or []
+
+
+def build_incomplete_application_email(job_name, incomplete_questions):
+    """
+    Build the HTML body of the incomplete application email.
+    """
+    return render_incomplete_application_email(job_name, incomplete_questions)[1]
+
+
+def build_rejection_email(job_name, rejection_reason):
+    """
+    Build the HTML body of the rejection email.
+    """
+    return render_rejection_email(job_name, rejection_reason)[1]
+
+
+def build_email_form(candidate_job_id, email_to, subject, body, job_id):
+    """
+    Build the form fields expected by /v2/emails/send_single_email.
+    """
+    return {
+        "candidate_job_ids[]": str(candidate_job_id),
+        "user[email_to]": email_to,
+        "user[email_subject]": subject,
+        "user[email_body]": body,
+        "job_id": str(job_id),
+        "email_type": "custom"
+    }
+
+
+class HireologyClient:
+    """
+    Hireology API client sharing one pooled keep-alive session across calls.
+
+    Auth headers, timeouts and the connection pool are set up once, so
+    repeated calls reuse open TCP/TLS connections instead of reconnecting.
+    The client is thread-safe for the calls below and can be shared by a
+    thread pool; size pool_size to the number of worker threads.
+
+    All calls go through the per-host rate limiter and are retried on 429 /
+    5xx (see rate_limit.request_with_retry); pass limiter=None to disable.
+    Pass a DocumentCache to serve unchanged candidate documents from disk.
+    """
+
+    def __init__(
+        self,
+        jwt_token,
+        base_url=HIREOLOGY_BASE_URL,
+        pool_size=10,
+        timeout=30,
+        limiter=default_limiter,
+        max_retries=5,
+        document_cache=None
+    ):
+        self.jwt_token = jwt_token
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.document_cache = document_cache
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {jwt_token}",
+            "Accept": "application/json",
+            "Connection": "keep-alive"
+        })
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying session and its pooled connections"""
+        self.session.close()
+
+    def request(self, method, path, **kwargs):
+        """Send a rate-limited, retried request relative to the base URL"""
+        kwargs.setdefault("timeout", self.timeout)
+        return request_with_retry(
+            self.session, method, f"{self.base_url}{path}",
+            limiter=self.limiter, max_retries=self.max_retries, **kwargs
+        )
+
+    # ---------------- CANDIDATES ----------------
+
+    def get_candidates(self, job_id, page_size=10, page=1):
+        """
+        Fetch a single page of candidates for a specific job.
+        """
+        params = dict(CANDIDATE_LIST_PARAMS, page_size=page_size, page=page)
+
+        with metrics.span("list_candidates"):
+            response = self.request("GET", f"/v2/jobs/{job_id}/candidates", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def iter_candidates(self, job_id, page_size=50, prefetch=True):
+        """
+        Yield every candidate for a job, walking all pages of the candidates endpoint.
+        """
+        def fetch_page(page, size):
+            return self.get_candidates(job_id, page_size=size, page=page)
+
+        return iter_pages(fetch_page, page_size, prefetch=prefetch)
+
+    def get_candidate_documents(self, job_id, candidate_id, transfer=False):
+        """
+        Fetch all documents for a candidate.
+        Returns the parsed JSON, or None if the request failed.
+        """
+        path = f"/v2/jobs/{job_id}/candidates/{candidate_id}/documents/all_documents"
+        params = {
+            "transfer": str(transfer).lower()  # API expects true/false as string
+        }
+
+        cached = None
+        headers = {}
+        if self.document_cache is not None:
+            cached = self.document_cache.get(job_id, candidate_id, transfer)
+            if cached is not None and cached.fresh:
+                return cached.payload
+            if cached is not None:
+                headers = cached.conditional_headers()
+
+        try:
+            response = self.request("GET", path, params=params, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                self.document_cache.touch(job_id, candidate_id, transfer)
+                return cached.payload
+
+            response.raise_for_status()
+            payload = response.json()
+
+            if self.document_cache is not None:
+                self.document_cache.put(
+                    job_id, candidate_id, response.content, transfer,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified")
+                )
+            return payload
+
+        except requests.exceptions.HTTPError as http_err:
+            # Status and latency are in the http metrics; no response bodies in logs
+            metrics.inc("document_fetch_failures_total", reason=http_err.response.status_code)
+            print(f"HTTP Error: {http_err}")
+        except Exception as err:
+            metrics.inc("document_fetch_failures_total", reason=type(err).__name__)
+            print(f"Error: {err}")
+
+        return None
+
+    # ---------------- EMAILS ----------------
+
+    def send_email(self, candidate_job_id, email_to, subject, body, job_id):
+        """
+        Send a custom single email through Hireology.
+        Returns the HTTP response.
+        """
+        data = build_email_form(candidate_job_id, email_to, subject, body, job_id)
+
+        # Form-encoded body: let requests set Content-Type
+        return self.request(
+            "POST", "/v2/emails/send_single_email",
+            headers={"Accept": "*/*"}, data=data
+        )
+
+    def send_incomplete_application_email(
+        self,
+        candidate_job_id,
+        candidate_email,
+        job_id,
+        job_name,
+        incomplete_questions
+    ):
+        """
+        Send incomplete application email to candidate.
+        Returns True if successful, False otherwise.
+        """
+        email_body = build_incomplete_application_email(job_name, incomplete_questions)
+
+        try:
+            response = self.send_email(
+                candidate_job_id,
+                candidate_email,
+                INCOMPLETE_APPLICATION_SUBJECT,
+                email_body,
+                job_id
+            )
+
+            return response.status_code == 200
+
+        except Exception as e:
+            print(f"❌ Email sending failed with exception: {e}")
+            return False
+
+    def send_rejection_email(self, candidate_job_id, candidate_email, job_name, rejection_reason):
+        """
+        Send rejection email to candidate.
+        Returns True if successful, False otherwise.
+        """
+        email_body = build_rejection_email(job_name, rejection_reason)
+
+        try:
+            response = self.send_email(
+                candidate_job_id,
+                candidate_email,
+                REJECTION_SUBJECT,
+                email_body,
+                candidate_job_id
+            )
+
+            return response.status_code == 200
+
+        except Exception as e:
+            print(f"❌ Rejection email sending failed with exception: {e}")
+            return False
+
+    # ---------------- STATUS ----------------
+
+    def update_candidate_status(self, job_id, candidate_id, status):
+        """
+        Update candidate status in Hireology.
+        """
+        response = self.request(
+            "PUT", f"/v2/jobs/{job_id}/candidates/{candidate_id}",
+            headers={"Accept": "*/*"}, json={"status": status}
+        )
+
+        response.raise_for_status()
+        return response.json()
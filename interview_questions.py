@@ -0,0 +1,268 @@
+import json
+import math
+import os
+import threading
+
+from question_index import normalize_question
+
+
+# Minimum cosine similarity for an extracted question to map to a canonical one
+MIN_SCORE = 0.35
+
+# Canonical interview questions of the Voice AI screening script:
+# question ID -> known wordings (the script's own first)
+INTERVIEW_QUESTIONS = {
+    "background": [
+        "Can you tell me a little about your background and experience as a care professional?",
+        "Have you worked as a caregiver before, and what kind of work have you done?",
+    ],
+    "motivation": [
+        "What motivated you to become a care professional?",
+        "What motivated you to become a caregiver? Was it a personal experience or something else that inspired you?",
+    ],
+    "certifications": [
+        "Do you have any certifications or specialized training such as CNA, MA, CPR, or others?",
+    ],
+    "caregiving_tasks": [
+        "Can you name a few caregiving tasks you have experience with?",
+        "Can you share a few caregiving tasks you've done before? Meal preparation, medication reminders, "
+        "companionship or assisting with mobility.",
+    ],
+    "personal_care": [
+        "Do you have experience with tasks such as bathing, dressing, and toileting clients?",
+    ],
+    "availability": [
+        "Do you currently have another job? What is your general availability?",
+        "What's your general availability for this role?",
+    ],
+    "schedule_flexibility": [
+        "How flexible is your schedule? Are you available for overnights or weekend shifts if needed?",
+    ],
+    "transportation": [
+        "Do you have reliable transportation to reach clients' homes? And is this your own vehicle?",
+    ],
+    "drivers_license": [
+        "Do you have a valid driver's license?",
+    ],
+    "years_experience": [
+        "How many years of caregiving experience do you have?",
+    ],
+    "why_agency": [
+        "Why do you want to work for our home care agency specifically?",
+    ],
+    "hoyer_lift": [
+        "Do you have experience using a Hoyer Lift or Stand Assist, whether manual or electric?",
+    ],
+    "gait_belt": [
+        "Do you have experience using a gait belt? Assisting clients with mobility or transfers?",
+    ],
+    "hospice": [
+        "Have you worked with hospice clients before?",
+    ],
+}
+
+# Apostrophes are dropped before normalizing, so "what's" / "you’ve"
+# become the single tokens "whats" / "youve" rather than "what s" / "you ve"
+_APOSTROPHES = str.maketrans("", "", "'\u2019")
+
+# Words that say nothing about which question was asked
+STOPWORDS = frozenset(
+    "a an and any are as be before can could do does for from have how i if in is it its like "
+    "me of on or our so such that the this to was what whats with would you your youve "
+    "example things anything else similar others just first now next".split()
+)
+
+
+def tokenize(text):
+    """
+    Content words of a question: normalized, stopwords dropped and a plural
+    "s" stripped ("clients" -> "client"), so rewordings share tokens.
+    """
+    tokens = []
+    for token in normalize_question(str(text).translate(_APOSTROPHES)).split():
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _term_frequencies(tokens):
+    counts = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+class InterviewQuestionIndex:
+    """
+    Maps the free-form questions the Voice AI agent asked to canonical
+    interview question IDs.
+
+    Every wording of every canonical question is turned into a TF-IDF vector
+    once, when the index is built, and stored in an inverted index
+    (token -> [(wording, question ID, weight)]). Matching a question only visits the
+    postings of its own tokens, so its cost does not grow with the number of
+    calls or of pairwise comparisons; the best cosine similarity per question
+    ID is the confidence. Words the script never uses get the highest IDF and
+    lower the confidence of the match.
+
+    Results are cached per question text, as the agent repeats the same
+    rephrasings across calls.
+    """
+
+    def __init__(self, questions=None, min_score=MIN_SCORE):
+        self.questions = INTERVIEW_QUESTIONS if questions is None else questions
+        self.min_score = min_score
+        self._build()
+        self._matched = {}
+        self._lock = threading.Lock()
+
+    def _build(self):
+        documents = [
+            (question_id, _term_frequencies(tokenize(wording)))
+            for question_id, wordings in self.questions.items()
+            for wording in wordings
+        ]
+        document_frequency = {}
+        for _, counts in documents:
+            for token in counts:
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+
+        total = len(documents)
+        self.idf = {
+            token: math.log((1 + total) / (1 + frequency)) + 1
+            for token, frequency in document_frequency.items()
+        }
+        self.unknown_idf = math.log(1 + total) + 1
+
+        # token -> [(document number, question ID, weight)]
+        self.postings = {}
+        for number, (question_id, counts) in enumerate(documents):
+            vector = {token: count * self.idf[token] for token, count in counts.items()}
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            for token, weight in vector.items():
+                self.postings.setdefault(token, []).append((number, question_id, weight / norm))
+
+    def _vector(self, tokens):
+        vector = {
+            token: count * self.idf.get(token, self.unknown_idf)
+            for token, count in _term_frequencies(tokens).items()
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        return {token: weight / norm for token, weight in vector.items()} if norm else {}
+
+    def _match(self, question):
+        scores = {}
+        owners = {}
+        for token, weight in self._vector(tokenize(question)).items():
+            for number, question_id, document_weight in self.postings.get(token, ()):
+                scores[number] = scores.get(number, 0.0) + weight * document_weight
+                owners[number] = question_id
+
+        best_id, best_score = None, 0.0
+        for number, score in scores.items():
+            if score > best_score:
+                best_id, best_score = owners[number], score
+        best_score = round(min(best_score, 1.0), 4)
+        return (best_id if best_score >= self.min_score else None), best_score
+
+    def match(self, question):
+        """
+        Canonical question ID for an extracted question plus the confidence
+        (cosine similarity, 0..1). The ID is None below min_score.
+        """
+        try:
+            return self._matched[question]
+        except KeyError:
+            pass
+        result = self._match(question)
+        with self._lock:
+            self._matched[question] = result
+        return result
+
+    def label_pairs(self, qa_pairs):
+        """Copy of parse_transcript's Q&A pairs with question_id and score added"""
+        labeled = []
+        for qa in qa_pairs:
+            question_id, score = self.match(qa["question"])
+            labeled.append({**qa, "question_id": question_id, "score": score})
+        return labeled
+
+
+def answer_matrix(calls, index=None, parse=None):
+    """
+    calls x questions answer matrix: one row per call (indexed by call ID),
+    one column per canonical question ID, holding the candidate's answer.
+
+    :param calls: iterable of call-log dicts with "id" and "transcript"
+    :param index: InterviewQuestionIndex, defaults to get_interview_index()
+    :param parse: transcript -> Q&A pairs, defaults to transcripts.segment_transcript
+    :return: pandas DataFrame, missing answers as NaN
+
+    When a question was asked again (the candidate asked for a repeat),
+    the last answer wins.
+    """
+    import pandas as pd
+
+    if index is None:
+        index = get_interview_index()
+    if parse is None:
+        from transcripts import segment_transcript as parse
+
+    call_ids, rows = [], []
+    for call in calls:
+        answers = {}
+        for qa in parse(call.get("transcript") or ""):
+            question_id, _ = index.match(qa["question"])
+            if question_id is not None:
+                answers[question_id] = qa["answer"]
+        call_ids.append(call["id"])
+        rows.append(answers)
+
+    return pd.DataFrame(
+        rows, index=pd.Index(call_ids, name="call_id"), columns=list(index.questions)
+    )
+
+
+def load_interview_index(path):
+    """
+    Load extra wordings from a JSON or YAML file:
+
+        {"<question_id>": ["<wording>", ...], ...}
+
+    Entries extend the built-in questions (new IDs add new questions).
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml  # optional dependency, only needed for YAML question files
+            config = yaml.safe_load(f) or {}
+        else:
+            config = json.load(f)
+
+    questions = {question_id: list(wordings) for question_id, wordings in INTERVIEW_QUESTIONS.items()}
+    for question_id, wordings in config.items():
+        questions.setdefault(question_id, []).extend(wordings)
+    return InterviewQuestionIndex(questions)
+
+
+_default_index = None
+
+
+def get_interview_index():
+    """
+    Process-wide interview question index, built once. Uses the file named by
+    the INTERVIEW_QUESTIONS_PATH environment variable when set.
+    """
+    global _default_index
+    if _default_index is None:
+        path = os.environ.get("INTERVIEW_QUESTIONS_PATH")
+        _default_index = load_interview_index(path) if path else InterviewQuestionIndex()
+    return _default_index
+
+
+def set_interview_index(index):
+    """Replace the process-wide interview question index"""
+    global _default_index
+    _default_index = index
@@ -0,0 +1,274 @@
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+# Histogram buckets (seconds) for stage and HTTP latencies
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments that identify a resource: numbers and long hex / base62 IDs
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F]{16,}|[A-Za-z0-9]{20,})$")
+
+
+def endpoint_template(url):
+    """
+    Collapse IDs in a URL path so calls aggregate per endpoint:
+    ".../v2/jobs/2606114/candidates/47026869" -> "/v2/jobs/{id}/candidates/{id}"
+    """
+    path = urlsplit(str(url)).path
+    return "/".join("{id}" if _ID_SEGMENT.match(s) else s for s in path.split("/"))
+
+
+class _NullSpan:
+    """Span used while metrics are disabled: does nothing, costs nothing"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set(self, **labels):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("metrics", "stage", "labels", "start")
+
+    def __init__(self, metrics, stage, labels):
+        self.metrics = metrics
+        self.stage = stage
+        self.labels = labels
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self.start
+        labels = dict(self.labels, stage=self.stage, result="error" if exc_type else "ok")
+        self.metrics.observe("stage_seconds", seconds, **labels)
+        self.metrics.emit("span", seconds=seconds, **labels)
+        return False
+
+    def set(self, **labels):
+        """Add labels known only inside the span (e.g. the outcome)"""
+        self.labels.update(labels)
+
+
+class Metrics:
+    """
+    In-process counters and latency histograms for the screening pipeline.
+
+    span() times a pipeline stage, record_http() one API call (as sent by
+    rate_limit.request_with_retry), inc() counts decisions and emails.
+    Series are keyed by name plus labels and aggregated in memory; export
+    them with to_prometheus() / write_prometheus(), or set a JSON-lines
+    path to also stream every span and HTTP call as one event per line.
+
+    Disabled (the default) every call returns immediately and span() hands
+    out a shared no-op context manager.
+    """
+
+    def __init__(self, enabled=False, jsonl_path=None):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self._jsonl = None
+        self.jsonl_path = None
+        if jsonl_path:
+            self.open_jsonl(jsonl_path)
+
+    def configure(self, enabled=True, jsonl_path=None):
+        """Enable or disable collection, optionally streaming events to jsonl_path"""
+        self.enabled = enabled
+        if jsonl_path:
+            self.open_jsonl(jsonl_path)
+        return self
+
+    def open_jsonl(self, path):
+        with self.lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+            self._jsonl = open(path, "a", encoding="utf-8")
+            self.jsonl_path = path
+
+    def close(self):
+        with self.lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    # ---------------- RECORDING ----------------
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        """Add value to a counter"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """Record one value (usually seconds) in a histogram"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {
+                    "count": 0, "sum": 0.0, "max": 0.0, "buckets": [0] * len(LATENCY_BUCKETS)
+                }
+            histogram["count"] += 1
+            histogram["sum"] += value
+            histogram["max"] = max(histogram["max"], value)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    histogram["buckets"][i] += 1
+                    break
+
+    def emit(self, event, **fields):
+        """Write one event to the JSON-lines stream, if one is open"""
+        if self._jsonl is None:
+            return
+        line = json.dumps(dict(fields, event=event, ts=round(time.time(), 6)), default=str)
+        with self.lock:
+            if self._jsonl is not None:
+                self._jsonl.write(line + "\n")
+
+    def span(self, stage, **labels):
+        """
+        Time a pipeline stage:
+
+            with metrics.span("fetch_documents"):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, labels)
+
+    def record_http(self, method, url, status, seconds, retries=0, bytes_received=0):
+        """Record one API call; status is the final HTTP status or an error name"""
+        if not self.enabled:
+            return
+        labels = {"method": method.upper(), "endpoint": endpoint_template(url), "status": status}
+        self.observe("http_request_seconds", seconds, **labels)
+        if retries:
+            self.inc("http_retries_total", retries, method=labels["method"], endpoint=labels["endpoint"])
+        if bytes_received:
+            self.inc("http_response_bytes_total", bytes_received,
+                     method=labels["method"], endpoint=labels["endpoint"])
+        self.emit("http", seconds=seconds, retries=retries, bytes=bytes_received, **labels)
+
+    # ---------------- EXPORT ----------------
+
+    def snapshot(self):
+        """Counters and histograms as plain, JSON-serializable dicts"""
+        with self.lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self.counters.items())
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), "count": h["count"],
+                     "sum": h["sum"], "max": h["max"]}
+                    for (name, labels), h in sorted(self.histograms.items())
+                ],
+            }
+
+    @staticmethod
+    def _format_labels(labels, extra=()):
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ""
+        escaped = (
+            '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for k, v in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    def to_prometheus(self, prefix="screening_"):
+        """Render every series in the Prometheus text exposition format"""
+        lines = []
+        with self.lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted((k, dict(h, buckets=list(h["buckets"]))) for k, h in self.histograms.items())
+
+        typed = set()
+        for (name, labels), value in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {prefix}{name} counter")
+                typed.add(name)
+            lines.append(f"{prefix}{name}{self._format_labels(labels)} {value}")
+
+        for (name, labels), h in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {prefix}{name} histogram")
+                typed.add(name)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, h["buckets"]):
+                cumulative += count
+                lines.append(
+                    f"{prefix}{name}_bucket{self._format_labels(labels, [('le', bound)])} {cumulative}"
+                )
+            lines.append(f"{prefix}{name}_bucket{self._format_labels(labels, [('le', '+Inf')])} {h['count']}")
+            lines.append(f"{prefix}{name}_sum{self._format_labels(labels)} {h['sum']:.6f}")
+            lines.append(f"{prefix}{name}_count{self._format_labels(labels)} {h['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix="screening_"):
+        """Write the Prometheus text file (e.g. for node_exporter's textfile collector)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(tmp_path, path)
+
+    def summary_lines(self):
+        """Short per-stage / per-endpoint latency summary for the console"""
+        lines = []
+        with self.lock:
+            items = sorted(self.histograms.items())
+        for (name, labels), h in items:
+            label_text = " ".join(f"{k}={v}" for k, v in labels)
+            mean = h["sum"] / h["count"] if h["count"] else 0.0
+            lines.append(
+                f"{name} {label_text}: n={h['count']} mean={mean * 1000:.1f}ms max={h['max'] * 1000:.1f}ms"
+            )
+        return lines
+
+
+# Process-wide instance used by the pipeline. Enabled by setting
+# METRICS_PROMETHEUS_PATH and/or METRICS_JSONL_PATH, or via configure().
+metrics = Metrics(
+    enabled=bool(os.environ.get("METRICS_PROMETHEUS_PATH") or os.environ.get("METRICS_JSONL_PATH")),
+    jsonl_path=os.environ.get("METRICS_JSONL_PATH"),
+)
+
+
+def export_metrics():
+    """Write the Prometheus file named by METRICS_PROMETHEUS_PATH, if set"""
+    path = os.environ.get("METRICS_PROMETHEUS_PATH")
+    if path and metrics.enabled:
+        metrics.write_prometheus(path)
+    return path
@@ -0,0 +1,473 @@
+"""
+Local stand-in for the Hireology and LeadConnector (Voice AI) APIs.
+
+Serves the endpoints the screening and call-log code uses, with synthetic
+candidates and call logs seeded from the call_data/call_logs_*.json
+fixtures, so throughput, concurrency and retry behavior can be measured
+offline without touching production or sending real emails.
+
+    python mock_api_server.py --port 8765 --latency 0.05 --error-rate 0.01 --throttle-rate 0.02
+    HIREOLOGY_BASE_URL=http://127.0.0.1:8765 LEADCONNECTOR_BASE_URL=http://127.0.0.1:8765 python fetch_applicants.py
+
+GET /__stats returns request counters; POST /__reset clears them and all
+email / status writes.
+"""
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from screening_rules import (
+    CAREGIVER_DESCRIPTION_QUESTION,
+    CRIMINAL_RECORD_QUESTION,
+    DRIVERS_LICENSE_QUESTION,
+    DRUG_SCREEN_QUESTION,
+    EXPERIENCE_QUESTION,
+    SUPERVISOR_QUESTION,
+)
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_APPLICATION = os.path.join(HERE, "basil_khan_application.csv")
+CALL_LOG_FIXTURES = os.path.join(HERE, "call_data", "call_logs_*.json")
+
+# Answer pools for the questions the screening rules look at; every other
+# question of the sample application keeps its sample answer.
+ANSWER_POOLS = {
+    EXPERIENCE_QUESTION: ["0", "1", "2", "3 years", "5", "10+"],
+    DRIVERS_LICENSE_QUESTION: ["yes", "yes", "yes", "no"],
+    DRUG_SCREEN_QUESTION: ["yes", "yes", "yes", "no"],
+    CRIMINAL_RECORD_QUESTION: ["no", "no", "no", "yes"],
+    CAREGIVER_DESCRIPTION_QUESTION: [
+        "CNA at a nursing home, bathing and feeding residents",
+        "Home care aide for an elderly client with dementia",
+        "Retail cashier",
+        "",
+    ],
+    SUPERVISOR_QUESTION: [
+        "John Doe 843-555-0101, Jane Roe 843-555-0102",
+        "Mary Ann (843) 555-0199; Bob Stone (843) 555-0142",
+        "Mr. Smith +16135189745 Mr. Ali +16135189745",
+        "",
+    ],
+}
+
+
+class MockConfig:
+    """Latency and fault injection settings, shared by every request"""
+
+    def __init__(
+        self,
+        latency=0.0,
+        latency_jitter=0.0,
+        error_rate=0.0,
+        throttle_rate=0.0,
+        retry_after=1,
+        seed=None
+    ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def draw(self):
+        """Return (delay seconds, injected status or None) for one request"""
+        with self.lock:
+            delay = self.latency + self.random.uniform(0, self.latency_jitter)
+            roll = self.random.random()
+        if roll < self.throttle_rate:
+            return delay, 429
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, 500
+        return delay, None
+
+
+class MockData:
+    """Synthetic candidates per job plus call logs, generated deterministically"""
+
+    def __init__(self, candidates_per_job=200, calls=None, seed=0):
+        self.candidates_per_job = candidates_per_job
+        self.seed = seed
+        self.questions = self._sample_questions()
+        self.jobs = {}
+        self.statuses = {}
+        self.emails = []
+        self.call_logs = self._load_call_logs(calls)
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _sample_questions():
+        if not os.path.exists(SAMPLE_APPLICATION):
+            return {question: pool[0] for question, pool in ANSWER_POOLS.items()}
+        with open(SAMPLE_APPLICATION, newline="", encoding="utf-8") as f:
+            row = next(csv.DictReader(f))
+        return dict(list(row.items())[12:])
+
+    def candidates(self, job_id):
+        """Candidate list of a job, newest first (as the API sorts by date)"""
+        with self.lock:
+            if job_id not in self.jobs:
+                self.jobs[job_id] = self._generate_job(job_id)
+            return self.jobs[job_id]
+
+    def _generate_job(self, job_id):
+        rng = random.Random(f"{self.seed}:{job_id}")
+        newest = datetime(2025, 12, 20, tzinfo=timezone.utc)
+        base_id = 47000000 + (int(hashlib.sha1(str(job_id).encode()).hexdigest(), 16) % 1000) * 10000
+
+        candidates = []
+        for i in range(self.candidates_per_job):
+            candidate_id = base_id + i
+            applied_at = newest - timedelta(minutes=37 * i + rng.randint(0, 30))
+            answers = dict(self.questions)
+            for question, pool in ANSWER_POOLS.items():
+                answers[question] = rng.choice(pool)
+            candidates.append({
+                "id": candidate_id,
+                "candidate_job_id": candidate_id + 500000000,
+                "first_name": rng.choice(["Ana", "Ben", "Chloe", "Dev", "Eli", "Fay"]),
+                "last_name": f"Test{i}",
+                "email": f"candidate{candidate_id}@example.com",
+                "phone_number": f"+1843555{candidate_id % 10000:04d}",
+                "street_address": f"{rng.randint(1, 999)} Main St",
+                "city": "Beaufort",
+                "state": "SC",
+                "zip_code": "29906",
+                "status": "Applicant",
+                "applied_at": applied_at.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "answers": answers,
+            })
+        return candidates
+
+    def documents(self, job_id, candidate_id):
+        for candidate in self.candidates(job_id):
+            if str(candidate["id"]) == str(candidate_id):
+                break
+        else:
+            return None
+        profile = {k: v for k, v in candidate.items() if k not in ("answers", "candidate_job_id")}
+        profile["status"] = self.statuses.get((job_id, str(candidate_id)), candidate["status"])
+        return [{
+            "id": candidate["candidate_job_id"],
+            "job_name": f"Caregiver (mock job {job_id})",
+            "candidate": profile,
+            "application": {
+                "application_form_data": {
+                    "custom_answers": {
+                        question: {"answer": answer} for question, answer in candidate["answers"].items()
+                    }
+                }
+            },
+        }]
+
+    def _load_call_logs(self, calls):
+        fixtures = []
+        seen = set()
+        for path in sorted(glob.glob(CALL_LOG_FIXTURES)):
+            with open(path, encoding="utf-8") as f:
+                for call in json.load(f).get("callLogs", []):
+                    if call["id"] not in seen:
+                        seen.add(call["id"])
+                        fixtures.append(call)
+        if not fixtures or not calls or calls <= len(fixtures):
+            logs = fixtures[:calls] if calls else fixtures
+        else:
+            # Replicate the fixtures with fresh IDs, spread over earlier days
+            logs = []
+            for i in range(calls):
+                call = dict(fixtures[i % len(fixtures)])
+                created = datetime.fromisoformat(call["createdAt"].replace("Z", "+00:00"))
+                created -= timedelta(hours=7 * (i // len(fixtures)))
+                call["id"] = f"{call['id'][:16]}{i:08x}"
+                call["createdAt"] = created.strftime("%Y-%m-%dT%H:%M:%S.") + f"{created.microsecond // 1000:03d}Z"
+                logs.append(call)
+        logs.sort(key=lambda c: c["createdAt"], reverse=True)
+        return logs
+
+
+class Stats:
+    def __init__(self):
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def add(self, key):
+        with self.lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def reset(self):
+        with self.lock:
+            self.counts.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counts)
+
+
+# ---------------- ROUTES ----------------
+
+CANDIDATES_ROUTE = re.compile(r"^/v2/jobs/(?P<job_id>[^/]+)/candidates$")
+DOCUMENTS_ROUTE = re.compile(
+    r"^/v2/jobs/(?P<job_id>[^/]+)/candidates/(?P<candidate_id>[^/]+)/documents/all_documents$"
+)
+CANDIDATE_ROUTE = re.compile(r"^/v2/jobs/(?P<job_id>[^/]+)/candidates/(?P<candidate_id>[^/]+)$")
+EMAIL_ROUTE = re.compile(r"^/v2/emails/send_single_email$")
+CALL_LOGS_ROUTE = re.compile(r"^/voice-ai/dashboard/call-logs$")
+CALL_LOG_ROUTE = re.compile(r"^/voice-ai/dashboard/call-logs/(?P<call_id>[^/]+)$")
+
+
+def _int_param(params, name, default):
+    try:
+        return max(1, int(params.get(name, [default])[0]))
+    except ValueError:
+        return default
+
+
+def make_handler(data, config, stats):
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+        # Headers and body go out as separate writes; without TCP_NODELAY every
+        # response waits on the client's delayed ACK (~40ms)
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass  # one line per request would dominate a load test
+
+        # ---------------- PLUMBING ----------------
+
+        def _send(self, status, payload=None, headers=None):
+            body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            if body and self.command != "HEAD":
+                self.wfile.write(body)
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+
+        def _dispatch(self, routes):
+            url = urlsplit(self.path)
+            params = parse_qs(url.query)
+            body = self._body()  # always drained so keep-alive stays usable
+
+            if url.path == "/__stats":
+                return self._send(200, {
+                    "requests": stats.snapshot(),
+                    "emails_sent": len(data.emails),
+                    "status_updates": len(data.statuses),
+                })
+            if url.path == "/__reset" and self.command == "POST":
+                with data.lock:
+                    data.emails.clear()
+                    data.statuses.clear()
+                stats.reset()
+                return self._send(200, {"reset": True})
+
+            if not self.headers.get("Authorization"):
+                return self._send(401, {"error": "Missing Authorization header"})
+
+            for route, handler in routes:
+                match = route.match(url.path)
+                if match is None:
+                    continue
+                name = handler.__name__.lstrip("_")
+                stats.add(name)
+
+                delay, injected = config.draw()
+                if delay:
+                    time.sleep(delay)
+                if injected == 429:
+                    stats.add(f"{name}:429")
+                    return self._send(
+                        429, {"error": "Too Many Requests"},
+                        {"Retry-After": str(config.retry_after)}
+                    )
+                if injected == 500:
+                    stats.add(f"{name}:500")
+                    return self._send(500, {"error": "Injected server error"})
+
+                return handler(params, body, **match.groupdict())
+
+            stats.add("not_found")
+            return self._send(404, {"error": f"No mock route for {self.command} {url.path}"})
+
+        def do_GET(self):
+            self._dispatch([
+                (DOCUMENTS_ROUTE, self._documents),
+                (CANDIDATES_ROUTE, self._candidates),
+                (CALL_LOGS_ROUTE, self._call_logs),
+                (CALL_LOG_ROUTE, self._call_log),
+            ])
+
+        def do_POST(self):
+            self._dispatch([(EMAIL_ROUTE, self._send_email)])
+
+        def do_PUT(self):
+            self._dispatch([(CANDIDATE_ROUTE, self._update_status)])
+
+        # ---------------- HIREOLOGY ----------------
+
+        def _candidates(self, params, body, job_id):
+            page = _int_param(params, "page", 1)
+            page_size = _int_param(params, "page_size", 10)
+            status = params.get("filter[status]", [None])[0]
+            candidates = [
+                {
+                    "id": c["id"],
+                    "applied_at": c["applied_at"],
+                    "status": data.statuses.get((job_id, str(c["id"])), c["status"]),
+                }
+                for c in data.candidates(job_id)
+            ]
+            if status:
+                # Like the real API: candidates moved out of the status drop out
+                # of the listing, shifting later ones onto earlier pages
+                candidates = [c for c in candidates if c["status"] == status]
+            start = (page - 1) * page_size
+            items = candidates[start:start + page_size]
+            total_pages = max(1, -(-len(candidates) // page_size))
+            self._send(200, {
+                "data": items,
+                "meta": {"page": page, "page_size": page_size,
+                         "total": len(candidates), "total_pages": total_pages},
+            })
+
+        def _documents(self, params, body, job_id, candidate_id):
+            documents = data.documents(job_id, candidate_id)
+            if documents is None:
+                return self._send(404, {"error": "Candidate not found"})
+            etag = '"%s"' % hashlib.sha1(json.dumps(documents, sort_keys=True).encode()).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                stats.add("documents:304")
+                return self._send(304, headers={"ETag": etag})
+            self._send(200, documents, {"ETag": etag})
+
+        def _send_email(self, params, body):
+            form = parse_qs(body.decode("utf-8"))
+            if not form.get("user[email_to]") or not form.get("candidate_job_ids[]"):
+                return self._send(422, {"error": "email_to and candidate_job_ids[] are required"})
+            with data.lock:
+                data.emails.append({
+                    "candidate_job_id": form["candidate_job_ids[]"][0],
+                    "email_to": form["user[email_to]"][0],
+                    "subject": form.get("user[email_subject]", [""])[0],
+                })
+            self._send(200, {"success": True})
+
+        def _update_status(self, params, body, job_id, candidate_id):
+            try:
+                status = json.loads(body or b"{}").get("status")
+            except ValueError:
+                status = None
+            if not status:
+                return self._send(422, {"error": "status is required"})
+            with data.lock:
+                data.statuses[(job_id, str(candidate_id))] = status
+            self._send(200, {"id": int(candidate_id) if candidate_id.isdigit() else candidate_id,
+                             "status": status})
+
+        # ---------------- LEADCONNECTOR VOICE AI ----------------
+
+        def _call_logs(self, params, body):
+            logs = data.call_logs
+            agent_id = params.get("agentId", [None])[0]
+            start_date = params.get("startDate", [None])[0]
+            end_date = params.get("endDate", [None])[0]
+            if agent_id:
+                logs = [c for c in logs if c.get("agentId") == agent_id]
+            if start_date:
+                logs = [c for c in logs if c["createdAt"][:len(start_date)] >= start_date]
+            if end_date:
+                logs = [c for c in logs if c["createdAt"][:len(end_date)] <= end_date]
+
+            page = _int_param(params, "page", 1)
+            page_size = _int_param(params, "pageSize", 10)
+            start = (page - 1) * page_size
+            self._send(200, {
+                "callLogs": logs[start:start + page_size],
+                "total": len(logs),
+                "page": page,
+                "pageSize": page_size,
+                "traceId": hashlib.sha1(self.path.encode()).hexdigest()[:32],
+            })
+
+        def _call_log(self, params, body, call_id):
+            for call in data.call_logs:
+                if call["id"] == call_id:
+                    return self._send(200, call)
+            self._send(404, {"error": "Call log not found"})
+
+    return MockHandler
+
+
+def start_mock_server(
+    host="127.0.0.1",
+    port=0,
+    candidates_per_job=200,
+    calls=None,
+    seed=0,
+    **config
+):
+    """
+    Start the mock API server in a background thread.
+
+    :param port: 0 picks a free port; the server's URL is server.url
+    :param candidates_per_job: synthetic candidates generated per job ID
+    :param calls: number of call logs to serve (fixtures replicated as needed)
+    :param config: MockConfig settings (latency, latency_jitter, error_rate,
+                   throttle_rate, retry_after)
+    :return: the running ThreadingHTTPServer; call shutdown() to stop it
+    """
+    data = MockData(candidates_per_job=candidates_per_job, calls=calls, seed=seed)
+    server = ThreadingHTTPServer(
+        (host, port), make_handler(data, MockConfig(seed=seed, **config), Stats())
+    )
+    server.daemon_threads = True
+    server.data = data
+    server.url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, name="mock-api-server", daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Hireology / LeadConnector stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--candidates", type=int, default=200, help="candidates per job")
+    parser.add_argument("--calls", type=int, default=None, help="call logs to serve")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="extra random latency, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After of injected 429s")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = start_mock_server(
+        host=args.host, port=args.port, candidates_per_job=args.candidates, calls=args.calls,
+        seed=args.seed, latency=args.latency, latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=args.retry_after
+    )
+    print(f"🧪 Mock API server listening on {server.url}")
+    print(f"   HIREOLOGY_BASE_URL={server.url} LEADCONNECTOR_BASE_URL={server.url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        print("\n👋 Mock API server stopped")
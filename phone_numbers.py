@@ -0,0 +1,40 @@
+import re
+
+
+# Candidate phone numbers in free text: North American numbers, 3-3-4 digit
+# groups with optional separators (space, dot, dash, area code in
+# parentheses) and an optional "+1" / "1" country code. The groups are fixed
+# so a number ("555-123-4567 5 yrs") does not run into the digits after it.
+PHONE_PATTERN = re.compile(
+    r"(?<![\w+])(?:\+?1[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}(?!\w)"
+)
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_phone_e164(raw, default_country_code="1"):
+    """
+    Normalize a phone number to E.164 ("+16135189745").
+
+    Numbers without a leading + are assumed to be national numbers of
+    default_country_code (North America by default): 10 digits get the code
+    prepended, 11 digits starting with the code are taken as is.
+    Returns None for anything that cannot be a valid E.164 number.
+    """
+    if raw is None:
+        return None
+    raw = str(raw).strip()
+    if not raw or raw == "N/A":
+        return None
+
+    digits = _NON_DIGITS.sub("", raw)
+    if raw.startswith("+") or raw.startswith("00"):
+        if raw.startswith("00"):
+            digits = digits[2:]
+        return f"+{digits}" if 8 <= len(digits) <= 15 else None
+
+    if len(digits) == 10:
+        return f"+{default_country_code}{digits}"
+    if len(digits) == 10 + len(default_country_code) and digits.startswith(default_country_code):
+        return f"+{digits}"
+    return None
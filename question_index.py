@@ -0,0 +1,170 @@
+import difflib
+import json
+import os
+import re
+import threading
+import unicodedata
+
+from screening_rules import SUPERVISOR_QUESTION
+from supervisor_references import parse_supervisor_references
+
+
+# Minimum difflib similarity for a reworded question to count as an alias
+FUZZY_THRESHOLD = 0.85
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(text):
+    """
+    Canonical form of a question's wording: casefolded, accents and
+    punctuation stripped, whitespace collapsed.
+    "Please provide ... *Cannot be co-workers*" -> "please provide ... cannot be co workers"
+    """
+    text = unicodedata.normalize("NFKD", str(text))
+    text = "".join(c for c in text if not unicodedata.combining(c)).casefold()
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+# ---------------- VALIDATORS ----------------
+
+def validate_supervisor_answer(value):
+    """Incomplete-question message for a supervisor-reference answer, None if valid"""
+    return parse_supervisor_references(value).message
+
+
+# validator name -> function(answer) returning a message when invalid, else None
+VALIDATORS = {
+    "supervisor_references": validate_supervisor_answer,
+}
+
+# Known wordings (and rewordings) of each validated question
+DEFAULT_ALIASES = {
+    SUPERVISOR_QUESTION: "supervisor_references",
+    "Please provide the contact name and phone number of 2 former supervisors": "supervisor_references",
+    "Please list 2-3 former supervisors with their names and phone numbers": "supervisor_references",
+    "Supervisor references (name and phone number)": "supervisor_references",
+}
+
+
+# ---------------- INDEX ----------------
+
+class QuestionIndex:
+    """
+    Maps question text to the validator that applies to it.
+
+    Each distinct question string is resolved once: exact match of its
+    normalized form against the alias table, then containment (a job's form
+    may append a note to a known question), then a fuzzy match. The result is
+    cached, so checking a record costs one dict lookup per field.
+
+    Job-specific aliases (job_aliases[job_id]) add to the defaults for forms
+    whose wording differs too much for the fuzzy match.
+    """
+
+    def __init__(self, aliases=None, job_aliases=None, fuzzy_threshold=FUZZY_THRESHOLD):
+        self.aliases = self._normalize_aliases(DEFAULT_ALIASES if aliases is None else aliases)
+        self.job_aliases = {
+            str(job_id): self._normalize_aliases(table)
+            for job_id, table in (job_aliases or {}).items()
+        }
+        self.fuzzy_threshold = fuzzy_threshold
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_aliases(table):
+        normalized = {}
+        for question, validator in table.items():
+            if validator not in VALIDATORS:
+                raise ValueError(f"Unknown validator: {validator}")
+            normalized[normalize_question(question)] = validator
+        return normalized
+
+    def _aliases_for(self, job_key):
+        job_table = self.job_aliases.get(job_key) if job_key is not None else None
+        return {**self.aliases, **job_table} if job_table else self.aliases
+
+    def _resolve(self, question, job_key):
+        key = normalize_question(question)
+        aliases = self._aliases_for(job_key)
+        if not key:
+            return None
+        if key in aliases:
+            return aliases[key]
+        for alias, validator in aliases.items():
+            if alias in key:
+                return validator
+
+        best, best_ratio = None, self.fuzzy_threshold
+        matcher = difflib.SequenceMatcher(b=key, autojunk=False)
+        for alias, validator in aliases.items():
+            matcher.set_seq1(alias)
+            if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = validator, ratio
+        return best
+
+    def validator_name(self, question, job_id=None):
+        """Name of the validator for a question, None when it has none"""
+        # Jobs without their own aliases share the default resolutions
+        job_key = str(job_id) if job_id is not None and str(job_id) in self.job_aliases else None
+        cache_key = (job_key, question)
+        try:
+            return self._resolved[cache_key]
+        except KeyError:
+            pass
+        name = self._resolve(question, job_key)
+        with self._lock:
+            self._resolved[cache_key] = name
+        return name
+
+    def validator_for(self, question, job_id=None):
+        """Validator function for a question, None when it has none"""
+        name = self.validator_name(question, job_id)
+        return VALIDATORS[name] if name else None
+
+
+def load_question_index(path):
+    """
+    Load aliases from a JSON or YAML file:
+
+        {"default": {"<question text>": "<validator>", ...},
+         "jobs":    {"<job_id>": {"<question text>": "<validator>", ...}}}
+
+    "default" entries extend the built-in aliases.
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml  # optional dependency, only needed for YAML alias files
+            config = yaml.safe_load(f) or {}
+        else:
+            config = json.load(f)
+
+    aliases = {**DEFAULT_ALIASES, **(config.get("default") or {})}
+    return QuestionIndex(aliases, job_aliases=config.get("jobs"))
+
+
+_default_index = None
+
+
+def get_question_index():
+    """
+    Process-wide question index, built once. Uses the alias file named by the
+    QUESTION_ALIASES_PATH environment variable when set.
+    """
+    global _default_index
+    if _default_index is None:
+        path = os.environ.get("QUESTION_ALIASES_PATH")
+        _default_index = load_question_index(path) if path else QuestionIndex()
+    return _default_index
+
+
+def set_question_index(index):
+    """Replace the process-wide question index"""
+    global _default_index
+    _default_index = index
@@ -0,0 +1,292 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+
+from metrics import metrics
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Requests per second allowed per host (burst = one second worth of tokens).
+# LeadConnector documents a burst limit of 100 requests per 10 seconds per
+# app and location; Hireology publishes no limit, so it gets the same
+# conservative ceiling. Override per host with HOST_RATE_LIMITS, e.g.
+# "api.hireology.com=25,services.leadconnectorhq.com=10".
+DEFAULT_HOST_RATES = {
+    "api.hireology.com": 10,
+    "services.leadconnectorhq.com": 10,
+}
+DEFAULT_RATE = 10
+
+# Longest a Retry-After may hold back a request (and its host's bucket);
+# a server still throttling after that answers 429 again
+MAX_RETRY_AFTER = 60.0
+
+
+def parse_host_rates(value):
+    """Parse "host=rate,host=rate" into {host: rate}; malformed entries are ignored"""
+    rates = {}
+    for entry in (value or "").split(","):
+        host, _, rate = entry.strip().partition("=")
+        try:
+            rates[host.strip()] = float(rate)
+        except ValueError:
+            continue
+    return {host: rate for host, rate in rates.items() if host and rate > 0}
+
+
+DEFAULT_HOST_RATES.update(parse_host_rates(os.environ.get("HOST_RATE_LIMITS")))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with AIMD rate adaptation.
+
+    Every request takes one token. A 429 halves the rate (down to min_rate)
+    and, when the server sends Retry-After, blocks the whole bucket until
+    then (at most MAX_RETRY_AFTER seconds); each success adds back a small
+    step up to max_rate. This keeps the sustained rate just under whatever
+    limit the provider enforces.
+    """
+
+    def __init__(self, rate, capacity=None, min_rate=None):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = float(min_rate) if min_rate else self.max_rate / 20
+        self.capacity = float(capacity) if capacity else max(1.0, self.max_rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """
+        Take one token and return how many seconds the caller must wait
+        before sending. Tokens may go negative, which queues callers fairly.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self):
+        """Block the calling thread until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait on the event loop until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        """Additive increase after a request that was not throttled"""
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 50)
+
+    def on_throttle(self, retry_after=None):
+        """Multiplicative decrease after a 429, honoring Retry-After if given"""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                blocked_for = min(retry_after, MAX_RETRY_AFTER)
+                self.blocked_until = max(self.blocked_until, now + blocked_for)
+
+
+class HostRateLimiter:
+    """
+    Registry of token buckets, one per host, shared by every client in the process.
+    """
+
+    def __init__(self, host_rates=None, default_rate=DEFAULT_RATE):
+        self.host_rates = dict(DEFAULT_HOST_RATES if host_rates is None else host_rates)
+        self.default_rate = default_rate
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def for_url(self, url):
+        """Return the bucket for the host of url"""
+        host = urlsplit(str(url)).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                rate = self.host_rates.get(host, self.default_rate)
+                bucket = self.buckets[host] = TokenBucket(rate)
+            return bucket
+
+
+default_limiter = HostRateLimiter()
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds,
+    capped at MAX_RETRY_AFTER. Returns None if missing or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(MAX_RETRY_AFTER, max(0.0, seconds))
+
+
+def backoff_delay(attempt, base=0.5, cap=30.0):
+    """Full-jitter exponential backoff for the given (0-based) attempt"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def should_retry(method, status_code):
+    """
+    429 means the request was not processed, so it is always safe to retry.
+    5xx responses are only retried for idempotent methods.
+    """
+    if status_code == 429:
+        return True
+    return method.upper() in IDEMPOTENT_METHODS and status_code in RETRY_STATUSES
+
+
+def request_with_retry(session, method, url, limiter=default_limiter, max_retries=5, **kwargs):
+    """
+    Send a request through session, rate limited per host and retried with
+    jittered exponential backoff on 429 / 5xx / connection errors.
+
+    Returns the final response (which may still be an error response once
+    retries are exhausted); connection errors are re-raised when exhausted.
+    Each call is recorded in metrics (latency including retries, final
+    status, retries, response bytes) when metrics are enabled.
+    """
+    if not metrics.enabled:
+        return _request_with_retry(session, method, url, limiter, max_retries, kwargs)[0]
+
+    start = time.perf_counter()
+    try:
+        response, retries = _request_with_retry(session, method, url, limiter, max_retries, kwargs)
+    except Exception as e:
+        metrics.record_http(method, url, type(e).__name__, time.perf_counter() - start)
+        raise
+    metrics.record_http(
+        method, url, response.status_code, time.perf_counter() - start,
+        retries=retries, bytes_received=len(response.content)
+    )
+    return response
+
+
+def _request_with_retry(session, method, url, limiter, max_retries, kwargs):
+    """request_with_retry without instrumentation; returns (response, retries)"""
+    bucket = limiter.for_url(url) if limiter else None
+
+    for attempt in range(max_retries + 1):
+        if bucket:
+            bucket.acquire()
+
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if method.upper() not in IDEMPOTENT_METHODS or attempt == max_retries:
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code not in RETRY_STATUSES:
+            if bucket:
+                bucket.on_success()
+            return response, attempt
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if bucket and response.status_code == 429:
+            bucket.on_throttle(retry_after)
+
+        if not should_retry(method, response.status_code) or attempt == max_retries:
+            return response, attempt
+
+        response.close()
+        time.sleep(retry_after if retry_after is not None else backoff_delay(attempt))
+
+    return response, max_retries
+
+
+async def async_request_with_retry(
+    client, method, url, limiter=default_limiter, max_retries=5, retry_exceptions=(), **kwargs
+):
+    """
+    asyncio version of request_with_retry for an httpx.AsyncClient.
+
+    retry_exceptions lists the transport errors treated like connection
+    errors (e.g. (httpx.TransportError,)).
+    """
+    if not metrics.enabled:
+        return (await _async_request_with_retry(
+            client, method, url, limiter, max_retries, retry_exceptions, kwargs
+        ))[0]
+
+    start = time.perf_counter()
+    try:
+        response, retries = await _async_request_with_retry(
+            client, method, url, limiter, max_retries, retry_exceptions, kwargs
+        )
+    except Exception as e:
+        metrics.record_http(method, url, type(e).__name__, time.perf_counter() - start)
+        raise
+    metrics.record_http(
+        method, url, response.status_code, time.perf_counter() - start,
+        retries=retries, bytes_received=len(response.content)
+    )
+    return response
+
+
+async def _async_request_with_retry(client, method, url, limiter, max_retries, retry_exceptions, kwargs):
+    """async_request_with_retry without instrumentation; returns (response, retries)"""
+    bucket = limiter.for_url(client.base_url.join(url)) if limiter else None
+
+    for attempt in range(max_retries + 1):
+        if bucket:
+            await bucket.acquire_async()
+
+        try:
+            response = await client.request(method, url, **kwargs)
+        except retry_exceptions:
+            if method.upper() not in IDEMPOTENT_METHODS or attempt == max_retries:
+                raise
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code not in RETRY_STATUSES:
+            if bucket:
+                bucket.on_success()
+            return response, attempt
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if bucket and response.status_code == 429:
+            bucket.on_throttle(retry_after)
+
+        if not should_retry(method, response.status_code) or attempt == max_retries:
+            return response, attempt
+
+        await asyncio.sleep(retry_after if retry_after is not None else backoff_delay(attempt))
+
+    return response, max_retries
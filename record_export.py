@@ -0,0 +1,174 @@
+import csv
+import glob
+import os
+import threading
+
+
+class RecordExporter:
+    """
+    Streaming exporter for applicant records (build_single_applicant_record output).
+
+    Records are buffered and flushed every batch_size rows, so whole job
+    backlogs export in constant memory. The column schema is the union of
+    every record seen, in first-seen order (so the basic fields lead), and
+    different jobs' custom questions simply become extra columns.
+    Cells a record has no value for are left empty.
+
+    CSV: one file, appended to. When a batch brings new columns the file is
+    rewritten once, row by row, under the widened header; an existing file
+    is extended rather than overwritten.
+
+    Parquet (needs pyarrow): a directory of part files, all columns stored
+    as strings; a new part starts whenever the schema widens. Read it back
+    with read_parquet_export.
+
+    Thread-safe: write() may be called from the pipeline's worker threads.
+    """
+
+    def __init__(self, path, format=None, batch_size=500):
+        self.path = path
+        self.format = format or ("parquet" if path.endswith(".parquet") else "csv")
+        self.batch_size = batch_size
+        self.columns = []
+        self._column_set = set()
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._parquet_writer = None
+        self._parquet_schema_columns = None
+        self._part = 0
+        self.rows_written = 0
+
+        if self.format == "csv" and os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, newline="", encoding="utf-8") as f:
+                self._add_columns(next(csv.reader(f)))
+        elif self.format == "parquet":
+            os.makedirs(path, exist_ok=True)
+            self._part = len(glob.glob(os.path.join(path, "part-*.parquet")))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _add_columns(self, keys):
+        added = False
+        for key in keys:
+            if key not in self._column_set:
+                self._column_set.add(key)
+                self.columns.append(key)
+                added = True
+        return added
+
+    def write(self, record):
+        """Queue one record; flushes automatically every batch_size records"""
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_size:
+                self._flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            if self._parquet_writer is not None:
+                self._parquet_writer.close()
+                self._parquet_writer = None
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+
+        previous_columns = list(self.columns)
+        schema_changed = False
+        for record in batch:
+            schema_changed |= self._add_columns(record.keys())
+
+        if self.format == "csv":
+            self._flush_csv(batch, previous_columns, schema_changed)
+        else:
+            self._flush_parquet(batch)
+        self.rows_written += len(batch)
+
+    # ---------------- CSV ----------------
+
+    def _flush_csv(self, batch, previous_columns, schema_changed):
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+
+        if exists and schema_changed:
+            self._rewrite_csv_header(previous_columns)
+
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns, restval="")
+            if not exists:
+                writer.writeheader()
+            writer.writerows(batch)
+
+    def _rewrite_csv_header(self, previous_columns):
+        tmp_path = f"{self.path}.tmp"
+        with open(self.path, newline="", encoding="utf-8") as src, \
+                open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+            reader = csv.reader(src)
+            next(reader)  # old header
+            writer = csv.writer(dst)
+            writer.writerow(self.columns)
+            padding = [""] * (len(self.columns) - len(previous_columns))
+            for row in reader:
+                writer.writerow(row + padding)
+        os.replace(tmp_path, self.path)
+
+    # ---------------- PARQUET ----------------
+
+    def _flush_parquet(self, batch):
+        import pyarrow as pa  # optional dependency, only needed for Parquet output
+        import pyarrow.parquet as pq
+
+        if self._parquet_schema_columns != self.columns:
+            if self._parquet_writer is not None:
+                self._parquet_writer.close()
+            schema = pa.schema([(column, pa.string()) for column in self.columns])
+            part_path = os.path.join(self.path, f"part-{self._part:05d}.parquet")
+            self._part += 1
+            self._parquet_writer = pq.ParquetWriter(part_path, schema)
+            self._parquet_schema_columns = list(self.columns)
+
+        table = pa.table({
+            column: [
+                None if record.get(column) is None else str(record.get(column))
+                for record in batch
+            ]
+            for column in self.columns
+        }, schema=self._parquet_writer.schema)
+        self._parquet_writer.write_table(table)
+
+
+def read_parquet_export(path):
+    """
+    Read a Parquet export directory into one pyarrow Table, unifying the
+    schemas of its parts (columns missing from a part become nulls).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tables = [pq.read_table(p) for p in sorted(glob.glob(os.path.join(path, "part-*.parquet")))]
+    if not tables:
+        return pa.table({})
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def export_records(records, path, format=None, batch_size=500):
+    """
+    Stream an iterable of applicant records to CSV or Parquet.
+    Returns the number of records written.
+    """
+    with RecordExporter(path, format=format, batch_size=batch_size) as exporter:
+        exporter.write_many(records)
+    return exporter.rows_written
@@ -0,0 +1,369 @@
+import json
+import os
+import re
+
+
+# ---------------- QUESTIONS ----------------
+
+EXPERIENCE_QUESTION = "How many years of professional caregiving experience do you have?"
+DRIVERS_LICENSE_QUESTION = "Do you have a valid driver's license, and car insurance?"
+DRUG_SCREEN_QUESTION = "Are you able to pass a drug screen?"
+CRIMINAL_RECORD_QUESTION = "Have you been arrested, convicted of a felony, or misdemeanor?"
+CAREGIVER_DESCRIPTION_QUESTION = (
+    "Can you briefly describe your previous caregiving roles, including your "
+    "main responsibilities and the care settings you worked in?"
+)
+SUPERVISOR_QUESTION = (
+    "Please provide the contact name and phone number of 2-3 former supervisors. "
+    "*Cannot be co-workers, family, or friends*"
+)
+
+DEFAULT_REJECTION_REASON = "Did not meet our standard application requirements."
+
+
+# ---------------- CAREGIVER EXPERIENCE KEYWORDS ----------------
+
+CAREGIVER_KEYWORDS = (
+    # Caregiving
+    "caregiver", "caregiving", "carer", "home care", "personal care",
+    "companion care", "elder care", "elderly care", "senior care",
+    "geriatric", "hospice", "palliative", "respite",
+
+    # Nursing
+    "nurse", "nursing", "registered nurse", "rn",
+    "licensed practical nurse", "lpn",
+    "licensed vocational nurse", "lvn",
+    "nursing assistant", "nurse aide",
+
+    # Certifications / Clinical
+    "cna", "pct", "medtech", "medical technician",
+    "patient care technician", "medical assistant",
+    "healthcare aide", "clinical aide",
+
+    # Facilities
+    "assisted living", "long-term care", "nursing home",
+    "skilled nursing", "snf", "rehab", "rehabilitation",
+    "hospital", "clinic", "memory care", "dementia care",
+
+    # Responsibilities
+    "patient care", "direct care", "activities of daily living", "adl",
+    "bathing", "feeding", "toileting", "grooming",
+    "mobility assistance", "vitals", "medication"
+)
+
+
+def _trie_regex(node):
+    """Regex for a keyword trie node: shared prefixes are written once"""
+    optional = "" in node
+    branches = []
+    letters = []
+    for char in sorted(k for k in node if k):
+        rest = _trie_regex(node[char])
+        if rest:
+            branches.append(re.escape(char) + rest)
+        else:
+            letters.append(re.escape(char))
+    if letters:
+        branches.append(letters[0] if len(letters) == 1 else "[" + "".join(letters) + "]")
+    if not branches:
+        return ""
+    regex = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{regex})?" if optional else regex
+
+
+def compile_keyword_pattern(keywords):
+    """
+    Compile keywords into one case-insensitive regex matching whole words
+    only (plus an optional plural "s"), so "rn" no longer matches inside
+    "learn"; hyphens separate words ("in-home care"). The keywords are
+    factored into a trie ("nurs(?:e|ing)"), so at each position the engine
+    follows one path of characters instead of trying every keyword: the
+    branches tried per character are bounded by the alphabet, not by the
+    length of the list. The longest
+    keyword wins ("registered nurse" over "nurse"); the matched text is
+    captured in group "keyword".
+    """
+    trie = {}
+    for keyword in set(k.lower() for k in keywords):
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return re.compile(rf"(?<!\w)(?P<keyword>{_trie_regex(trie)})s?(?!\w)", re.IGNORECASE)
+
+
+CAREGIVER_KEYWORD_PATTERN = compile_keyword_pattern(CAREGIVER_KEYWORDS)
+
+
+# ---------------- PARSERS & CHECKS ----------------
+
+_FIRST_NUMBER = re.compile(r"\d+")
+
+
+def parse_years(value):
+    """First integer in the answer ("4 years" -> 4), 0 if there is none"""
+    match = _FIRST_NUMBER.search(str(value))
+    return int(match.group()) if match else 0
+
+
+def parse_yes_no(value):
+    """Normalized answer text for yes/no questions"""
+    return str(value).strip().lower()
+
+
+def parse_text(value):
+    return str(value)
+
+
+PARSERS = {
+    "years": parse_years,
+    "yes_no": parse_yes_no,
+    "text": parse_text,
+}
+
+
+def _check_min(value):
+    return lambda parsed: parsed >= value
+
+
+def _check_equals(value):
+    expected = str(value).strip().lower()
+    return lambda parsed: parsed == expected
+
+
+def _check_keywords(value):
+    # value: None for the built-in keyword list, or a list of keywords
+    pattern = CAREGIVER_KEYWORD_PATTERN if value is None else compile_keyword_pattern(value)
+    return lambda parsed: bool(parsed.strip()) and pattern.search(parsed) is not None
+
+
+CHECKS = {
+    "min": _check_min,
+    "equals": _check_equals,
+    "keywords": _check_keywords,
+}
+
+
+# ---------------- RULE DEFINITIONS ----------------
+
+# Each rule: the question(s) it reads, how to parse the answer, what the
+# parsed answer must satisfy, and the reason given when it does not.
+DEFAULT_RULES = [
+    {
+        "name": "min_experience",
+        "questions": [EXPERIENCE_QUESTION],
+        "parser": "years",
+        "check": "min",
+        "value": 1,
+        "reason": "Less than 1 year of professional caregiving experience",
+    },
+    {
+        "name": "drivers_license",
+        "questions": [DRIVERS_LICENSE_QUESTION],
+        "parser": "yes_no",
+        "check": "equals",
+        "value": "yes",
+        "reason": "Does not have a valid driver's license and car insurance",
+    },
+    {
+        "name": "drug_screen",
+        "questions": [DRUG_SCREEN_QUESTION],
+        "parser": "yes_no",
+        "check": "equals",
+        "value": "yes",
+        "reason": "Unable to pass a drug screen",
+    },
+    {
+        "name": "criminal_record",
+        "questions": [CRIMINAL_RECORD_QUESTION],
+        "parser": "yes_no",
+        "check": "equals",
+        "value": "no",
+        "reason": "Has a criminal record",
+    },
+    {
+        "name": "caregiver_experience",
+        "questions": [CAREGIVER_DESCRIPTION_QUESTION, "job_title_held"],
+        "parser": "text",
+        "check": "keywords",
+        "value": None,
+        "reason": "No relevant caregiver experience or certification found",
+    },
+]
+
+
+class ScreeningDecision:
+    """Outcome of evaluating one record: status plus every failed rule"""
+
+    __slots__ = ("status", "reasons", "failed_rules")
+
+    def __init__(self, status, reasons, failed_rules):
+        self.status = status
+        self.reasons = reasons
+        self.failed_rules = failed_rules
+
+    @property
+    def rejection_reason(self):
+        """Reasons joined for the rejection email"""
+        return "; ".join(self.reasons) if self.reasons else DEFAULT_REJECTION_REASON
+
+
+RULE_FIELDS = ("name", "questions", "parser", "check", "reason")
+
+
+def validate_rule(rule):
+    """Raise ValueError if a (merged) rule cannot be compiled or evaluated"""
+    missing = [field for field in RULE_FIELDS if field not in rule]
+    if missing:
+        raise ValueError(f"Rule {rule.get('name')!r} is missing {', '.join(missing)}")
+    name = rule["name"]
+    if not isinstance(rule["questions"], (list, tuple)) or not rule["questions"]:
+        raise ValueError(f"Rule {name!r}: questions must be a non-empty list")
+    if rule["parser"] not in PARSERS:
+        raise ValueError(f"Rule {name!r}: unknown parser {rule['parser']!r}")
+    if rule["check"] not in CHECKS:
+        raise ValueError(f"Rule {name!r}: unknown check {rule['check']!r}")
+    value = rule.get("value")
+    if rule["check"] == "min" and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        raise ValueError(f"Rule {name!r}: min needs a number, got {value!r}")
+    if rule["check"] == "keywords" and value is not None and (
+        isinstance(value, str) or not all(isinstance(k, str) for k in value)
+    ):
+        raise ValueError(f"Rule {name!r}: keywords needs a list of words, got {value!r}")
+
+
+class CompiledRuleSet:
+    """
+    Rules resolved into plain callables, ready to evaluate many records.
+
+    Each distinct (questions, parser) pair is read and parsed once per
+    record, however many rules use it. Invalid rules raise ValueError.
+    """
+
+    def __init__(self, rules):
+        self.rules = [r for r in rules if r.get("enabled", True)]
+        for rule in self.rules:
+            validate_rule(rule)
+
+        self._extractors = []
+        extractor_index = {}
+        self._compiled = []
+        for rule in self.rules:
+            key = (tuple(rule["questions"]), rule["parser"])
+            if key not in extractor_index:
+                extractor_index[key] = len(self._extractors)
+                self._extractors.append((key[0], PARSERS[rule["parser"]]))
+            check = CHECKS[rule["check"]](rule.get("value"))
+            self._compiled.append((extractor_index[key], check, rule["name"], rule["reason"]))
+
+    def evaluate(self, record):
+        """Walk the record once and return a ScreeningDecision"""
+        parsed = []
+        for questions, parser in self._extractors:
+            if len(questions) == 1:
+                raw = record.get(questions[0], "")
+            else:
+                raw = " ".join(str(record.get(q, "")) for q in questions)
+            parsed.append(parser(raw))
+
+        reasons = []
+        failed_rules = []
+        for index, check, name, reason in self._compiled:
+            if not check(parsed[index]):
+                failed_rules.append(name)
+                reasons.append(reason)
+
+        status = "Inactive" if failed_rules else "Candidate"
+        return ScreeningDecision(status, reasons, failed_rules)
+
+
+def apply_overrides(rules, overrides):
+    """
+    Return a copy of rules with per-rule overrides applied.
+    overrides maps rule name -> fields to replace; unknown names add new rules.
+    """
+    merged = {r["name"]: dict(r) for r in rules}
+    for name, fields in (overrides or {}).items():
+        merged.setdefault(name, {"name": name}).update(fields)
+    return list(merged.values())
+
+
+class RuleEngine:
+    """
+    Default rules plus optional per-job overrides. Every job's rule set is
+    compiled up front, so a broken override fails when the engine is built
+    (ValueError naming the job) rather than on each of that job's candidates.
+    """
+
+    def __init__(self, rules=None, job_overrides=None, default_overrides=None):
+        base = DEFAULT_RULES if rules is None else rules
+        self.rules, default = self._compile(base, default_overrides, "the default rules")
+        self.job_overrides = {str(k): v for k, v in (job_overrides or {}).items()}
+        self._compiled = {None: default}
+        for job_id, overrides in self.job_overrides.items():
+            _, self._compiled[job_id] = self._compile(self.rules, overrides, f"job {job_id}")
+
+    @staticmethod
+    def _compile(rules, overrides, owner):
+        """(merged rules, CompiledRuleSet) for rules with overrides applied"""
+        try:
+            merged = apply_overrides(rules, overrides)
+            return merged, CompiledRuleSet(merged)
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid screening rules for {owner}: {e}") from e
+
+    def for_job(self, job_id=None):
+        """Compiled rule set for a job (the default set if it has no overrides)"""
+        key = str(job_id) if job_id is not None and str(job_id) in self._compiled else None
+        return self._compiled[key]
+
+    def evaluate(self, record, job_id=None):
+        return self.for_job(job_id).evaluate(record)
+
+
+def load_rule_engine(path):
+    """
+    Build a RuleEngine from a JSON or YAML file of overrides:
+
+        {
+            "default": {"min_experience": {"value": 2}},
+            "jobs": {
+                "2606114": {"drug_screen": {"enabled": false}}
+            }
+        }
+
+    Each entry replaces fields of the named rule (questions, parser, check,
+    value, reason, enabled); a new name defines an extra rule.
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml  # optional dependency, only needed for YAML rule files
+            config = yaml.safe_load(f) or {}
+        else:
+            config = json.load(f)
+
+    return RuleEngine(
+        job_overrides=config.get("jobs"),
+        default_overrides=config.get("default")
+    )
+
+
+_default_engine = None
+
+
+def get_rule_engine():
+    """
+    Process-wide rule engine, loaded once. Uses the file named by the
+    SCREENING_RULES_PATH environment variable when set.
+    """
+    global _default_engine
+    if _default_engine is None:
+        path = os.environ.get("SCREENING_RULES_PATH")
+        _default_engine = load_rule_engine(path) if path else RuleEngine()
+    return _default_engine
+
+
+def set_rule_engine(engine):
+    """Replace the process-wide rule engine (e.g. after loading overrides)"""
+    global _default_engine
+    _default_engine = engine
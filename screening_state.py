@@ -0,0 +1,312 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+
+
+DEFAULT_STATE_PATH = "screening_state.sqlite3"
+
+# Side effects left "pending" by a crashed run are only retried when they are
+# idempotent (status updates) and the claim is older than this many seconds.
+PENDING_LEASE_SECONDS = 15 * 60
+
+
+def _applied_at(value):
+    """Normalize an applied_at value; "N/A" / empty become None"""
+    if not value or value == "N/A":
+        return None
+    return str(value)
+
+
+class Watermark:
+    """
+    Newest point of a job's candidate list that has been fully screened.
+
+    applied_at values are ISO-8601 UTC strings as returned by Hireology,
+    which sort correctly as plain strings. candidate_ids holds the IDs that
+    share exactly that applied_at, so ties are not rescreened.
+    """
+
+    __slots__ = ("applied_at", "candidate_ids")
+
+    def __init__(self, applied_at, candidate_ids=()):
+        self.applied_at = applied_at
+        self.candidate_ids = set(str(c) for c in candidate_ids)
+
+    def is_newer(self, candidate_id, applied_at):
+        """
+        True if the candidate has not been covered by this watermark yet.
+        Without an applied_at only the exact candidate ID can be recognised.
+        """
+        applied_at = _applied_at(applied_at)
+        if applied_at is None:
+            return str(candidate_id) not in self.candidate_ids
+        if applied_at != self.applied_at:
+            return applied_at > self.applied_at
+        return str(candidate_id) not in self.candidate_ids
+
+
+def watermark_action(candidate, watermark):
+    """
+    Decide what to do with a candidate from a date-descending stream:
+    "screen" it, "skip" it (a tie already covered) or "stop" paging.
+    """
+    if watermark is None or watermark.is_newer(candidate.get("id"), candidate.get("applied_at")):
+        return "screen"
+    if _applied_at(candidate.get("applied_at")) == watermark.applied_at:
+        return "skip"  # tie with the watermark, older candidates may still follow
+    return "stop"
+
+
+def iter_new_candidates(candidates, watermark):
+    """
+    Yield candidates from a date-descending candidate stream until the
+    watermark is reached. Stops consuming the stream (and so paging) early.
+    """
+    for candidate in candidates:
+        action = watermark_action(candidate, watermark)
+        if action == "stop":
+            return
+        if action == "screen":
+            yield candidate
+
+
+def _needs_rescreen(result):
+    """Errored and incomplete candidates must be listed again next run"""
+    return bool(result.get("error")) or result.get("outcome") in ("incomplete", "error")
+
+
+def advance_watermark(previous, results):
+    """
+    Compute the watermark after a run from its per-candidate results.
+
+    The watermark only moves past candidates that got a final decision: if a
+    candidate failed or its application was incomplete, it stays below that
+    candidate so it is listed again next run (candidates already decided
+    above it are skipped through the ledger's "screened" entries).
+    """
+    dated = [
+        (_applied_at(r.get("applied_at")), r) for r in results
+    ]
+    failed = [a for a, r in dated if _needs_rescreen(r)]
+    if any(a is None for a in failed):
+        return previous
+
+    ok = [(a, r) for a, r in dated if a is not None and not _needs_rescreen(r)]
+    if failed:
+        oldest_failure = min(failed)
+        ok = [(a, r) for a, r in ok if a < oldest_failure]
+    if not ok:
+        return previous
+
+    newest = max(a for a, _ in ok)
+    if previous is not None and newest < previous.applied_at:
+        return previous
+
+    ids = [r["candidate_id"] for a, r in ok if a == newest]
+    if previous is not None and newest == previous.applied_at:
+        ids.extend(previous.candidate_ids)
+    return Watermark(newest, ids)
+
+
+class ScreeningState:
+    """
+    Durable local state of the screening runs, kept in one SQLite file.
+    Safe to share between threads, and between processes via SQLite locking.
+
+    Besides the watermarks it holds the side-effect ledger: one row per
+    (job_id, candidate_id, action) recording whether an email or status
+    update is pending, succeeded or failed, so reruns never repeat it.
+    """
+
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS watermarks (
+                job_id TEXT PRIMARY KEY,
+                applied_at TEXT NOT NULL,
+                candidate_ids TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS side_effects (
+                job_id TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                action TEXT NOT NULL,
+                candidate_job_id TEXT,
+                detail TEXT,
+                outcome TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (job_id, candidate_id, action)
+            )
+            """
+        )
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def get_watermark(self, job_id):
+        """Return the stored Watermark for a job, or None on the first run"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT applied_at, candidate_ids FROM watermarks WHERE job_id = ?",
+                (str(job_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        return Watermark(row[0], json.loads(row[1]))
+
+    def set_watermark(self, job_id, watermark):
+        if watermark is None:
+            return
+        with self.lock:
+            self.db.execute(
+                """
+                INSERT OR REPLACE INTO watermarks (job_id, applied_at, candidate_ids, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    str(job_id),
+                    watermark.applied_at,
+                    json.dumps(sorted(watermark.candidate_ids)),
+                    time.time()
+                )
+            )
+
+    # ---------------- SIDE-EFFECT LEDGER ----------------
+
+    def claim(self, job_id, candidate_id, action, detail=None, candidate_job_id=None, idempotent=False):
+        """
+        Atomically reserve a side effect before performing it.
+
+        Returns True if the caller should perform it now, False if it already
+        succeeded (with the same detail) or another run holds it. Failed
+        attempts can be claimed again; a pending claim left by a crash is only
+        taken over for idempotent actions, after PENDING_LEASE_SECONDS.
+        """
+        key = (str(job_id), str(candidate_id), action)
+        detail = None if detail is None else str(detail)
+        now = time.time()
+
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.db.execute(
+                    "SELECT outcome, detail, updated_at FROM side_effects "
+                    "WHERE job_id = ? AND candidate_id = ? AND action = ?",
+                    key
+                ).fetchone()
+
+                if row is not None:
+                    outcome, previous_detail, updated_at = row
+                    if outcome == "succeeded" and previous_detail == detail:
+                        self.db.execute("COMMIT")
+                        return False
+                    if outcome == "pending" and not (
+                        idempotent and now - updated_at > PENDING_LEASE_SECONDS
+                    ):
+                        self.db.execute("COMMIT")
+                        return False
+
+                self.db.execute(
+                    """
+                    INSERT OR REPLACE INTO side_effects
+                        (job_id, candidate_id, action, candidate_job_id, detail, outcome, updated_at)
+                    VALUES (?, ?, ?, ?, ?, 'pending', ?)
+                    """,
+                    key + (
+                        None if candidate_job_id is None else str(candidate_job_id),
+                        detail,
+                        now
+                    )
+                )
+                self.db.execute("COMMIT")
+                return True
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+    def record(self, job_id, candidate_id, action, succeeded, detail=None, candidate_job_id=None):
+        """Record the outcome of a side effect (or of a whole candidate)"""
+        with self.lock:
+            self.db.execute(
+                """
+                INSERT OR REPLACE INTO side_effects
+                    (job_id, candidate_id, action, candidate_job_id, detail, outcome, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    str(job_id),
+                    str(candidate_id),
+                    action,
+                    None if candidate_job_id is None else str(candidate_job_id),
+                    None if detail is None else str(detail),
+                    "succeeded" if succeeded else "failed",
+                    time.time()
+                )
+            )
+
+    def has_succeeded(self, job_id, candidate_id, action):
+        """True if the ledger holds a successful entry for the action"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT outcome FROM side_effects "
+                "WHERE job_id = ? AND candidate_id = ? AND action = ?",
+                (str(job_id), str(candidate_id), action)
+            ).fetchone()
+        return row is not None and row[0] == "succeeded"
+
+    def run_once(self, job_id, candidate_id, action, func, detail=None, candidate_job_id=None, idempotent=False):
+        """
+        Perform func() unless the ledger shows it already happened.
+
+        func's truthiness decides success. Returns (performed, value); value is
+        True for an action that had already succeeded, None if another run
+        currently holds it.
+        """
+        if not self.claim(job_id, candidate_id, action, detail, candidate_job_id, idempotent):
+            return False, True if self.has_succeeded(job_id, candidate_id, action) else None
+
+        try:
+            value = func()
+        except Exception:
+            self.record(job_id, candidate_id, action, False, detail, candidate_job_id)
+            raise
+
+        self.record(job_id, candidate_id, action, bool(value), detail, candidate_job_id)
+        return True, value
+
+    async def run_once_async(self, job_id, candidate_id, action, coro_func, detail=None, candidate_job_id=None, idempotent=False):
+        """
+        asyncio version of run_once; coro_func() must return an awaitable.
+        The ledger's SQLite calls (claim may wait on the write lock for up to
+        the busy timeout) run in worker threads, off the event loop.
+        """
+        claimed = await asyncio.to_thread(
+            self.claim, job_id, candidate_id, action, detail, candidate_job_id, idempotent
+        )
+        if not claimed:
+            succeeded = await asyncio.to_thread(self.has_succeeded, job_id, candidate_id, action)
+            return False, True if succeeded else None
+
+        try:
+            value = await coro_func()
+        except Exception:
+            await asyncio.to_thread(
+                self.record, job_id, candidate_id, action, False, detail, candidate_job_id
+            )
+            raise
+
+        await asyncio.to_thread(
+            self.record, job_id, candidate_id, action, bool(value), detail, candidate_job_id
+        )
+        return True, value
@@ -0,0 +1,160 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from metrics import metrics
+
+
+def is_noop_status(current_status, status):
+    """True when the candidate already has the target status"""
+    if current_status is None or current_status == "N/A":
+        return False
+    return str(current_status).strip().casefold() == str(status).strip().casefold()
+
+
+def new_status_outcome(job_id, candidate_id, status):
+    """Return an empty per-candidate status-update outcome dict"""
+    return {
+        "job_id": job_id,
+        "candidate_id": candidate_id,
+        "status": status,
+        "outcome": None,  # updated / unchanged / already_done / held / failed
+        "error": None,
+    }
+
+
+class StatusUpdater:
+    """
+    Status-update stage for the screening pipeline.
+
+    add() only records the wanted status. Pending changes are coalesced per
+    (job, candidate), so a candidate changed several times before a flush
+    gets one PUT with the last status, and changes that match the candidate's
+    current status are skipped without a request. Every batch_size changes
+    the pending set is flushed: its PUTs are pipelined over the client's
+    pooled session by max_workers threads while add() keeps accepting work.
+
+    Hireology documents no bulk status endpoint, so each change is still one
+    PUT; the client's rate limiter and retries apply to each of them.
+
+    With a ledger (ScreeningState) every PUT goes through run_once as the
+    idempotent "status_update" action, as in screen_candidate.
+
+    Outcomes are reported per candidate via the callbacks passed to add()
+    and returned by close().
+    """
+
+    def __init__(self, client, max_workers=8, batch_size=50, ledger=None):
+        self.client = client
+        self.batch_size = batch_size
+        self.ledger = ledger
+        self.outcomes = []
+        self._pending = {}
+        self._futures = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, job_id, candidate_id, status, current_status=None, candidate_job_id=None, callback=None):
+        """
+        Queue a status change. callback(outcome) is called once the change
+        has been applied, skipped or has failed.
+        """
+        key = (str(job_id), str(candidate_id))
+        with self._lock:
+            update = self._pending.get(key)
+            if update is None:
+                update = self._pending[key] = {
+                    "job_id": job_id,
+                    "candidate_id": candidate_id,
+                    "current_status": current_status,
+                    "candidate_job_id": candidate_job_id,
+                    "callbacks": [],
+                }
+            update["status"] = status
+            if update["current_status"] is None:
+                update["current_status"] = current_status
+            if callback is not None:
+                update["callbacks"].append(callback)
+
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def flush(self):
+        """Start the PUTs for every pending change"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        batch, self._pending = self._pending, {}
+        # Grouped per job, so one job's updates go out together
+        for key in sorted(batch):
+            self._futures.add(self._executor.submit(self._apply, batch[key]))
+
+    def _put(self, update):
+        with metrics.span("status_update"):
+            response = self.client.update_candidate_status(
+                update["job_id"], update["candidate_id"], update["status"]
+            )
+        return response is not None
+
+    def _apply(self, update):
+        outcome = new_status_outcome(update["job_id"], update["candidate_id"], update["status"])
+        try:
+            if is_noop_status(update["current_status"], update["status"]):
+                outcome["outcome"] = "unchanged"
+            elif self.ledger is None:
+                outcome["outcome"] = "updated" if self._put(update) else "failed"
+            else:
+                performed, value = self.ledger.run_once(
+                    update["job_id"], update["candidate_id"], "status_update",
+                    lambda: self._put(update),
+                    detail=update["status"],
+                    candidate_job_id=update["candidate_job_id"],
+                    idempotent=True
+                )
+                if performed:
+                    outcome["outcome"] = "updated" if value else "failed"
+                else:
+                    outcome["outcome"] = "already_done" if value else "held"
+        except Exception as e:
+            outcome["outcome"] = "failed"
+            outcome["error"] = str(e)
+
+        metrics.inc("status_updates_total", outcome=outcome["outcome"])
+        with self._lock:
+            self.outcomes.append(outcome)
+        for callback in update["callbacks"]:
+            callback(outcome)
+        return outcome
+
+    def close(self):
+        """Flush, wait for every PUT and return all per-candidate outcomes"""
+        self.flush()
+        while True:
+            with self._lock:
+                futures, self._futures = self._futures, set()
+            if not futures:
+                break
+            wait(futures)
+        self._executor.shutdown()
+        return list(self.outcomes)
+
+
+def update_statuses(client, updates, max_workers=8, ledger=None):
+    """
+    Apply many status changes at once.
+
+    :param updates: iterable of (job_id, candidate_id, status) or
+                    (job_id, candidate_id, status, current_status) tuples
+    :return: list of per-candidate outcome dicts (see new_status_outcome)
+    """
+    updates = list(updates)
+    with StatusUpdater(client, max_workers=max_workers, batch_size=max(len(updates), 1), ledger=ledger) as updater:
+        for update in updates:
+            updater.add(*update)
+    return updater.outcomes
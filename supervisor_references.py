@@ -0,0 +1,153 @@
+import re
+
+from phone_numbers import PHONE_PATTERN, normalize_phone_e164
+
+
+MIN_REFERENCES = 2
+
+# Words that describe a role or workplace rather than a person
+NON_NAME_WORDS = frozenset("""
+    manager supervisor director administrator coordinator lead leader owner
+    boss head charge nurse rn lpn cna hr admin assistant aide caregiver
+    home care health healthcare hospital clinic facility agency center centre
+    senior living assisted services service company inc llc corp
+    at of and from the for with my was is former current previous
+    phone number cell mobile tel telephone contact name reference references
+    supervisors ext
+    call ask or anyone whoever someone please reach text me
+""".split())
+
+HONORIFICS = frozenset({"mr", "mrs", "ms", "miss", "dr", "prof"})
+
+_WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z'\-]*\.?")
+
+REFERENCE_MESSAGE = (
+    "Please provide at least 2 former supervisors with their names and phone numbers. "
+    "Supervisors cannot be co-workers, family members, or friends."
+)
+EMPTY_MESSAGE = (
+    "Please provide at least 2 former supervisors with their names and phone numbers."
+)
+
+
+class SupervisorReference:
+    """One supervisor reference: name as written, raw phone and its E.164 form"""
+
+    __slots__ = ("name", "phone", "e164")
+
+    def __init__(self, name, phone, e164):
+        self.name = name
+        self.phone = phone
+        self.e164 = e164
+
+    def to_dict(self):
+        return {"name": self.name, "phone": self.phone, "e164": self.e164}
+
+    def __repr__(self):
+        return f"SupervisorReference({self.name!r}, {self.phone!r}, {self.e164!r})"
+
+
+class ReferenceCheck:
+    """
+    Parsed supervisor-reference answer.
+
+    references: unique references (deduplicated by E.164 number)
+    missing:    human-readable list of what is missing or invalid
+    """
+
+    __slots__ = ("references", "missing")
+
+    def __init__(self, references, missing):
+        self.references = references
+        self.missing = missing
+
+    @property
+    def is_valid(self):
+        return not self.missing
+
+    @property
+    def message(self):
+        """Message for the incomplete-application email, None when valid"""
+        if self.is_valid:
+            return None
+        if not self.references and self.missing == [EMPTY_MESSAGE]:
+            return EMPTY_MESSAGE
+        return f"{REFERENCE_MESSAGE} ({'; '.join(self.missing)})"
+
+    def to_dict(self):
+        return {
+            "is_valid": self.is_valid,
+            "references": [r.to_dict() for r in self.references],
+            "missing": list(self.missing),
+        }
+
+
+def extract_name(segment):
+    """
+    Person name in a text fragment, ignoring role / workplace words.
+    Names are capitalized words, as people write them; lowercase filler
+    ("call my manager") is never a name.
+    "Manager Home Care" -> None, "Mr. Smith (manager)" -> "Mr. Smith".
+    """
+    tokens = []
+    has_name_word = False
+    for word in _WORD_PATTERN.findall(segment):
+        key = word.rstrip(".").lower()
+        if key in NON_NAME_WORDS or not word[0].isupper():
+            if tokens:
+                break  # the name ended where the role description starts
+            continue
+        tokens.append(word)
+        if key not in HONORIFICS and len(key) > 1:
+            has_name_word = True
+
+    return " ".join(tokens) if has_name_word else None
+
+
+def parse_supervisor_references(answer_text, min_references=MIN_REFERENCES):
+    """
+    Parse a free-text supervisor answer into structured references in one pass.
+
+    Names are read from the text before each phone number ("John Doe
+    555-123-4567, ...") or, when that yields fewer names, from the text after
+    it ("555-123-4567 John Doe, ...").
+    """
+    if not answer_text or answer_text == "N/A":
+        return ReferenceCheck([], [EMPTY_MESSAGE])
+
+    text = str(answer_text)
+    matches = list(PHONE_PATTERN.finditer(text))
+
+    starts = [0] + [m.end() for m in matches]
+    names = [extract_name(text[starts[i]:m.start()]) for i, m in enumerate(matches)]
+
+    if None in names:
+        ends = [m.start() for m in matches[1:]] + [len(text)]
+        names_after = [extract_name(text[m.end():ends[i]]) for i, m in enumerate(matches)]
+        if sum(n is not None for n in names_after) > sum(n is not None for n in names):
+            names = names_after
+
+    references = []
+    missing = []
+    seen = set()
+    for match, name in zip(matches, names):
+        phone = match.group().strip()
+        e164 = normalize_phone_e164(phone)
+        if e164 is None:
+            missing.append(f"invalid phone number {phone}")
+            continue
+        if e164 in seen:
+            missing.append(f"duplicate phone number {phone}")
+            continue
+        seen.add(e164)
+        if name is None:
+            missing.append(f"name missing for {phone}")
+        references.append(SupervisorReference(name, phone, e164))
+
+    complete = sum(1 for r in references if r.name)
+    if complete < min_references:
+        missing.append(
+            f"{min_references - complete} more supervisor(s) with name and phone number needed"
+        )
+
+    return ReferenceCheck(references, missing)
@@ -0,0 +1,42 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_screening import backtest, load_applicant_frame  # noqa: E402
+from fetch_applicants import evaluate_application  # noqa: E402
+from mock_api_server import MockData  # noqa: E402
+from record_export import export_records  # noqa: E402
+
+EXTRA_QUESTION = "Do you speak Spanish?"
+
+
+def job_documents(count=30):
+    """Documents of two jobs; only the second one asks EXTRA_QUESTION"""
+    data = MockData(candidates_per_job=count)
+    for candidate in data.candidates("j2"):
+        candidate["answers"][EXTRA_QUESTION] = "Yes"
+    return [
+        data.documents(job_id, candidate["id"])
+        for job_id in ("j1", "j2")
+        for candidate in data.candidates(job_id)
+    ]
+
+
+def record_outcome(documents):
+    evaluation = evaluate_application(documents)
+    return "incomplete" if evaluation["incomplete_questions"] else evaluation["final_status"]
+
+
+def test_csv_backtest_matches_record_screening(tmp_path):
+    documents = job_documents()
+    records = [evaluate_application(d)["record"] for d in documents]
+    path = str(tmp_path / "records.csv")
+    export_records(records, path)
+
+    frame = load_applicant_frame([path])
+    assert frame[EXTRA_QUESTION].isna().sum() == len(records) // 2
+
+    scored, _ = backtest([path])
+    assert list(scored["outcome"]) == [record_outcome(d) for d in documents]
+    assert list(backtest(records)[0]["outcome"]) == list(scored["outcome"])
@@ -0,0 +1,70 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from call_records import (  # noqa: E402
+    CallRecordExtractor,
+    parse_available_in_days,
+    parse_yes_no_answer,
+    parse_years_experience,
+)
+from screening_rules import DRIVERS_LICENSE_QUESTION  # noqa: E402
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("Yes.", "yes"),
+    ("Yeah. I have my own car.", "yes"),
+    ("I do.", "yes"),
+    ("I can do that.", "yes"),
+    ("Yes. I don't have a car, but my sister drives me.", "yes"),
+    ("No.", "no"),
+    ("I do not have a car.", "no"),
+    ("I have not.", "no"),
+    ("I am not comfortable with that.", "no"),
+    ("I don’t.", "no"),
+    ("I have no license.", "no"),
+    ("What client?", None),
+])
+def test_parse_yes_no_answer(answer, expected):
+    assert parse_yes_no_answer(answer) == expected
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("I have experience of one year.", 1),
+    ("Two.", 2),
+    ("18 months", 1),
+    ("10+ years", 10),
+    ("twenty-five years", 25),
+    ("a couple of years", 2),
+    ("I have a lot of experience.", None),
+])
+def test_parse_years_experience(answer, expected):
+    assert parse_years_experience(answer) == expected
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("I can available after one month.", 30),
+    ("In two weeks.", 14),
+    ("Immediately.", 0),
+    ("Next week.", 7),
+    ("Tomorrow.", 1),
+    ("Whenever you need.", None),
+])
+def test_parse_available_in_days(answer, expected):
+    assert parse_available_in_days(answer) == expected
+
+
+def test_negated_answer_fails_the_license_question():
+    call = {
+        "id": "call-1",
+        "fromNumber": "+18435550101",
+        "transcript": (
+            "bot:Do you have a valid driver's license?\n"
+            "human:I do not have a license right now."
+        ),
+    }
+    record = CallRecordExtractor().extract(call)
+    assert record[DRIVERS_LICENSE_QUESTION] == "no"
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from email_outbox import EmailOutbox, OutboxDispatcher  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class FakeClient:
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = 0
+
+    def send_email(self, *args):
+        self.calls += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return FakeResponse(self.outcome)
+
+
+def deliver_once(tmp_path, outcome):
+    outbox = EmailOutbox(str(tmp_path / "outbox.sqlite3"))
+    message_id = outbox.enqueue(
+        "rejection", job_id="j1", candidate_job_id="7", email_to="a@example.com",
+        candidate_id="1", job_name="Caregiver", rejection_reason="No experience"
+    )
+    OutboxDispatcher(FakeClient(outcome), outbox).drain()
+    return outbox.get(message_id)["status"], outbox
+
+
+def connection_refused():
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+def test_sent(tmp_path):
+    status, outbox = deliver_once(tmp_path, 200)
+    assert status == "sent"
+    assert outbox.dead_letters() == []
+
+
+def test_refused_connection_is_retried(tmp_path):
+    assert deliver_once(tmp_path, connection_refused())[0] == "queued"
+
+
+def test_throttled_send_is_retried(tmp_path):
+    assert deliver_once(tmp_path, 429)[0] == "queued"
+
+
+def test_possibly_sent_attempts_are_not_retried(tmp_path):
+    status, outbox = deliver_once(tmp_path, requests.exceptions.ReadTimeout("read timed out"))
+    assert status == "unknown"
+    assert [m["status"] for m in outbox.dead_letters()] == ["unknown"]
+
+
+def test_server_errors_are_not_retried(tmp_path):
+    assert deliver_once(tmp_path, 502)[0] == "unknown"
+
+
+def test_rejected_request_fails(tmp_path):
+    assert deliver_once(tmp_path, 422)[0] == "failed"
@@ -0,0 +1,37 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetch_calls import VoiceAIExtractor  # noqa: E402
+
+
+class CountingExtractor(VoiceAIExtractor):
+    """Serves 100 fake calls per window and counts the windows fetched"""
+
+    def __init__(self):
+        super().__init__("key", "location", limiter=None)
+        self.windows_fetched = 0
+        self.lock = threading.Lock()
+
+    def iter_call_logs(self, agent_id, start_date, end_date, page_size, prefetch=True):
+        with self.lock:
+            self.windows_fetched += 1
+        for i in range(100):
+            yield {"id": f"{start_date}-{i}"}
+
+
+def test_stopping_early_does_not_fetch_queued_windows():
+    extractor = CountingExtractor()
+    calls = extractor.harvest_call_logs("2025-01-01", "2025-12-31", window_days=7, max_workers=2)
+    assert next(calls)["id"]
+    calls.close()
+    assert extractor.windows_fetched <= 2
+
+
+def test_harvest_yields_every_window():
+    extractor = CountingExtractor()
+    calls = list(extractor.harvest_call_logs("2025-01-01", "2025-01-28", window_days=7, max_workers=2))
+    assert len(calls) == 4 * 100
+    assert extractor.windows_fetched == 4
@@ -0,0 +1,19 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interview_questions import InterviewQuestionIndex, tokenize  # noqa: E402
+
+
+def test_contractions_are_stopwords():
+    assert tokenize("What's your availability?") == ["availability"]
+    assert tokenize("Tasks you’ve done before") == ["task", "done"]
+
+
+def test_rewording_matches_canonical_question():
+    question_id, score = InterviewQuestionIndex().match(
+        "Do you currently have another job? And what’s your general availability?"
+    )
+    assert question_id == "availability"
+    assert score == 1.0
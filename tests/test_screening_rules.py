@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screening_rules import (  # noqa: E402
+    CAREGIVER_KEYWORD_PATTERN,
+    compile_keyword_pattern,
+    load_rule_engine,
+)
+
+
+def keywords(text):
+    return [m.group("keyword").lower() for m in CAREGIVER_KEYWORD_PATTERN.finditer(text)]
+
+
+def test_hyphenated_phrases_match():
+    assert keywords("Provided in-home care for seniors") == ["home care"]
+    assert keywords("Worked as a nursing-home aide") == ["nursing"]
+
+
+def test_keywords_match_whole_words_only():
+    assert keywords("I like to learn new things") == []
+
+
+def test_longest_shared_prefix_keyword_wins():
+    pattern = compile_keyword_pattern(["nurse", "nursing", "nurse aide", "nursing home"])
+    text = "Nurse aides and nurses at a nursing home, plus nursing"
+    assert [m.group("keyword") for m in pattern.finditer(text)] == [
+        "Nurse aide", "nurse", "nursing home", "nursing",
+    ]
+
+
+def test_broken_job_override_fails_at_load(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"jobs": {"2606114": {"min_experience": {"value": "two"}}}}))
+    with pytest.raises(ValueError, match="job 2606114"):
+        load_rule_engine(str(path))
+
+
+def test_job_override_applies_only_to_its_job(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"jobs": {"2606114": {"drug_screen": {"enabled": False}}}}))
+    engine = load_rule_engine(str(path))
+    assert "drug_screen" not in [r["name"] for r in engine.for_job("2606114").rules]
+    assert "drug_screen" in [r["name"] for r in engine.for_job("1").rules]
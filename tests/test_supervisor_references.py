@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from supervisor_references import parse_supervisor_references  # noqa: E402
+
+
+def test_two_named_supervisors_are_valid():
+    check = parse_supervisor_references("John Doe 843-555-0101, Jane Roe 843-555-0102")
+    assert check.is_valid
+    assert [r.name for r in check.references] == ["John Doe", "Jane Roe"]
+
+
+def test_names_after_the_numbers_are_valid():
+    assert parse_supervisor_references("843-555-0101 John Doe, 843-555-0102 Jane Roe").is_valid
+
+
+def test_lowercase_filler_is_not_a_name():
+    check = parse_supervisor_references("call my manager 555-123-4567 or my supervisor 555-987-6543")
+    assert not check.is_valid
+    assert all(r.name is None for r in check.references)
+
+
+def test_anyone_whoever_is_not_a_name():
+    check = parse_supervisor_references("Ask for anyone 555-123-4567 or whoever answers 555-987-6543")
+    assert not check.is_valid
+
+
+def test_missing_answer_is_invalid():
+    assert not parse_supervisor_references("N/A").is_valid
+
+
+def test_number_followed_by_digits_is_valid():
+    check = parse_supervisor_references("John Doe 555-123-4567 5 yrs, Jane Roe 555-987-6543 2 yrs")
+    assert check.is_valid
+    assert [r.e164 for r in check.references] == ["+15551234567", "+15559876543"]
@@ -0,0 +1,54 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcripts import segment_transcript  # noqa: E402
+
+
+def test_question_marks_and_announcements():
+    transcript = (
+        "bot:Ready to begin?\n"
+        "human:Yes.\n"
+        "bot:Got it.Next question: Do you have a valid driver's license?\n"
+        "human:I do."
+    )
+    assert segment_transcript(transcript) == [
+        {"question": "Ready to begin?", "answer": "Yes."},
+        {"question": "Do you have a valid driver's license?", "answer": "I do."},
+    ]
+
+
+def test_prompt_without_question_mark():
+    transcript = "bot:Tell me about yourself.\nhuman:I have been a caregiver for five years."
+    assert segment_transcript(transcript) == [
+        {"question": "Tell me about yourself.", "answer": "I have been a caregiver for five years."},
+    ]
+
+
+def test_question_without_punctuation():
+    transcript = (
+        "bot:Where do you live\n"
+        "human:Springfield.\n"
+        "bot:Thanks. Do you have reliable transportation?\n"
+        "human:Yes, my own car."
+    )
+    assert segment_transcript(transcript) == [
+        {"question": "Where do you live", "answer": "Springfield."},
+        {"question": "Do you have reliable transportation?", "answer": "Yes, my own car."},
+    ]
+
+
+def test_cut_off_bot_line_continues_the_answer():
+    transcript = (
+        "bot:Do you have experience with bathing clients?\n"
+        "human:Yes.\n"
+        "bot:Alright, so you \n"
+        "human:one year.\n"
+        "bot:have one year of experience.Next question: Are you available on weekends?\n"
+        "human:Yes."
+    )
+    assert segment_transcript(transcript) == [
+        {"question": "Do you have experience with bathing clients?", "answer": "Yes. one year."},
+        {"question": "Are you available on weekends?", "answer": "Yes."},
+    ]
@@ -0,0 +1,131 @@
+import re
+
+
+# "bot:" / "human:" at the start of a transcript line switches the speaker;
+# lines without a prefix continue the previous speaker's turn.
+SPEAKERS = {"bot": "bot", "human": "human"}
+
+# The agent announces most questions: "...CNA.Next question: Do you ...",
+# "Let's move on to the next question.", "Next, do you have ..."
+QUESTION_MARKER = re.compile(r"\bnext(?:\s+question)?\s*[:,.]\s*", re.IGNORECASE)
+
+# End of a sentence inside a bot line: ". ", "! ", ".\n" (but not "?")
+_SENTENCE_END = re.compile(r"[.!]\s+")
+
+_TERMINAL = (".", "?", "!")
+
+# First words of a question asked without a "?" ("Where do you live")
+QUESTION_WORDS = frozenset(
+    "what where when why who which how do does did are is was were can could would will "
+    "have has tell describe please".split()
+)
+
+
+def _interrogative_start(text):
+    """Index where the sentence holding the first "?" of text starts, or -1"""
+    mark = text.find("?")
+    if mark == -1:
+        return -1
+    start = 0
+    for match in _SENTENCE_END.finditer(text, 0, mark):
+        start = match.end()
+    return start
+
+
+def _asks(text):
+    """Whether a bot line without "?" still opens a question"""
+    words = text.split(None, 1)
+    return text.endswith(_TERMINAL) or words[0].strip(",").lower() in QUESTION_WORDS
+
+
+def _join(parts):
+    text = " ".join(" ".join(parts).split())
+    return text[:1].upper() + text[1:]
+
+
+def segment_transcript(transcript):
+    """
+    Split a Voice AI transcript into question / answer turns in one pass.
+
+    The agent's lines are read as one speech stream: a bot line that stops
+    mid-sentence ("bot:Alright, so you ") is continued by its next bot line,
+    and the candidate's lines spoken meanwhile stay with the question being
+    answered. A new question starts at an announcement ("Next question:",
+    "Next, ...") or, without one, at the sentence holding a "?"; only that
+    question text is kept, not the acknowledgement before it. Any other
+    complete bot line, or one starting like a question ("Where do you
+    live"), is a question as a whole; only a bot line cut off mid-sentence
+    ("Alright, so you ") is not a turn of its own.
+
+    Returns [{'question': ..., 'answer': ...}, ...] for every answered
+    question, in call order.
+    """
+    qa_pairs = []
+    question = None         # parts of the current question
+    answer = None           # parts of its answer, None when not collecting
+    question_open = False   # the agent is still speaking the question
+    sentence = []           # bot text since the last sentence end (for "?")
+    speaker = None
+
+    def close():
+        if question and answer:
+            qa_pairs.append({"question": _join(question), "answer": _join(answer)})
+
+    for line in transcript.split("\n"):
+        name, colon, text = line.partition(":")
+        if colon and name in SPEAKERS:
+            speaker = SPEAKERS[name]
+        else:
+            text = line
+        text = text.strip()
+        if not text or speaker is None:
+            continue
+
+        if speaker == "human":
+            if answer is not None:
+                answer.append(text)
+            continue
+
+        complete = text.endswith(_TERMINAL)
+        marker = None
+        for marker in QUESTION_MARKER.finditer(text):
+            pass
+
+        if marker is not None:
+            close()
+            question, answer = [text[marker.end():]], []
+            # "Next question:" alone: the question follows on the next line
+            question_open = not complete or marker.end() == len(text)
+            sentence = []
+        elif question_open:
+            # "...to become a" / "Alright, no worries! What motivated you...?"
+            # restarts the question: keep only the new sentence
+            start = _interrogative_start(text)
+            if start > 0:
+                question = [text[start:]]
+            else:
+                question.append(text)
+            question_open = not complete
+        else:
+            start = _interrogative_start(text)
+            if start != -1:
+                close()
+                question = (sentence if start == 0 else []) + [text[start:]]
+                answer = []
+                question_open = not complete
+            elif _asks(text):
+                # Every other bot turn is a question too: "Tell me about
+                # yourself." / "Where do you live"
+                close()
+                question, answer = [text], []
+
+        if question_open or complete:
+            sentence = []
+        else:
+            tail = 0
+            for match in _SENTENCE_END.finditer(text):
+                tail = match.end()
+            sentence = (sentence if tail == 0 else []) + [text[tail:]]
+
+    close()
+    return qa_pairs